@@ -0,0 +1,185 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from core.database import SQLITE_TUNED_PRAGMAS, apply_sqlite_pragmas
+
+
+SCHEMA = """
+CREATE TABLE pending_order (uid TEXT PRIMARY KEY, chef TEXT NOT NULL, quantity INTEGER, food_price REAL, order_time REAL);
+CREATE INDEX pending_order_chef ON pending_order (chef, order_time);
+CREATE TABLE order_history (uid TEXT PRIMARY KEY, order_id TEXT, quantity INTEGER, food_price REAL, order_time REAL);
+CREATE TABLE chef (chef_key TEXT PRIMARY KEY, total_orders_received INTEGER NOT NULL DEFAULT 0);
+"""
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare SQLite read/write concurrency with default settings and with SQLITE_PRAGMAS tuning "
+        "(WAL, synchronous=NORMAL, busy_timeout, mmap_size, cache_size)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=8, help="Concurrent chef queue readers.")
+        parser.add_argument("--writers", type=int, default=2, help="Concurrent order completers.")
+        parser.add_argument("--seconds", type=float, default=5.0, help="Duration of each run.")
+        parser.add_argument("--orders", type=int, default=20000, help="Pending orders seeded per run.")
+        parser.add_argument("--chefs", type=int, default=50)
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        report = {
+            "workload": {key: options[key] for key in ("readers", "writers", "seconds", "orders", "chefs")},
+            "runs": [
+                self._run("default", {}, options),
+                self._run("tuned", SQLITE_TUNED_PRAGMAS, options),
+            ],
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        header = f"{'mode':<8} {'reads/s':>9} {'writes/s':>9} {'read p50 ms':>12} {'read p99 ms':>12} {'read max ms':>12} {'errors':>7}"
+        self.stdout.write(header)
+        for run in report["runs"]:
+            self.stdout.write(
+                f"{run['mode']:<8} {run['reads_per_second']:>9.0f} {run['writes_per_second']:>9.0f} "
+                f"{run['read_latency_ms']['p50']:>12.2f} {run['read_latency_ms']['p99']:>12.2f} "
+                f"{run['read_latency_ms']['max']:>12.2f} {run['errors']:>7}"
+            )
+
+    def _connect(self, path, pragmas):
+        # Same 5s lock timeout Django gets from the sqlite3 driver default.
+        conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        apply_sqlite_pragmas(conn, pragmas)
+        return conn
+
+    def _seed(self, path, pragmas, options):
+        conn = self._connect(path, pragmas)
+        conn.executescript(SCHEMA)
+        chefs = [f"chef_{idx}" for idx in range(options["chefs"])]
+        now = time.time()
+        with conn:
+            conn.executemany("INSERT INTO chef (chef_key) VALUES (?)", [(chef,) for chef in chefs])
+            conn.executemany(
+                "INSERT INTO pending_order VALUES (?, ?, ?, ?, ?)",
+                [
+                    (uuid.uuid4().hex, chefs[idx % len(chefs)], 1 + idx % 3, 9.5, now - idx)
+                    for idx in range(options["orders"])
+                ],
+            )
+        conn.close()
+        return chefs
+
+    def _run(self, mode, pragmas, options):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.sqlite3")
+            chefs = self._seed(path, pragmas, options)
+            stop = threading.Event()
+            lock = threading.Lock()
+            read_latencies = []
+            counters = {"reads": 0, "writes": 0, "errors": 0}
+
+            def reader(worker):
+                conn = self._connect(path, pragmas)
+                idx = worker
+                local = []
+                try:
+                    while not stop.is_set():
+                        chef = chefs[idx % len(chefs)]
+                        idx += 1
+                        started = time.perf_counter()
+                        try:
+                            conn.execute(
+                                "SELECT uid, quantity, food_price FROM pending_order "
+                                "WHERE chef = ? ORDER BY order_time DESC LIMIT 50",
+                                (chef,),
+                            ).fetchall()
+                        except sqlite3.OperationalError:
+                            with lock:
+                                counters["errors"] += 1
+                            continue
+                        local.append(time.perf_counter() - started)
+                finally:
+                    conn.close()
+                    with lock:
+                        read_latencies.extend(local)
+                        counters["reads"] += len(local)
+
+            def writer(worker):
+                # Mirrors CampaignOrdersPendingAction: copy to history, bump the chef, delete pending.
+                conn = self._connect(path, pragmas)
+                idx = worker
+                writes = 0
+                try:
+                    while not stop.is_set():
+                        chef = chefs[idx % len(chefs)]
+                        idx += 1
+                        try:
+                            with conn:
+                                row = conn.execute(
+                                    "SELECT uid, quantity, food_price, order_time FROM pending_order "
+                                    "WHERE chef = ? LIMIT 1",
+                                    (chef,),
+                                ).fetchone()
+                                if row is None:
+                                    continue
+                                conn.execute(
+                                    "INSERT INTO order_history VALUES (?, ?, ?, ?, ?)",
+                                    (uuid.uuid4().hex, row[0], row[1], row[2], row[3]),
+                                )
+                                conn.execute(
+                                    "UPDATE chef SET total_orders_received = total_orders_received + ? "
+                                    "WHERE chef_key = ?",
+                                    (row[1], chef),
+                                )
+                                conn.execute("DELETE FROM pending_order WHERE uid = ?", (row[0],))
+                            writes += 1
+                        except sqlite3.OperationalError:
+                            with lock:
+                                counters["errors"] += 1
+                finally:
+                    conn.close()
+                    with lock:
+                        counters["writes"] += writes
+
+            threads = [threading.Thread(target=reader, args=(idx,)) for idx in range(options["readers"])]
+            threads += [threading.Thread(target=writer, args=(idx,)) for idx in range(options["writers"])]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            time.sleep(options["seconds"])
+            stop.set()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - started
+
+        return {
+            "mode": mode,
+            "pragmas": pragmas,
+            "elapsed_seconds": round(elapsed, 3),
+            "reads": counters["reads"],
+            "writes": counters["writes"],
+            "errors": counters["errors"],
+            "reads_per_second": round(counters["reads"] / elapsed, 1),
+            "writes_per_second": round(counters["writes"] / elapsed, 1),
+            "read_latency_ms": {
+                "p50": round(_percentile(read_latencies, 0.50) * 1000, 3),
+                "p99": round(_percentile(read_latencies, 0.99) * 1000, 3),
+                "max": round(max(read_latencies, default=0.0) * 1000, 3),
+            },
+        }
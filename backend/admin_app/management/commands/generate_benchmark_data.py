@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from admin_app.models import Pending_transaction, Profile, Transaction_history
+from admin_app.services.dashboard_reporting import reset_dashboard_cache
+from core.models import normalize_username
+from home_app.services.home_feed import invalidate_home_feed
+from user_app.models import Campaign, Chef, Food, Order, Order_history, Order_line
+from user_app.services.order_lines import build_order_lines
+from user_app.services.sales_rollups import rebuild_chef_daily_sales
+from user_app.services.spend_rollups import rebuild_user_spend
+
+
+BENCH_PASSWORD = "BenchPass123!"
+
+
+@contextmanager
+def _explicit_timestamps(*fields):
+    """Let ``bulk_create`` keep the back-dated values we assign to ``auto_now_add`` fields."""
+    saved = [(field, field.auto_now_add) for field in fields]
+    for field, _value in saved:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, value in saved:
+            field.auto_now_add = value
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large synthetic dataset for benchmarks with bulk inserts. Signals are bypassed, "
+        "so order lines and rollups are written directly. Point DATABASE_URL at a scratch database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--chefs", type=int, default=20)
+        parser.add_argument("--orders", type=int, default=20000)
+        parser.add_argument("--transactions", type=int, default=2000)
+        parser.add_argument("--days", type=int, default=365, help="Spread orders over this many past days.")
+        parser.add_argument("--foods-per-chef", type=int, default=8)
+        parser.add_argument("--campaigns-per-chef", type=int, default=6)
+        parser.add_argument(
+            "--completed-ratio",
+            type=float,
+            default=0.85,
+            help="Share of orders written as Order_history instead of pending Order rows.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=7)
+        parser.add_argument("--prefix", default="bench", help="Username prefix for generated accounts.")
+
+    def handle(self, *args, **options):
+        prefix = normalize_username(options["prefix"]) or "bench"
+        if User.objects.filter(username__startswith=f"{prefix}_").exists():
+            raise CommandError(
+                f"Accounts with prefix '{prefix}_' already exist. Use a fresh database or another --prefix."
+            )
+
+        self.rng = random.Random(options["seed"])
+        self.batch_size = max(int(options["batch_size"]), 100)
+        self.now = timezone.now()
+        started = time.perf_counter()
+        timings = {}
+
+        def step(name, func, *func_args):
+            step_started = time.perf_counter()
+            result = func(*func_args)
+            timings[name] = round(time.perf_counter() - step_started, 2)
+            self.stdout.write(f"{name}: {timings[name]}s")
+            return result
+
+        password = make_password(BENCH_PASSWORD)
+        step("accounts", self._create_accounts, prefix, options["users"], options["chefs"], password)
+        chef_names = [f"{prefix}_chef_{idx:05d}" for idx in range(options["chefs"])]
+        user_names = [f"{prefix}_user_{idx:06d}" for idx in range(options["users"])]
+        foods_by_chef = step("foods", self._create_foods, chef_names, options["foods_per_chef"])
+        step("campaigns", self._create_campaigns, foods_by_chef, options["campaigns_per_chef"], options["days"])
+        counts = step(
+            "orders",
+            self._create_orders,
+            user_names,
+            foods_by_chef,
+            options["orders"],
+            options["days"],
+            options["completed_ratio"],
+        )
+        step("transactions", self._create_transactions, chef_names, options["transactions"], options["days"])
+        step("chef_daily_sales", rebuild_chef_daily_sales)
+        step("user_spend", rebuild_user_spend)
+        reset_dashboard_cache()
+        invalidate_home_feed()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {options['users']} users, {options['chefs']} chefs, {counts['orders']} pending orders, "
+                f"{counts['history']} completed orders and {counts['lines']} order lines "
+                f"in {time.perf_counter() - started:.1f}s. Accounts use the password {BENCH_PASSWORD!r}."
+            )
+        )
+
+    def _bulk_accounts(self, usernames, role, password):
+        for offset in range(0, len(usernames), self.batch_size):
+            with transaction.atomic():
+                users = User.objects.bulk_create(
+                    [
+                        User(username=username, email=f"{username}@bench.local", password=password, date_joined=self.now)
+                        for username in usernames[offset : offset + self.batch_size]
+                    ]
+                )
+                # bulk_create skips the post_save hook that normally creates the profile.
+                Profile.objects.bulk_create([Profile(user=user, role=role) for user in users])
+
+    def _create_accounts(self, prefix, user_count, chef_count, password):
+        self._bulk_accounts([f"{prefix}_admin"], "admin", password)
+        chef_names = [f"{prefix}_chef_{idx:05d}" for idx in range(chef_count)]
+        self._bulk_accounts(chef_names, "chef", password)
+        self._bulk_accounts([f"{prefix}_user_{idx:06d}" for idx in range(user_count)], "user", password)
+        Chef.objects.bulk_create(
+            [
+                Chef(
+                    chef_username=name,
+                    chef_key=normalize_username(name),
+                    subscription_status="Active",
+                    subscription_ends=self.now + timedelta(days=30),
+                )
+                for name in chef_names
+            ],
+            batch_size=self.batch_size,
+        )
+
+    def _create_foods(self, chef_names, per_chef):
+        foods = [
+            Food(
+                chef=chef,
+                chef_key=normalize_username(chef),
+                food_name=f"Dish {idx + 1} by {chef}",
+                food_price=round(self.rng.uniform(2.0, 18.0), 2),
+            )
+            for chef in chef_names
+            for idx in range(per_chef)
+        ]
+        Food.objects.bulk_create(foods, batch_size=self.batch_size)
+        foods_by_chef = {}
+        for food in foods:
+            foods_by_chef.setdefault(food.chef, []).append(food)
+        return foods_by_chef
+
+    def _create_campaigns(self, foods_by_chef, per_chef, days):
+        campaigns = []
+        for chef, foods in foods_by_chef.items():
+            for idx in range(per_chef):
+                picked = self.rng.sample(foods, k=min(3, len(foods)))
+                stock = {str(food.uid): self.rng.randint(10, 60) for food in picked}
+                if idx == 0:
+                    # One running campaign per chef feeds available/ and the home feed.
+                    start_at, end_at, status_value = self.now - timedelta(hours=2), self.now + timedelta(days=1), "running"
+                else:
+                    start_at = self.now - timedelta(days=self.rng.randint(1, max(days, 1)), hours=self.rng.randint(0, 12))
+                    end_at, status_value = start_at + timedelta(hours=6), "completed"
+                campaigns.append(
+                    Campaign(
+                        chef=chef,
+                        chef_key=normalize_username(chef),
+                        status=status_value,
+                        title=f"Campaign {idx + 1} by {chef}",
+                        food_items=stock,
+                        start_time=start_at,
+                        end_time=end_at,
+                        delivery_time=end_at + timedelta(hours=1),
+                        quantity_available=sum(stock.values()),
+                        total_orders=self.rng.randint(0, 200),
+                    )
+                )
+        Campaign.objects.bulk_create(campaigns, batch_size=self.batch_size)
+
+    def _create_orders(self, user_names, foods_by_chef, order_count, days, completed_ratio):
+        catalogue = {
+            str(food.uid): (food.chef, float(food.food_price))
+            for foods in foods_by_chef.values()
+            for food in foods
+        }
+        chefs = list(foods_by_chef)
+        span_seconds = max(days, 1) * 86400
+        counts = {"orders": 0, "history": 0, "lines": 0}
+
+        order_time_fields = (Order._meta.get_field("order_time"), Order_history._meta.get_field("order_time"))
+        with _explicit_timestamps(*order_time_fields):
+            for offset in range(0, order_count, self.batch_size):
+                orders, histories, lines = [], [], []
+                for _idx in range(min(self.batch_size, order_count - offset)):
+                    picked = self.rng.sample(foods_by_chef[self.rng.choice(chefs)], k=self.rng.randint(1, 3))
+                    food_items = {str(food.uid): self.rng.randint(1, 3) for food in picked}
+                    fields = {
+                        "user": self.rng.choice(user_names),
+                        "quantity": sum(food_items.values()),
+                        "food_items": food_items,
+                        "food_price": round(sum(food.food_price * food_items[str(food.uid)] for food in picked), 2),
+                        "order_time": self.now - timedelta(seconds=self.rng.randint(0, span_seconds)),
+                    }
+                    if self.rng.random() < completed_ratio:
+                        row = Order_history(order_id=str(uuid.uuid4()), **fields)
+                        histories.append(row)
+                        lines.extend(build_order_lines(row, order_history=row, catalogue=catalogue))
+                    else:
+                        row = Order(user_address="Bench Hall", user_phone="0100000000", **fields)
+                        orders.append(row)
+                        lines.extend(build_order_lines(row, order=row, catalogue=catalogue))
+
+                with transaction.atomic():
+                    Order.objects.bulk_create(orders)
+                    Order_history.objects.bulk_create(histories)
+                    Order_line.objects.bulk_create(lines, batch_size=self.batch_size)
+                counts["orders"] += len(orders)
+                counts["history"] += len(histories)
+                counts["lines"] += len(lines)
+        return counts
+
+    def _create_transactions(self, chef_names, count, days):
+        span_seconds = max(days, 1) * 86400
+        pending, completed = [], []
+        for _idx in range(count):
+            chef = self.rng.choice(chef_names)
+            fields = {
+                "chef": chef,
+                "chef_key": normalize_username(chef),
+                "type": "recharge",
+                "transaction_proof": "transaction_proofs/bench-proof.png",
+                "amount": round(self.rng.uniform(20.0, 500.0), 2),
+                "transaction_time": self.now - timedelta(seconds=self.rng.randint(0, span_seconds)),
+            }
+            if self.rng.random() < 0.2:
+                pending.append(Pending_transaction(status="pending", **fields))
+            else:
+                completed.append(Transaction_history(status="completed", transaction_id=str(uuid.uuid4()), **fields))
+
+        time_fields = (
+            Pending_transaction._meta.get_field("transaction_time"),
+            Transaction_history._meta.get_field("transaction_time"),
+        )
+        with _explicit_timestamps(*time_fields):
+            Pending_transaction.objects.bulk_create(pending, batch_size=self.batch_size)
+            Transaction_history.objects.bulk_create(completed, batch_size=self.batch_size)
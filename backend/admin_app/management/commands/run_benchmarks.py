@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from admin_app.models import Pending_transaction, Profile, Transaction_history
+from core.tokens import tokens_for_user
+from user_app.models import (
+    Campaign,
+    Chef_daily_sales,
+    Food,
+    Order,
+    Order_history,
+    Order_line,
+    User_spend_total,
+)
+
+
+# Kept in a stable order so reports from different releases diff line by line.
+BENCHMARK_ENDPOINTS = [
+    ("available", "user", "/available/"),
+    ("home", "user", "/"),
+    ("user_dashboard", "user", "/user_dashboard/?range=30d"),
+    ("chef_dashboard", "chef", "/chef_dashboard/?range=30d"),
+    ("campaign_orders_pending", "chef", "/campaign_orders/pending/"),
+    ("admin_dashboard", "admin", "/admin/admin_dashboard/?range=30d"),
+    ("admin_dashboard_export_csv", "admin", "/admin/admin_dashboard/export/?range=30d"),
+    ("orders_ledger_export", "admin", "/admin/admin_dashboard/export/?dataset=orders&range=30d"),
+]
+
+COUNTED_MODELS = [
+    User,
+    Food,
+    Campaign,
+    Order,
+    Order_history,
+    Order_line,
+    Chef_daily_sales,
+    User_spend_total,
+    Pending_transaction,
+    Transaction_history,
+]
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def _response_bytes(response):
+    if getattr(response, "streaming", False):
+        return sum(len(chunk) for chunk in response.streaming_content)
+    return len(response.content)
+
+
+def _query_ms(captured):
+    return round(sum(float(query.get("time") or 0.0) for query in captured) * 1000, 2)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the hot endpoints against the current database and print a JSON report. "
+        "Run generate_benchmark_data first; compare releases with --baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=5, help="Warm runs per endpoint after the cold run.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument("--baseline", help="Earlier report to compare against; deltas go to stderr.")
+        parser.add_argument("--only", nargs="*", help="Benchmark only these endpoint names.")
+        parser.add_argument("--user", help="Username for the buyer endpoints (default: the busiest buyer).")
+        parser.add_argument("--chef", help="Username for the chef endpoints (default: the busiest chef).")
+        parser.add_argument("--admin", help="Username for the admin endpoints (default: the first admin).")
+
+    def handle(self, *args, **options):
+        iterations = max(int(options["iterations"]), 1)
+        endpoints = BENCHMARK_ENDPOINTS
+        if options["only"]:
+            known = {name for name, _role, _path in BENCHMARK_ENDPOINTS}
+            unknown = sorted(set(options["only"]) - known)
+            if unknown:
+                raise CommandError(f"Unknown endpoints: {', '.join(unknown)}. Choose from {', '.join(sorted(known))}.")
+            endpoints = [endpoint for endpoint in BENCHMARK_ENDPOINTS if endpoint[0] in options["only"]]
+
+        principals = self._principals(options)
+        clients = {}
+        for role, user in principals.items():
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens_for_user(user).access_token}")
+            clients[role] = client
+
+        results = {}
+        for name, role, path in endpoints:
+            results[name] = self._run(clients[role], path, iterations)
+            self.stderr.write(
+                f"{name}: cold {results[name]['cold_ms']}ms, median {results[name]['median_ms']}ms, "
+                f"{results[name]['queries']} queries"
+            )
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "iterations": iterations,
+            "principals": {role: user.username for role, user in principals.items()},
+            "settings": {
+                "cache_backend": settings.CACHES["default"]["BACKEND"],
+                "chef_sales_source": getattr(settings, "CHEF_SALES_SOURCE", None),
+            },
+            "rows": {model._meta.label: model.objects.count() for model in COUNTED_MODELS},
+            "endpoints": results,
+        }
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                handle.write(rendered + "\n")
+            self.stderr.write(f"Report written to {options['output']}")
+        else:
+            self.stdout.write(rendered)
+
+        if options["baseline"]:
+            self._compare(options["baseline"], results)
+
+    def _principals(self, options):
+        def pick(override, role, fallback):
+            if override:
+                user = User.objects.filter(username=override).first()
+                if user is None:
+                    raise CommandError(f"User '{override}' does not exist.")
+                return user
+            user = fallback()
+            if user is None:
+                raise CommandError(f"No {role} to benchmark as. Run generate_benchmark_data first or pass --{role}.")
+            return user
+
+        def busiest_user():
+            row = User_spend_total.objects.order_by("-orders").values_list("user", flat=True).first()
+            return User.objects.filter(username=row).first() if row else None
+
+        def busiest_chef():
+            top = (
+                Chef_daily_sales.objects.values("chef")
+                .annotate(total=Sum("orders"))
+                .order_by("-total")
+                .values_list("chef", flat=True)
+                .first()
+            )
+            if top:
+                user = User.objects.filter(username__iexact=top, profile__role="chef").first()
+                if user:
+                    return user
+            return User.objects.filter(profile__role="chef").order_by("username").first()
+
+        def first_admin():
+            profile = Profile.objects.filter(role="admin").select_related("user").order_by("created_at").first()
+            return profile.user if profile else None
+
+        return {
+            "user": pick(options["user"], "user", busiest_user),
+            "chef": pick(options["chef"], "chef", busiest_chef),
+            "admin": pick(options["admin"], "admin", first_admin),
+        }
+
+    def _request(self, client, path):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(path)
+            size = _response_bytes(response)
+            elapsed = (time.perf_counter() - started) * 1000
+        return response.status_code, size, elapsed, captured.captured_queries
+
+    def _run(self, client, path, iterations):
+        cache.clear()
+        status, size, cold_ms, cold_queries = self._request(client, path)
+
+        timings, query_counts, query_ms = [], [], []
+        for _idx in range(iterations):
+            warm_status, size, elapsed, captured = self._request(client, path)
+            status = max(status, warm_status)
+            timings.append(elapsed)
+            query_counts.append(len(captured))
+            query_ms.append(_query_ms(captured))
+
+        return {
+            "path": path,
+            "status": status,
+            "bytes": size,
+            "cold_ms": round(cold_ms, 2),
+            "cold_queries": len(cold_queries),
+            "cold_query_ms": _query_ms(cold_queries),
+            "min_ms": round(min(timings), 2),
+            "median_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(_percentile(timings, 0.95), 2),
+            "max_ms": round(max(timings), 2),
+            "queries": max(query_counts),
+            "query_ms": round(statistics.median(query_ms), 2),
+        }
+
+    def _compare(self, baseline_path, results):
+        try:
+            with open(baseline_path, encoding="utf-8") as handle:
+                baseline = json.load(handle).get("endpoints", {})
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Could not read baseline {baseline_path}: {exc}")
+
+        for name, current in results.items():
+            previous = baseline.get(name)
+            if not previous:
+                self.stderr.write(f"{name}: not in baseline")
+                continue
+            before = float(previous.get("median_ms") or 0.0)
+            change = (current["median_ms"] - before) / before * 100 if before else 0.0
+            self.stderr.write(
+                f"{name}: median {before}ms -> {current['median_ms']}ms ({change:+.1f}%), "
+                f"queries {previous.get('queries')} -> {current['queries']}"
+            )
+
@@ -19,7 +19,10 @@ from admin_app.models import (
     Transaction_history,
     User_feedback,
 )
-from user_app.models import Campaign, Campaign_history, Chef, Food, Order, Order_history
+from admin_app.services.dashboard_reporting import reset_dashboard_cache
+from user_app.models import Campaign, Campaign_history, Chef, Food, Order, Order_history, Order_line
+from user_app.services.sales_rollups import rebuild_chef_daily_sales
+from user_app.services.spend_rollups import rebuild_user_spend
 
 
 DEMO_PASSWORD = "DemoPass123!"
@@ -184,6 +187,9 @@ class Command(BaseCommand):
             rng=rng,
             today=today,
         )
+        # Seeded orders are back-dated after creation, so rebuild rollups from their final timestamps.
+        rebuild_chef_daily_sales()
+        rebuild_user_spend()
         transaction_stats = self._seed_transactions(
             chef_usernames=account_info["chef_usernames"],
             rng=rng,
@@ -209,6 +215,8 @@ class Command(BaseCommand):
             rng=rng,
             today=today,
         )
+        # Back-dating above uses queryset updates, which the dashboard cache signals never see.
+        reset_dashboard_cache()
 
         self.stdout.write(self.style.SUCCESS("Demo data seeding completed successfully."))
         self.stdout.write("")
@@ -503,15 +511,16 @@ class Command(BaseCommand):
                 chef_username = rng.choice(chef_usernames)
                 food_pool = foods_by_chef[chef_username]
                 selected = rng.sample(food_pool, k=min(rng.randint(1, 3), len(food_pool)))
-                quantity = rng.randint(1, 4)
-                amount = round(sum(food_price_map[fid] for fid in selected) * quantity, 2)
+                per_food = rng.randint(1, 4)
+                food_items = {food_id: per_food for food_id in selected}
+                amount = round(sum(food_price_map[fid] for fid in selected) * per_food, 2)
 
                 order = Order.objects.create(
                     user=username,
                     user_address=f"AIU Residence Block {rng.randint(1, 7)}",
                     user_phone=f"01{rng.randint(10000000, 99999999)}",
-                    quantity=quantity,
-                    food_items=",".join(selected),
+                    quantity=sum(food_items.values()),
+                    food_items=food_items,
                     custom_order_details=f"{DEMO_TAG} Pending order generated by seed.",
                     food_price=amount,
                 )
@@ -521,6 +530,7 @@ class Command(BaseCommand):
                     minute=rng.choice([0, 10, 20, 30, 40, 50]),
                 )
                 Order.objects.filter(pk=order.pk).update(order_time=order_time)
+                Order_line.objects.filter(order=order).update(order_time=order_time)
                 register_rollup(
                     username=username,
                     chef_username=chef_username,
@@ -538,13 +548,14 @@ class Command(BaseCommand):
                 chef_username = rng.choice(chef_usernames)
                 food_pool = foods_by_chef[chef_username]
                 selected = rng.sample(food_pool, k=min(rng.randint(1, 3), len(food_pool)))
-                quantity = rng.randint(1, 5)
-                amount = round(sum(food_price_map[fid] for fid in selected) * quantity, 2)
+                per_food = rng.randint(1, 5)
+                food_items = {food_id: per_food for food_id in selected}
+                amount = round(sum(food_price_map[fid] for fid in selected) * per_food, 2)
 
                 history = Order_history.objects.create(
                     user=username,
-                    quantity=quantity,
-                    food_items=",".join(selected),
+                    quantity=sum(food_items.values()),
+                    food_items=food_items,
                     food_price=amount,
                     order_id=f"DEMO-H-{day.strftime('%m%d')}-{idx + 1}-{rng.randint(100, 999)}",
                 )
@@ -554,6 +565,7 @@ class Command(BaseCommand):
                     minute=rng.choice([0, 15, 30, 45]),
                 )
                 Order_history.objects.filter(pk=history.pk).update(order_time=order_time)
+                Order_line.objects.filter(order_history=history).update(order_time=order_time)
                 register_rollup(
                     username=username,
                     chef_username=chef_username,
@@ -5,7 +5,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from admin_app.models import Dashboard_report_schedule
-from admin_app.services.dashboard_reporting import build_dashboard_csv, build_dashboard_payload, resolve_range
+from admin_app.services.dashboard_reporting import build_dashboard_csv, get_dashboard_payload, resolve_range
 
 
 class Command(BaseCommand):
@@ -40,7 +40,7 @@ class Command(BaseCommand):
                 )
                 continue
 
-            payload = build_dashboard_payload(range_info)
+            payload = get_dashboard_payload(range_info)
             csv_content = build_dashboard_csv(payload)
 
             subject = f"Food Now Admin Dashboard Report ({payload['range']['label']})"
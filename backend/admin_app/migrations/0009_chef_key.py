@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:20
+
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+CHEF_KEY_SOURCES = (
+    ("Pending_transaction", "chef"),
+    ("Transaction_history", "chef"),
+)
+
+
+def fill_chef_keys(apps, schema_editor):
+    for model_name, source in CHEF_KEY_SOURCES:
+        apps.get_model("admin_app", model_name).objects.update(chef_key=Lower(Trim(source)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0008_pending_and_history_subscription_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pending_transaction',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='transaction_history',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.RunPython(fill_chef_keys, migrations.RunPython.noop),
+    ]
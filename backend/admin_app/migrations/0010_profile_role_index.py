@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0009_chef_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='role',
+            field=models.CharField(db_index=True, default='user', max_length=100),
+        ),
+    ]
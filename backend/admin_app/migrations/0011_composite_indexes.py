@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0010_profile_role_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user_feedback',
+            name='user',
+            field=models.CharField(max_length=150),
+        ),
+        migrations.AddIndex(
+            model_name='pending_transaction',
+            index=models.Index(fields=['type', 'status', '-transaction_time'], name='pending_tx_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pending_transaction',
+            index=models.Index(fields=['chef_key', 'type', '-transaction_time'], name='pending_tx_chef_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction_history',
+            index=models.Index(fields=['type', 'status', '-transaction_time'], name='tx_hist_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction_history',
+            index=models.Index(fields=['chef_key', 'type', '-transaction_time'], name='tx_hist_chef_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user_feedback',
+            index=models.Index(fields=['user', 'category', '-created_at'], name='feedback_user_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user_feedback',
+            index=models.Index(fields=['status', '-created_at'], name='feedback_status_created_idx'),
+        ),
+    ]
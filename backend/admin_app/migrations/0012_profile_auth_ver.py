@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0011_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='auth_ver',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:40
+
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def normalize_type_and_status(apps, schema_editor):
+    # The subscription queues match type/status with plain equality; rows written with
+    # other casing or stray whitespace (admin site, older clients) would never show up.
+    for model_name in ("Pending_transaction", "Transaction_history"):
+        model = apps.get_model("admin_app", model_name)
+        for field in ("type", "status"):
+            normalized = Lower(Trim(field))
+            model.objects.exclude(**{field: normalized}).update(**{field: normalized})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0012_profile_auth_ver'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pending_transaction',
+            name='type',
+            field=models.CharField(default='transaction type', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='transaction_history',
+            name='type',
+            field=models.CharField(default='transaction type', max_length=100),
+        ),
+        migrations.RunPython(normalize_type_and_status, migrations.RunPython.noop),
+    ]
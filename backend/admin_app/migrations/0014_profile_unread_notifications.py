@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:54
+
+from django.db import migrations, models
+from django.db.models import Count, Exists, OuterRef
+
+
+def backfill_unread_notifications(apps, schema_editor):
+    # Same rules as notifications.services.broadcasts.announcements_for: broadcasts addressed
+    # to the profile's role, sent after the account was created, without a receipt.
+    Profile = apps.get_model("admin_app", "Profile")
+    Notification = apps.get_model("notifications", "Notification")
+    Announcement = apps.get_model("notifications", "Announcement")
+    Announcement_receipt = apps.get_model("notifications", "Announcement_receipt")
+
+    direct = dict(
+        Notification.objects.filter(is_seen=False)
+        .values("username")
+        .annotate(unread=Count("pk"))
+        .values_list("username", "unread")
+    )
+    batch = []
+    for profile in Profile.objects.select_related("user").iterator(chunk_size=1000):
+        username = profile.user.username
+        targets = ["", "all"] + (["chefs"] if profile.role == "chef" else [])
+        broadcasts = Announcement.objects.filter(target__in=targets)
+        if profile.user.date_joined:
+            broadcasts = broadcasts.filter(time__gte=profile.user.date_joined)
+        receipts = Announcement_receipt.objects.filter(announcement=OuterRef("pk"), username=username)
+        profile.unread_notifications = direct.get(username, 0) + broadcasts.filter(~Exists(receipts)).count()
+        batch.append(profile)
+        if len(batch) >= 1000:
+            Profile.objects.bulk_update(batch, ["unread_notifications"])
+            batch = []
+    if batch:
+        Profile.objects.bulk_update(batch, ["unread_notifications"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_app', '0013_normalize_transaction_type_status'),
+        ('notifications', '0004_notification_unread_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='unread_notifications',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_unread_notifications, migrations.RunPython.noop),
+    ]
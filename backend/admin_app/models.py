@@ -1,7 +1,7 @@
 # backend/admin_app/models.py
 
 from django.db import models
-from core.models import core_model
+from core.models import chef_keyed_model, core_model
 from django.db import models
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
@@ -14,7 +14,7 @@ from django.utils.timezone import now
 
 class Profile(core_model):
     user = models.OneToOneField(User, on_delete=models.CASCADE , related_name="profile")
-    role = models.CharField( max_length=100 , default="user" )
+    role = models.CharField( max_length=100 , default="user", db_index=True )
     aiu_id = models.CharField( max_length=100 , null=True , blank=True )
     id_card = models.ImageField(upload_to ='id_card/', null=True, blank=True)
     total_orders = models.IntegerField(default=0 , blank=True, null=True)
@@ -24,6 +24,11 @@ class Profile(core_model):
     created_at = models.DateTimeField(auto_now_add=True, null=True, blank=True )
     updated_at = models.DateTimeField(default=now, editable=True)
     last_order = models.DateTimeField(editable=True, null=True, blank=True)
+    # Bumped on a role change or ban; tokens stamped with an older value are refused.
+    auth_ver = models.PositiveIntegerField(default=0, editable=False)
+    # Unread direct notifications plus broadcasts without a receipt, kept in step with F()
+    # updates so the polled badge is a single-row read.
+    unread_notifications = models.PositiveIntegerField(default=0, editable=False)
     
 
     def __str__(self):
@@ -41,10 +46,33 @@ def create_profile( sender, instance , created , **kwargs):
         print(e)
 
 
-class Pending_transaction(core_model):
+def normalize_transaction_value(value):
+    return str(value or "").strip().lower()
+
+
+class transaction_model(chef_keyed_model):
+    """Stores ``type`` and ``status`` lower-cased and trimmed on every save.
+
+    The subscription queues filter these columns with plain equality so the
+    ``(type, status)`` indexes apply. Rows typed in through the admin site or the
+    serializers would otherwise drop out of the queues.
+    """
+
+    normalized_fields = ("type", "status")
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        for field in self.normalized_fields:
+            setattr(self, field, normalize_transaction_value(getattr(self, field)))
+        super().save(*args, **kwargs)
+
+
+class Pending_transaction(transaction_model):
     status = models.CharField(max_length=100, default="active")
     chef = models.CharField(max_length=100, default="chef username")
-    type = models.CharField(max_length=100, default="Transaction Type")
+    type = models.CharField(max_length=100, default="transaction type")
     subscription_option_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     subscription_option_name = models.CharField(max_length=150, blank=True, null=True)
     subscription_duration_months = models.PositiveIntegerField(null=True, blank=True)
@@ -53,14 +81,22 @@ class Pending_transaction(core_model):
     transaction_time = models.DateTimeField(auto_now_add=True, null=True, blank=True, editable=True, db_index=True)
     amount = models.FloatField(null=True, blank=True, default=0.0)
 
+    class Meta:
+        indexes = [
+            # Admin subscription queue: type + status equality, newest first.
+            models.Index(fields=["type", "status", "-transaction_time"], name="pending_tx_type_status_idx"),
+            # A chef's own subscription requests.
+            models.Index(fields=["chef_key", "type", "-transaction_time"], name="pending_tx_chef_type_idx"),
+        ]
+
     def __str__(self):
         return self.chef
 
 
-class Transaction_history(core_model):
+class Transaction_history(transaction_model):
     status = models.CharField(max_length=100, default="active")
     chef = models.CharField(max_length=100, default="chef username")
-    type = models.CharField(max_length=100, default="Transaction Type")
+    type = models.CharField(max_length=100, default="transaction type")
     subscription_option_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     subscription_option_name = models.CharField(max_length=150, blank=True, null=True)
     subscription_duration_months = models.PositiveIntegerField(null=True, blank=True)
@@ -70,6 +106,12 @@ class Transaction_history(core_model):
     transaction_time = models.DateTimeField(auto_now_add=True, null=True, blank=True, editable=True, db_index=True)
     amount = models.FloatField(null=True, blank=True, default=0.0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["type", "status", "-transaction_time"], name="tx_hist_type_status_idx"),
+            models.Index(fields=["chef_key", "type", "-transaction_time"], name="tx_hist_chef_type_idx"),
+        ]
+
     def __str__(self):
         return self.transaction_id
     
@@ -142,7 +184,7 @@ class User_feedback(core_model):
         (STATUS_RESOLVED, "Resolved"),
     )
 
-    user = models.CharField(max_length=150, db_index=True)
+    user = models.CharField(max_length=150)
     email = models.EmailField(blank=True, null=True)
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, default=CATEGORY_FEEDBACK, db_index=True)
     subject = models.CharField(max_length=200)
@@ -156,6 +198,12 @@ class User_feedback(core_model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # A user's own support/feedback threads; also covers plain ``user=`` lookups.
+            models.Index(fields=["user", "category", "-created_at"], name="feedback_user_category_idx"),
+            # Admin triage filtered by status, newest first.
+            models.Index(fields=["status", "-created_at"], name="feedback_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.category} - {self.user} - {self.subject[:40]}"
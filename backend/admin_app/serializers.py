@@ -4,6 +4,7 @@ from home_app.models import *
 from user_app.models import *
 from admin_app.models import *
 from notifications.models import *
+from core.authentication import user_profile
 
 
 class AnnouncementSerializer(serializers.ModelSerializer):
@@ -123,11 +124,22 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined', 'role')
 
     def get_role(self, obj):
-        try:
-            profile = Profile.objects.get(user=obj)
-            return profile.role
-        except Profile.DoesNotExist:
-            return "user"
+        profile = user_profile(obj)
+        return profile.role if profile else "user"
+
+
+class AdminUserSerializer(UserSerializer):
+    """``UserSerializer`` plus the account fields the admin users page filters on.
+
+    Expects users fetched with ``select_related("profile")``.
+    """
+
+    is_account_banned = serializers.BooleanField(source="profile.is_account_banned", read_only=True, default=False)
+    total_orders = serializers.IntegerField(source="profile.total_orders", read_only=True, default=0)
+    last_order = serializers.DateTimeField(source="profile.last_order", read_only=True, default=None)
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ('is_active', 'last_login', 'is_account_banned', 'total_orders', 'last_order')
 
 
 class User_feedbackSerializer(serializers.ModelSerializer):
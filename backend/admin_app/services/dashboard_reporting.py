@@ -6,13 +6,16 @@ import json
 import textwrap
 from datetime import date, datetime, timedelta
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db.models import Count, Sum
-from django.db.models.functions import ExtractMonth, TruncDate
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 from admin_app.models import Pending_transaction, Profile, Transaction_history
-from user_app.models import Campaign, Chef, Food, Order
+from core.date_ranges import in_date_range, range_bounds
+from user_app.models import Campaign, Chef, Food, Order, Order_history, Order_line
 
 
 RANGE_LABELS = {
@@ -76,142 +79,248 @@ def resolve_range(range_key=None, start_date_raw=None, end_date_raw=None):
     )
 
 
-def _parse_food_ids(food_items_raw):
-    if not food_items_raw:
-        return []
+DASHBOARD_CACHE_PREFIX = "admin_dashboard"
+DASHBOARD_GENERATION_KEY = f"{DASHBOARD_CACHE_PREFIX}:generation"
 
-    raw = str(food_items_raw).strip()
-    if not raw:
-        return []
 
-    if raw.startswith("[") or raw.startswith("{"):
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, list):
-                return [str(item).strip() for item in parsed if str(item).strip()]
-            if isinstance(parsed, dict):
-                return [str(item).strip() for item in parsed.keys() if str(item).strip()]
-        except Exception:
-            pass
+def _payload_ttl():
+    return int(getattr(settings, "ADMIN_DASHBOARD_CACHE_TTL", 60))
 
-    return [item.strip() for item in raw.split(",") if item.strip()]
 
+def _partials_ttl():
+    return int(getattr(settings, "ADMIN_DASHBOARD_PARTIALS_TTL", 600))
 
-def build_dashboard_payload(range_info):
-    start_date = range_info["start_date"]
-    end_date = range_info["end_date"]
-    date_axis = [start_date + timedelta(days=idx) for idx in range(range_info["day_span"])]
-    date_labels = [day.isoformat() for day in date_axis]
 
-    total_users = Profile.objects.filter(role="user").count() or User.objects.count()
-    total_chefs = Chef.objects.count()
+def _counter(key):
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, 1, None)
+        value = cache.get(key) or 1
+    return int(value)
 
-    campaigns_count = Campaign.objects.filter(
-        start_time__date__gte=start_date,
-        start_time__date__lte=end_date,
-    ).count()
-    orders_count = Order.objects.filter(order_time__date__gte=start_date, order_time__date__lte=end_date).count()
-
-    pending_recharge_total = _to_float(
-        Pending_transaction.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
-        ).aggregate(total=Sum("amount"))["total"]
-    )
-    completed_recharge_total = _to_float(
-        Transaction_history.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
-        ).aggregate(total=Sum("amount"))["total"]
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+
+def _to_day(value):
+    if isinstance(value, datetime):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    return value
+
+
+def _month_cache_key(day, generation=None):
+    # Closed-day partials are stored in one bucket per month to keep the key count small.
+    generation = generation or _counter(DASHBOARD_GENERATION_KEY)
+    return f"{DASHBOARD_CACHE_PREFIX}:{generation}:month:{day:%Y-%m}"
+
+
+def _month_revision_key(day, generation=None):
+    generation = generation or _counter(DASHBOARD_GENERATION_KEY)
+    return f"{DASHBOARD_CACHE_PREFIX}:{generation}:revision:{day:%Y-%m}"
+
+
+def _payload_span(range_info):
+    """Days a payload reads partials for: its range plus the whole year of the yearly chart."""
+    end_date = range_info["end_date"]
+    return min(range_info["start_date"], date(end_date.year, 1, 1)), max(end_date, date(end_date.year, 12, 31))
+
+
+def _payload_cache_key(range_info):
+    # The key carries the revision of every month the payload reads, so a write on a closed
+    # day only retires the payloads whose span covers that month.
+    generation = _counter(DASHBOARD_GENERATION_KEY)
+    span_start, span_end = _payload_span(range_info)
+    months = []
+    month = span_start.replace(day=1)
+    while month <= span_end:
+        months.append(_month_revision_key(month, generation))
+        month = (month + timedelta(days=32)).replace(day=1)
+    revisions = cache.get_many(months)
+    return ":".join(
+        [
+            DASHBOARD_CACHE_PREFIX,
+            str(generation),
+            "payload",
+            range_info["key"],
+            range_info["start_date"].isoformat(),
+            range_info["end_date"].isoformat(),
+            ".".join(str(revisions.get(key, 1)) for key in months),
+        ]
     )
-    recharge_total = round(pending_recharge_total + completed_recharge_total, 2)
 
-    campaigns_daily_qs = (
-        Campaign.objects.filter(start_time__date__gte=start_date, start_time__date__lte=end_date)
+
+def invalidate_dashboard_day(day):
+    """Drop the cached partial for one closed day and the payloads whose span covers it.
+
+    Today onwards is never cached as a partial, so writes dated today reach the assembled
+    payloads once their ``ADMIN_DASHBOARD_CACHE_TTL`` lapses instead of retiring them all.
+    """
+    day = _to_day(day)
+    if not day or day >= timezone.localdate():
+        return
+    cache.delete(_month_cache_key(day))
+    _bump(_month_revision_key(day))
+
+
+def reset_dashboard_cache():
+    """Forget every cached day and payload, e.g. after bulk ``.update()`` writes that skip signals."""
+    _bump(DASHBOARD_GENERATION_KEY)
+
+
+def _empty_day():
+    return {"campaigns": 0, "orders": 0, "recharge": 0.0, "chef_recharge": {}, "foods": {}}
+
+
+def _contiguous_runs(days):
+    runs = []
+    for day in sorted(days):
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return runs
+
+
+def _compute_day_partials(start_date, end_date):
+    """Per-day aggregates for ``start_date..end_date`` with one grouped query per source."""
+    partials = {start_date + timedelta(days=idx): _empty_day() for idx in range((end_date - start_date).days + 1)}
+
+    campaign_rows = (
+        Campaign.objects.filter(in_date_range("start_time", start_date, end_date))
         .annotate(day=TruncDate("start_time"))
         .values("day")
         .annotate(total=Count("uid"))
-        .order_by("day")
+        .order_by()
     )
-    campaigns_by_day = {row["day"]: row["total"] for row in campaigns_daily_qs if row["day"]}
+    for row in campaign_rows:
+        if row["day"] in partials:
+            partials[row["day"]]["campaigns"] += int(row["total"] or 0)
 
-    orders_daily_qs = (
-        Order.objects.filter(order_time__date__gte=start_date, order_time__date__lte=end_date)
+    order_rows = (
+        Order.objects.filter(in_date_range("order_time", start_date, end_date))
         .annotate(day=TruncDate("order_time"))
         .values("day")
         .annotate(total=Count("uid"))
-        .order_by("day")
+        .order_by()
     )
-    orders_by_day = {row["day"]: row["total"] for row in orders_daily_qs if row["day"]}
-
-    recharge_by_day = {day: 0.0 for day in date_axis}
-
-    pending_recharge_daily_qs = (
-        Pending_transaction.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
+    for row in order_rows:
+        if row["day"] in partials:
+            partials[row["day"]]["orders"] += int(row["total"] or 0)
+
+    for model in (Pending_transaction, Transaction_history):
+        recharge_rows = (
+            model.objects.filter(in_date_range("transaction_time", start_date, end_date))
+            .annotate(day=TruncDate("transaction_time"))
+            .values("day", "chef")
+            .annotate(total=Sum("amount"))
+            .order_by()
         )
-        .annotate(day=TruncDate("transaction_time"))
-        .values("day")
-        .annotate(total=Sum("amount"))
-        .order_by("day")
-    )
-    completed_recharge_daily_qs = (
-        Transaction_history.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
+        for row in recharge_rows:
+            partial = partials.get(row["day"])
+            if partial is None:
+                continue
+            amount = _to_float(row["total"])
+            partial["recharge"] += amount
+            chef_name = (row.get("chef") or "").strip()
+            if chef_name:
+                partial["chef_recharge"][chef_name] = partial["chef_recharge"].get(chef_name, 0.0) + amount
+
+    food_rows = (
+        Order_line.objects.filter(
+            in_date_range("order_time", start_date, end_date),
+            order__isnull=False,
+            food__isnull=False,
         )
-        .annotate(day=TruncDate("transaction_time"))
-        .values("day")
-        .annotate(total=Sum("amount"))
-        .order_by("day")
+        .annotate(day=TruncDate("order_time"))
+        .values("day", "food_id")
+        .annotate(total=Sum("quantity"))
+        .order_by()
     )
-    for row in pending_recharge_daily_qs:
-        if row["day"]:
-            recharge_by_day[row["day"]] += _to_float(row["total"])
-    for row in completed_recharge_daily_qs:
-        if row["day"]:
-            recharge_by_day[row["day"]] += _to_float(row["total"])
+    for row in food_rows:
+        partial = partials.get(row["day"])
+        if partial is not None:
+            food_id = str(row["food_id"])
+            partial["foods"][food_id] = partial["foods"].get(food_id, 0) + int(row["total"] or 0)
 
-    campaigns_series = [int(campaigns_by_day.get(day, 0)) for day in date_axis]
-    recharge_series = [round(recharge_by_day.get(day, 0.0), 2) for day in date_axis]
-    orders_series = [int(orders_by_day.get(day, 0)) for day in date_axis]
+    return partials
 
-    top_chef_map = {}
-    pending_recharge_by_chef = (
-        Pending_transaction.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
-        )
-        .values("chef")
-        .annotate(total=Sum("amount"))
-    )
-    completed_recharge_by_chef = (
-        Transaction_history.objects.filter(
-            transaction_time__date__gte=start_date,
-            transaction_time__date__lte=end_date,
-        )
-        .values("chef")
-        .annotate(total=Sum("amount"))
-    )
 
-    for row in pending_recharge_by_chef:
-        chef_name = (row.get("chef") or "").strip()
-        if chef_name:
-            top_chef_map[chef_name] = top_chef_map.get(chef_name, 0.0) + _to_float(row.get("total"))
-    for row in completed_recharge_by_chef:
-        chef_name = (row.get("chef") or "").strip()
-        if chef_name:
-            top_chef_map[chef_name] = top_chef_map.get(chef_name, 0.0) + _to_float(row.get("total"))
+def load_day_partials(start_date, end_date):
+    """Return ``{day: partial}``; closed days come from the cache, today onwards is always recomputed."""
+    today = timezone.localdate()
+    days = [start_date + timedelta(days=idx) for idx in range((end_date - start_date).days + 1)]
+
+    closed_keys = {day: _month_cache_key(day) for day in days if day < today}
+    buckets = cache.get_many(sorted(set(closed_keys.values()))) if closed_keys else {}
+
+    partials = {}
+    missing = []
+    for day in days:
+        bucket = buckets.get(closed_keys.get(day)) or {}
+        if day.isoformat() in bucket:
+            partials[day] = bucket[day.isoformat()]
+        else:
+            missing.append(day)
+
+    dirty = {}
+    for run_start, run_end in _contiguous_runs(missing):
+        for day, partial in _compute_day_partials(run_start, run_end).items():
+            partials[day] = partial
+            key = closed_keys.get(day)
+            if key is not None:
+                bucket = dirty.setdefault(key, dict(buckets.get(key) or {}))
+                bucket[day.isoformat()] = partial
+    if dirty:
+        # Invalidation only reaches the cache of the process that saw the write unless the
+        # backend is shared, so buckets also expire after ADMIN_DASHBOARD_PARTIALS_TTL.
+        cache.set_many(dirty, _partials_ttl())
+
+    return partials
+
+
+def build_dashboard_payload(range_info):
+    start_date = range_info["start_date"]
+    end_date = range_info["end_date"]
+    date_axis = [start_date + timedelta(days=idx) for idx in range(range_info["day_span"])]
+    date_labels = [day.isoformat() for day in date_axis]
+
+    revenue_year = end_date.year
+    year_start = date(revenue_year, 1, 1)
+    year_end = date(revenue_year, 12, 31)
+    partials = load_day_partials(*_payload_span(range_info))
+    range_partials = [partials[day] for day in date_axis]
+
+    total_users = Profile.objects.filter(role="user").count() or User.objects.count()
+    total_chefs = Chef.objects.count()
+
+    campaigns_series = [int(partial["campaigns"]) for partial in range_partials]
+    recharge_series = [round(partial["recharge"], 2) for partial in range_partials]
+    orders_series = [int(partial["orders"]) for partial in range_partials]
+
+    campaigns_count = sum(campaigns_series)
+    orders_count = sum(orders_series)
+    recharge_total = round(sum(partial["recharge"] for partial in range_partials), 2)
+
+    top_chef_map = {}
+    food_totals = {}
+    for partial in range_partials:
+        for chef_name, amount in partial["chef_recharge"].items():
+            top_chef_map[chef_name] = top_chef_map.get(chef_name, 0.0) + amount
+        for food_id, quantity in partial["foods"].items():
+            food_totals[food_id] = food_totals.get(food_id, 0) + quantity
 
     top_chefs = [
         {"chef": chef_name, "revenue": round(revenue, 2)}
         for chef_name, revenue in sorted(top_chef_map.items(), key=lambda item: item[1], reverse=True)[:5]
     ]
 
+    # Campaign order counters move with every purchase, so this ranking is always read live.
     top_campaigns_qs = Campaign.objects.filter(
-        start_time__date__gte=start_date,
-        start_time__date__lte=end_date,
+        in_date_range("start_time", start_date, end_date),
     ).order_by("-total_orders", "-start_time")[:5]
     if not top_campaigns_qs:
         top_campaigns_qs = Campaign.objects.order_by("-total_orders", "-start_time")[:5]
@@ -226,17 +335,7 @@ def build_dashboard_payload(range_info):
         for campaign in top_campaigns_qs
     ]
 
-    food_totals = {}
-    order_rows = Order.objects.filter(order_time__date__gte=start_date, order_time__date__lte=end_date).values(
-        "food_items", "quantity"
-    )
-    for row in order_rows:
-        quantity = int(row.get("quantity") or 0)
-        quantity = quantity if quantity > 0 else 1
-        for food_id in _parse_food_ids(row.get("food_items")):
-            food_totals[food_id] = food_totals.get(food_id, 0) + quantity
-
-    top_food_entries = sorted(food_totals.items(), key=lambda item: item[1], reverse=True)[:5]
+    top_food_entries = sorted(food_totals.items(), key=lambda item: (-item[1], item[0]))[:5]
     top_food_ids = [entry[0] for entry in top_food_entries]
     food_name_map = {str(food.uid): food.food_name for food in Food.objects.filter(uid__in=top_food_ids)}
     top_foods = [
@@ -248,38 +347,11 @@ def build_dashboard_payload(range_info):
         for food_id, quantity_sold in top_food_entries
     ]
 
-    revenue_year = end_date.year
-    year_start = date(revenue_year, 1, 1)
-    year_end = date(revenue_year, 12, 31)
-
     revenue_month_map = {month: 0.0 for month in range(1, 13)}
-
-    pending_revenue_by_month = (
-        Pending_transaction.objects.filter(
-            transaction_time__date__gte=year_start,
-            transaction_time__date__lte=year_end,
-        )
-        .annotate(month=ExtractMonth("transaction_time"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-    )
-    completed_revenue_by_month = (
-        Transaction_history.objects.filter(
-            transaction_time__date__gte=year_start,
-            transaction_time__date__lte=year_end,
-        )
-        .annotate(month=ExtractMonth("transaction_time"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-    )
-    for row in pending_revenue_by_month:
-        month = row.get("month")
-        if month:
-            revenue_month_map[month] += _to_float(row.get("total"))
-    for row in completed_revenue_by_month:
-        month = row.get("month")
-        if month:
-            revenue_month_map[month] += _to_float(row.get("total"))
+    day = year_start
+    while day <= year_end:
+        revenue_month_map[day.month] += partials[day]["recharge"]
+        day += timedelta(days=1)
 
     revenue_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
     revenue_per_month = [round(revenue_month_map[month], 2) for month in range(1, 13)]
@@ -321,6 +393,16 @@ def build_dashboard_payload(range_info):
     }
 
 
+def get_dashboard_payload(range_info):
+    """``build_dashboard_payload`` behind a short-lived cache keyed by (range key, start, end)."""
+    cache_key = _payload_cache_key(range_info)
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = build_dashboard_payload(range_info)
+        cache.set(cache_key, payload, _payload_ttl())
+    return payload
+
+
 def build_dashboard_csv(payload):
     output = io.StringIO()
     writer = csv.writer(output)
@@ -391,6 +473,76 @@ def build_dashboard_csv(payload):
     return output.getvalue()
 
 
+LEDGER_CHUNK_SIZE = 2000
+
+LEDGER_DATASETS = {
+    "orders": {
+        "header": ["Order ID", "State", "User", "Order Time", "Quantity", "Amount", "Food Items"],
+        "sources": (
+            ("pending", Order, "order_time", ("uid", "user", "order_time", "quantity", "food_price", "food_items")),
+            (
+                "completed",
+                Order_history,
+                "order_time",
+                ("order_id", "user", "order_time", "quantity", "food_price", "food_items"),
+            ),
+        ),
+    },
+    "transactions": {
+        "header": ["Transaction ID", "State", "Chef", "Type", "Status", "Transaction Time", "Amount"],
+        "sources": (
+            (
+                "pending",
+                Pending_transaction,
+                "transaction_time",
+                ("uid", "chef", "type", "status", "transaction_time", "amount"),
+            ),
+            (
+                "completed",
+                Transaction_history,
+                "transaction_time",
+                ("transaction_id", "chef", "type", "status", "transaction_time", "amount"),
+            ),
+        ),
+    },
+}
+
+
+class _EchoBuffer:
+    """File-like object for ``csv.writer`` that hands each formatted row straight back."""
+
+    def write(self, value):
+        return value
+
+
+def _ledger_cell(value):
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat() if timezone.is_aware(value) else value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return "" if value is None else value
+
+
+def iter_ledger_csv(dataset, range_info=None, chunk_size=LEDGER_CHUNK_SIZE):
+    """Yield CSV lines for a raw ledger (``orders`` or ``transactions``) one row at a time.
+
+    Rows are read with ``.values_list().iterator(chunk_size=...)`` so memory stays flat
+    however large the table is; ``range_info=None`` exports every row.
+    """
+    spec = LEDGER_DATASETS[dataset]
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(spec["header"])
+
+    for state, model, time_field, columns in spec["sources"]:
+        queryset = model.objects.all()
+        if range_info:
+            start_at, end_at = range_bounds(range_info)
+            queryset = queryset.filter(**{f"{time_field}__gte": start_at, f"{time_field}__lt": end_at})
+        rows = queryset.order_by(time_field, "uid").values_list(*columns).iterator(chunk_size=chunk_size)
+        for row in rows:
+            yield writer.writerow([_ledger_cell(row[0]), state, *(_ledger_cell(value) for value in row[1:])])
+
+
 def _pdf_escape(text):
     escaped = str(text).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
     return escaped.encode("latin-1", "replace").decode("latin-1")
@@ -0,0 +1,59 @@
+# admin_app/signals.py
+
+from django.db.models.signals import post_delete, post_init, post_save
+
+from admin_app.models import Pending_transaction, Profile, Transaction_history
+from admin_app.services.dashboard_reporting import invalidate_dashboard_day
+from core.tokens import deny_user_tokens
+from user_app.models import Campaign, Order
+
+
+# The admin dashboard caches one aggregate partial per closed day; a write only drops the
+# partials for the day the row falls on and, when its timestamp moved, the day it left.
+DASHBOARD_DAY_FIELDS = {
+    Campaign: "start_time",
+    Order: "order_time",
+    Pending_transaction: "transaction_time",
+    Transaction_history: "transaction_time",
+}
+
+
+def remember_dashboard_day(sender, instance, **kwargs):
+    instance._dashboard_day = instance.__dict__.get(DASHBOARD_DAY_FIELDS[sender])
+
+
+def invalidate_dashboard_for_instance(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    current = getattr(instance, DASHBOARD_DAY_FIELDS[sender], None)
+    previous = getattr(instance, "_dashboard_day", None)
+    invalidate_dashboard_day(current)
+    if previous and previous != current:
+        invalidate_dashboard_day(previous)
+    instance._dashboard_day = current
+
+
+for model in DASHBOARD_DAY_FIELDS:
+    post_init.connect(remember_dashboard_day, sender=model, dispatch_uid=f"admin_dashboard_init_{model.__name__}")
+    post_save.connect(
+        invalidate_dashboard_for_instance, sender=model, dispatch_uid=f"admin_dashboard_save_{model.__name__}"
+    )
+    post_delete.connect(
+        invalidate_dashboard_for_instance, sender=model, dispatch_uid=f"admin_dashboard_delete_{model.__name__}"
+    )
+
+
+# Access tokens carry the role claim, so a role change or ban revokes what was issued before it.
+def remember_profile_auth_state(sender, instance, **kwargs):
+    instance._auth_state = (instance.role, instance.is_account_banned)
+
+
+def revoke_tokens_on_auth_change(sender, instance, created=False, raw=False, **kwargs):
+    state = (instance.role, instance.is_account_banned)
+    if not raw and not created and state != getattr(instance, "_auth_state", state):
+        deny_user_tokens(instance)
+    instance._auth_state = state
+
+
+post_init.connect(remember_profile_auth_state, sender=Profile, dispatch_uid="profile_auth_state_init")
+post_save.connect(revoke_tokens_on_auth_change, sender=Profile, dispatch_uid="profile_auth_state_save")
@@ -1,3 +1,400 @@
-from django.test import TestCase
+import csv
+import importlib
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from admin_app.management.commands.run_benchmarks import BENCHMARK_ENDPOINTS
+from admin_app.models import Pending_transaction, Profile, Transaction_history, User_feedback
+from admin_app.services.dashboard_reporting import (
+    _compute_day_partials,
+    build_dashboard_payload,
+    get_dashboard_payload,
+    reset_dashboard_cache,
+    resolve_range,
+)
+from core.testing import QueryPlanAssertions
+from core.tokens import tokens_for_user
+from user_app.models import Campaign, Chef_daily_sales, Food, Order, Order_history, Order_line, User_spend_total
+
+
+class DashboardPayloadCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.soup = Food.objects.create(food_name="Soup", chef="chef_gus", food_price=4.0)
+        Order.objects.create(user="buyer", quantity=2, food_items={str(self.soup.uid): 2}, food_price=8.0)
+        self.yesterday = timezone.now() - timedelta(days=1)
+
+    def _backdated_transaction(self, amount):
+        transaction = Pending_transaction.objects.create(chef="chef_gus", type="deposit", amount=amount)
+        transaction.transaction_time = self.yesterday
+        transaction.save()
+        return transaction
+
+    def test_closed_days_are_served_from_cache(self):
+        self._backdated_transaction(5.0)
+        start = timezone.localdate() - timedelta(days=365)
+        range_info, _error = resolve_range("custom", start.isoformat(), timezone.localdate().isoformat())
+
+        cold = build_dashboard_payload(range_info)
+        with CaptureQueriesContext(connection) as warm_queries:
+            warm = build_dashboard_payload(range_info)
+
+        self.assertEqual(warm, cold)
+        self.assertEqual(warm["summary"]["recharge_in_range"], 5.0)
+        self.assertEqual(warm["top_performers"]["foods_by_quantity"][0]["quantity_sold"], 2)
+        # Only today onwards is recomputed: head counts, five grouped queries, top campaigns, food names.
+        self.assertLessEqual(len(warm_queries), 11)
+
+    def test_write_on_a_closed_day_invalidates_it(self):
+        range_info, _error = resolve_range("7d")
+        self.assertEqual(get_dashboard_payload(range_info)["last_30_days"]["recharge_per_day"][-2], 0.0)
+
+        self._backdated_transaction(12.5)
+
+        payload = get_dashboard_payload(range_info)
+        self.assertEqual(payload["last_30_days"]["recharge_per_day"][-2], 12.5)
+
+    def test_reset_drops_partials_after_queryset_updates(self):
+        range_info, _error = resolve_range("7d")
+        get_dashboard_payload(range_info)
+
+        Order.objects.update(order_time=self.yesterday)
+        reset_dashboard_cache()
+
+        orders_per_day = get_dashboard_payload(range_info)["last_30_days"]["orders_per_day"]
+        self.assertEqual(orders_per_day[-2:], [1, 0])
+
+    def test_writes_outside_a_payload_span_keep_it_cached(self):
+        range_info, _error = resolve_range("7d")
+        get_dashboard_payload(range_info)
+
+        Order.objects.create(user="buyer", quantity=1, food_items={str(self.soup.uid): 1}, food_price=4.0)
+        old = Pending_transaction.objects.create(chef="chef_gus", type="deposit", amount=3.0)
+        old.transaction_time = timezone.now() - timedelta(days=800)
+        old.save()
+
+        with self.assertNumQueries(0):
+            get_dashboard_payload(range_info)
+
+    def test_closed_day_partials_expire(self):
+        range_info, _error = resolve_range("7d")
+        with override_settings(ADMIN_DASHBOARD_PARTIALS_TTL=120), mock.patch.object(
+            cache, "set_many", wraps=cache.set_many
+        ) as set_many:
+            build_dashboard_payload(range_info)
+
+        self.assertTrue(set_many.called)
+        self.assertTrue(all(call.args[1] == 120 for call in set_many.call_args_list))
+
+
+class LedgerExportTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create_user(username="admin_ivy", password="pass12345")
+        admin.profile.role = "admin"
+        admin.profile.save(update_fields=["role"])
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def _rows(self, response):
+        return list(csv.reader(line.decode("utf-8") for line in response.streaming_content))
+
+    def test_orders_ledger_streams_pending_and_completed_rows(self):
+        for idx in range(3):
+            Order.objects.create(user=f"buyer{idx}", quantity=1, food_items={}, food_price=2.0)
+        Order_history.objects.create(user="buyer0", quantity=2, food_items={}, food_price=5.0, order_id="H-1")
+
+        response = self.client.get("/admin/admin_dashboard/export/", {"dataset": "orders"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = self._rows(response)
+        self.assertEqual(rows[0][:2], ["Order ID", "State"])
+        self.assertEqual([row[1] for row in rows[1:]], ["pending"] * 3 + ["completed"])
+        self.assertEqual(rows[-1][0], "H-1")
+
+    def test_transactions_ledger_respects_range(self):
+        Transaction_history.objects.create(chef="chef_ivy", amount=30.0, transaction_id="T-1")
+        old = Transaction_history.objects.create(chef="chef_ivy", amount=10.0, transaction_id="T-0")
+        old.transaction_time = timezone.now() - timedelta(days=40)
+        old.save()
+
+        response = self.client.get("/admin/admin_dashboard/export/", {"dataset": "transactions", "range": "30d"})
+
+        rows = self._rows(response)
+        self.assertEqual([row[0] for row in rows[1:]], ["T-1"])
+
+
+class RequestProfileTests(TestCase):
+    def setUp(self):
+        self.chef = User.objects.create_user(username="chef_ola", password="pass12345")
+        self.chef.profile.role = "chef"
+        self.chef.profile.save(update_fields=["role"])
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens_for_user(self.chef).access_token}")
+
+    def test_profile_is_loaded_with_the_token_user(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/profile/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["profile"]["role"], "chef")
+
+    def test_admin_views_reject_other_roles(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/admin/admin_dashboard/")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data["detail"], "You are not authorized to access this page.")
+
+
+class RoleClaimTokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="chef_pam", password="pass12345")
+        self.user.profile.role = "chef"
+        self.user.profile.save(update_fields=["role"])
+        self.client = APIClient()
+
+    def _login(self):
+        response = self.client.post("/auth/login/", {"username": "chef_pam", "password": "pass12345"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def _get(self, path, access):
+        return self.client.get(path, HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def test_login_embeds_role_and_username(self):
+        tokens = self._login()
+
+        access = AccessToken(tokens["access"])
+        self.assertEqual((access["username"], access["role"]), ("chef_pam", "chef"))
+
+    def test_read_only_endpoint_authorizes_from_the_token(self):
+        access = self._login()["access"]
+
+        with self.assertNumQueries(1):
+            # Only the announcements page itself; no user or profile lookup.
+            response = self._get("/admin/announcements/", access)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_role_change_revokes_issued_tokens(self):
+        tokens = self._login()
+        self.assertEqual(self._get("/admin/announcements/", tokens["access"]).status_code, 200)
+
+        self.user.profile.role = "user"
+        self.user.profile.save(update_fields=["role"])
+
+        self.assertEqual(self._get("/admin/announcements/", tokens["access"]).status_code, 401)
+        self.assertEqual(self._get("/profile/", tokens["access"]).status_code, 401)
+        refreshed = self.client.post("/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+        self.assertEqual(refreshed.status_code, 401)
+
+        fresh = self._login()
+        self.assertEqual(self._get("/profile/", fresh["access"]).data["profile"]["role"], "user")
+
+    def test_ban_revokes_issued_tokens(self):
+        access = self._login()["access"]
+
+        self.user.profile.is_account_banned = True
+        self.user.profile.save(update_fields=["is_account_banned"])
+
+        self.assertEqual(self._get("/available/", access).status_code, 401)
+
+    def test_revocation_is_stored_on_the_profile(self):
+        tokens = self._login()
+
+        self.user.profile.is_account_banned = True
+        self.user.profile.save(update_fields=["is_account_banned"])
+        # Another worker, or a restart, has none of this process's cache entries.
+        cache.clear()
+
+        self.assertEqual(self._get("/profile/", tokens["access"]).status_code, 401)
+        refreshed = self.client.post("/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+        self.assertEqual(refreshed.status_code, 401)
+
+    def test_refresh_restamps_the_current_role(self):
+        tokens = self._login()
+        Profile.objects.filter(user=self.user).update(role="admin")
+
+        refreshed = self.client.post("/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertEqual(AccessToken(refreshed.data["access"])["role"], "admin")
+
+
+class UsersListTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="admin_rey", password="pass12345")
+        self.admin.profile.role = "admin"
+        self.admin.profile.save(update_fields=["role"])
+        for idx in range(12):
+            user = User.objects.create_user(username=f"person{idx}", email=f"p{idx}@example.com", password="pass12345")
+            user.profile.role = "chef" if idx % 3 == 0 else "user"
+            user.profile.is_account_banned = idx == 4
+            user.profile.save(update_fields=["role", "is_account_banned"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_page_is_one_query_with_roles_inline(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/admin/users/", {"limit": 10})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["users"]), 10)
+        self.assertEqual(len(response.data["profiles"]), 10)
+        self.assertTrue(response.data["pagination"]["has_more"])
+        self.assertEqual(response.data["users"][0]["username"], "person11")
+
+    def test_filters_by_role_ban_and_search(self):
+        chefs = self.client.get("/admin/users/", {"role": "chef"}).data["users"]
+        self.assertEqual({row["role"] for row in chefs}, {"chef"})
+        self.assertEqual(len(chefs), 4)
+
+        banned = self.client.get("/admin/users/", {"banned": "true"}).data["users"]
+        self.assertEqual([(row["username"], row["is_account_banned"]) for row in banned], [("person4", True)])
+
+        found = self.client.get("/admin/users/", {"search": "p7@"}).data["users"]
+        self.assertEqual([row["username"] for row in found], ["person7"])
+
+    def test_non_admin_is_rejected(self):
+        self.client.force_authenticate(User.objects.get(username="person1"))
+
+        self.assertEqual(self.client.get("/admin/users/").status_code, 403)
+
+
+class TransactionTypeStatusTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="boss", password="pass12345")
+        self.admin.profile.role = "admin"
+        self.admin.profile.save(update_fields=["role"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_admin_site_casing_stays_in_the_queues(self):
+        pending = Pending_transaction.objects.create(chef="chef_pia", type="Subscription", status=" Pending ", amount=10.0)
+        Transaction_history.objects.create(chef="chef_pia", type="SUBSCRIPTION", status="Approved", amount=10.0)
+        pending.status = "PENDING"
+        pending.save(update_fields=["status"])
+
+        pending.refresh_from_db()
+        self.assertEqual((pending.type, pending.status), ("subscription", "pending"))
+        queue = self.client.get("/admin/subscriptions/pending/")
+        self.assertEqual([item["uid"] for item in queue.data["items"]], [str(pending.pk)])
+        history = self.client.get("/admin/subscriptions/history/", {"status": "approved"})
+        self.assertEqual(len(history.data["items"]), 1)
+
+    def test_migration_normalizes_existing_rows(self):
+        migration = importlib.import_module("admin_app.migrations.0013_normalize_transaction_type_status")
+        # bulk_create skips save(), like rows written before the normalization existed.
+        Pending_transaction.objects.bulk_create(
+            [Pending_transaction(chef="chef_pia", type=" Subscription", status="Pending ")]
+        )
+        Transaction_history.objects.bulk_create(
+            [Transaction_history(chef="chef_pia", type="Subscription", status="REJECTED")]
+        )
+
+        migration.normalize_type_and_status(apps, None)
+
+        self.assertEqual(
+            list(Pending_transaction.objects.values_list("type", "status")), [("subscription", "pending")]
+        )
+        self.assertEqual(
+            list(Transaction_history.objects.values_list("type", "status")), [("subscription", "rejected")]
+        )
+
+
+class AdminQueryPlanTests(QueryPlanAssertions, TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="boss", password="pass12345")
+        self.admin.profile.role = "admin"
+        self.admin.profile.save(update_fields=["role"])
+        Pending_transaction.objects.create(chef="chef_pia", type="subscription", status="pending", amount=10.0)
+        Transaction_history.objects.create(chef="chef_pia", type="subscription", status="approved", amount=10.0)
+        User_feedback.objects.create(user="buyer", category="support", subject="Late", message="Where is it?")
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _capture(self, url, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return ctx.captured_queries
+
+    def test_subscription_queue_uses_type_status_index(self):
+        queries = self._capture("/admin/subscriptions/pending/")
+
+        self.assertQueriesUseIndex(queries, Pending_transaction, "pending_tx_type_status_idx")
+
+    def test_subscription_history_uses_type_status_index(self):
+        queries = self._capture("/admin/subscriptions/history/", {"status": "approved"})
+
+        self.assertQueriesUseIndex(queries, Transaction_history, "tx_hist_type_status_idx")
+
+    def test_feedback_triage_uses_status_index(self):
+        queries = self._capture("/admin/user_feedbacks/", {"status": "open"})
+
+        self.assertQueriesUseIndex(queries, User_feedback, "feedback_status_created_idx")
+
+    def test_dashboard_day_partials_range_scan_time_indexes(self):
+        today = timezone.localdate()
+        with CaptureQueriesContext(connection) as ctx:
+            _compute_day_partials(today - timedelta(days=6), today)
+
+        for query in ctx.captured_queries:
+            self.assertNotIn("django_datetime_cast_date", query["sql"].partition(" WHERE ")[2])
+        self.assertQueriesUseIndex(ctx.captured_queries, Campaign, "user_app_campaign_start_time")
+        self.assertQueriesUseIndex(ctx.captured_queries, Order, "user_app_order_order_time")
+        self.assertQueriesUseIndex(ctx.captured_queries, Order_line, "order_line_time_idx")
+        self.assertQueriesUseIndex(ctx.captured_queries, Pending_transaction, "transaction_time")
+
+
+class BenchmarkCommandTests(TestCase):
+    def setUp(self):
+        call_command(
+            "generate_benchmark_data",
+            users=12,
+            chefs=3,
+            orders=150,
+            transactions=20,
+            days=20,
+            batch_size=100,
+            stdout=StringIO(),
+        )
+
+    def test_generator_back_dates_orders_and_builds_rollups(self):
+        self.assertEqual(Order.objects.count() + Order_history.objects.count(), 150)
+        self.assertEqual(User.objects.filter(username__startswith="bench_").count(), 16)
+        self.assertTrue(Order_line.objects.exists())
+        oldest = Order_history.objects.order_by("order_time").values_list("order_time", flat=True).first()
+        self.assertLess(oldest, timezone.now() - timedelta(days=2))
+        self.assertEqual(sum(User_spend_total.objects.values_list("orders", flat=True)), 150)
+        self.assertTrue(Chef_daily_sales.objects.exists())
+
+        with self.assertRaises(CommandError):
+            call_command("generate_benchmark_data", users=1, chefs=1, orders=1, stdout=StringIO())
+
+    def test_runner_reports_every_endpoint(self):
+        out = StringIO()
+        call_command("run_benchmarks", iterations=1, stdout=out, stderr=StringIO())
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report["endpoints"]), {name for name, _role, _path in BENCHMARK_ENDPOINTS})
+        for name, result in report["endpoints"].items():
+            self.assertEqual(result["status"], 200, name)
+            self.assertGreater(result["bytes"], 0, name)
+        self.assertEqual(report["rows"]["user_app.Order_history"], Order_history.objects.count())
@@ -1,7 +1,6 @@
 from rest_framework import generics 
 from rest_framework.response import Response
 from django.contrib.auth import authenticate
-from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 from django.contrib.auth.models import User 
 from admin_app.serializers import *
 from admin_app.models import Profile
@@ -13,6 +12,7 @@ import os
 import uuid
 import logging
 from core.emails import send_password_reset_email
+from core.tokens import tokens_for_user
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class login(generics.GenericAPIView):
         password = request.data.get('password')
         user = authenticate(username = username, password = password)
         if user is not None:
-            refresh = RefreshToken.for_user(user)
+            refresh = tokens_for_user(user)
             user_serializer = UserSerializer(user)
             return Response({
                 'refresh': str(refresh),
@@ -4,14 +4,21 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from notifications.models import Announcement
 from admin_app.serializers import AnnouncementSerializer
+from core.authentication import TokenRoleAuthentication
+from core.pagination import KeysetPaginationMixin
 
-class Announcements(APIView):
+class Announcements(KeysetPaginationMixin, APIView):
+	authentication_classes = [TokenRoleAuthentication]
 	permission_classes = [IsAuthenticated]
+	keyset_field = 'time'
 
 	def get(self, request):
-		announcements = Announcement.objects.all().order_by('-time')
+		announcements, pagination, error = self.paginate_keyset(request, Announcement.objects.all())
+		if error:
+			return error
 		serializer = AnnouncementSerializer(announcements, many=True)
 		return Response({
 			'announcements': serializer.data,
+			'pagination': pagination,
 			'status': status.HTTP_200_OK,
 		})
@@ -3,7 +3,7 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from admin_app.serializers import UserSerializer, ChefSerializer
-from admin_app.models import Profile
+from core.authentication import request_profile
 from user_app.models import Chef
 from rest_framework.pagination import PageNumberPagination
 
@@ -15,7 +15,7 @@ class Chefs(APIView):
 
     def get(self, request):
         user = request.user
-        profile = Profile.objects.filter(user=user).first()
+        profile = request_profile(request)
         if not profile:
             return Response({'message': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1,32 +1,26 @@
 from datetime import timedelta
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Dashboard_report_schedule, Profile
+from admin_app.models import Dashboard_report_schedule
 from admin_app.services.dashboard_reporting import (
+    LEDGER_DATASETS,
     build_dashboard_csv,
     build_dashboard_pdf,
-    build_dashboard_payload,
+    get_dashboard_payload,
+    iter_ledger_csv,
     resolve_range,
 )
+from core.permissions import IsAdmin
 
 
 class AdminOnlyAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    @staticmethod
-    def _admin_guard(request):
-        if not Profile.objects.filter(user=request.user, role="admin").exists():
-            return Response(
-                {"detail": "You are not authorized to access this page."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        return None
+    permission_classes = [IsAuthenticated, IsAdmin]
 
 
 def _get_payload_from_request(request):
@@ -37,15 +31,11 @@ def _get_payload_from_request(request):
     )
     if range_error:
         return None, range_error
-    return build_dashboard_payload(range_info), None
+    return get_dashboard_payload(range_info), None
 
 
 class AdminDashboard(AdminOnlyAPIView):
     def get(self, request):
-        guard = self._admin_guard(request)
-        if guard:
-            return guard
-
         payload, error = _get_payload_from_request(request)
         if error:
             return Response(error, status=status.HTTP_400_BAD_REQUEST)
@@ -83,9 +73,14 @@ class AdminDashboard(AdminOnlyAPIView):
 
 class AdminDashboardExport(AdminOnlyAPIView):
     def get(self, request):
-        guard = self._admin_guard(request)
-        if guard:
-            return guard
+        dataset = str(request.query_params.get("dataset", "dashboard")).strip().lower()
+        if dataset in LEDGER_DATASETS:
+            return self._stream_ledger(request, dataset)
+        if dataset != "dashboard":
+            return Response(
+                {"detail": "Invalid dataset. Use dashboard, orders, or transactions."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         payload, error = _get_payload_from_request(request)
         if error:
@@ -114,13 +109,34 @@ class AdminDashboardExport(AdminOnlyAPIView):
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
+    @staticmethod
+    def _stream_ledger(request, dataset):
+        range_key = str(request.query_params.get("range", "all")).strip().lower()
+        range_info = None
+        if range_key != "all":
+            range_info, range_error = resolve_range(
+                range_key=range_key,
+                start_date_raw=request.query_params.get("start_date"),
+                end_date_raw=request.query_params.get("end_date"),
+            )
+            if range_error:
+                return Response(range_error, status=status.HTTP_400_BAD_REQUEST)
+
+        export_format = str(request.query_params.get("format", "csv")).strip().lower()
+        if export_format != "csv":
+            return Response(
+                {"detail": "Ledger exports are only available as csv."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        suffix = f"{range_info['start_date']}-{range_info['end_date']}" if range_info else "all"
+        response = StreamingHttpResponse(iter_ledger_csv(dataset, range_info), content_type="text/csv")
+        response["Content-Disposition"] = f'attachment; filename="{dataset}-ledger-{suffix}.csv"'
+        return response
+
 
 class DashboardReportScheduleView(AdminOnlyAPIView):
     def get(self, request):
-        guard = self._admin_guard(request)
-        if guard:
-            return guard
-
         schedules = Dashboard_report_schedule.objects.all().order_by("email")
         return Response(
             {
@@ -141,10 +157,6 @@ class DashboardReportScheduleView(AdminOnlyAPIView):
         )
 
     def post(self, request):
-        guard = self._admin_guard(request)
-        if guard:
-            return guard
-
         email = str(request.data.get("email", "")).strip().lower()
         frequency = str(request.data.get("frequency", Dashboard_report_schedule.FREQUENCY_WEEKLY)).strip().lower()
         is_active = bool(request.data.get("is_active", True))
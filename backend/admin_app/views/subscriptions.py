@@ -8,16 +8,19 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Pending_transaction, Profile, Subscription_option, Transaction_history
+from admin_app.models import Pending_transaction, Subscription_option, Transaction_history
 from admin_app.serializers import SubscriptionOptionSerializer
+from core.authentication import request_profile
+from core.pagination import KeysetPaginationMixin
 from user_app.models import Chef
+from user_app.services.order_lines import normalize_chef
 
 
 DEFAULT_PROOF_PATH = "transaction_proofs/demo-proof.png"
 
 
 def _require_admin(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -57,13 +60,6 @@ def _serialize_subscription_tx(item):
     }
 
 
-def _safe_int(value, default):
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return default
-
-
 class SubscriptionOptionListCreate(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -175,19 +171,22 @@ class AvailableSubscriptions(APIView):
         )
 
 
-class AdminSubscriptionPending(APIView):
+class AdminSubscriptionPending(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_field = "transaction_time"
+    page_size = 300
+    max_page_size = 1000
 
     def get(self, request):
         _profile, profile_error = _require_admin(request)
         if profile_error:
             return profile_error
 
-        queryset = Pending_transaction.objects.filter(type__iexact="subscription").order_by("-transaction_time")
+        queryset = Pending_transaction.objects.filter(type="subscription").order_by("-transaction_time")
 
         status_filter = str(request.query_params.get("status", "pending")).strip().lower()
         if status_filter:
-            queryset = queryset.filter(status__iexact=status_filter)
+            queryset = queryset.filter(status=status_filter)
 
         chef_filter = str(request.query_params.get("chef", "")).strip()
         if chef_filter:
@@ -201,8 +200,10 @@ class AdminSubscriptionPending(APIView):
                 | Q(transaction_description__icontains=search)
             )
 
-        limit = max(1, min(_safe_int(request.query_params.get("limit"), 300), 1000))
-        items = list(queryset[:limit])
+        items, pagination, error = self.paginate_keyset(request, queryset)
+        if error:
+            return error
+        limit = pagination["limit"]
 
         summary_qs = queryset
         total_amount = float(summary_qs.aggregate(total=Sum("amount")).get("total") or 0)
@@ -221,6 +222,7 @@ class AdminSubscriptionPending(APIView):
                     "unique_chefs": summary_qs.values("chef").distinct().count(),
                 },
                 "items": [_serialize_subscription_tx(item) for item in items],
+                "pagination": pagination,
                 "status": status.HTTP_200_OK,
             }
         )
@@ -234,7 +236,7 @@ class AdminSubscriptionPendingDetail(APIView):
         if profile_error:
             return profile_error
 
-        pending = Pending_transaction.objects.filter(pk=pending_id, type__iexact="subscription").first()
+        pending = Pending_transaction.objects.filter(pk=pending_id, type="subscription").first()
         if not pending:
             return Response({"message": "Pending subscription request not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -264,7 +266,7 @@ class AdminSubscriptionPendingDetail(APIView):
             amount=float(pending.amount or 0),
         )
 
-        chef = Chef.objects.filter(chef_username__iexact=pending.chef).first()
+        chef = Chef.objects.filter(chef_key=normalize_chef(pending.chef)).first()
         if action == "approve" and chef:
             now = timezone.now()
             months = int(pending.subscription_duration_months or 1)
@@ -290,19 +292,22 @@ class AdminSubscriptionPendingDetail(APIView):
         )
 
 
-class AdminSubscriptionHistory(APIView):
+class AdminSubscriptionHistory(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_field = "transaction_time"
+    page_size = 500
+    max_page_size = 2000
 
     def get(self, request):
         _profile, profile_error = _require_admin(request)
         if profile_error:
             return profile_error
 
-        queryset = Transaction_history.objects.filter(type__iexact="subscription").order_by("-transaction_time")
+        queryset = Transaction_history.objects.filter(type="subscription").order_by("-transaction_time")
 
         status_filter = str(request.query_params.get("status", "")).strip().lower()
         if status_filter:
-            queryset = queryset.filter(status__iexact=status_filter)
+            queryset = queryset.filter(status=status_filter)
 
         chef_filter = str(request.query_params.get("chef", "")).strip()
         if chef_filter:
@@ -317,12 +322,14 @@ class AdminSubscriptionHistory(APIView):
                 | Q(transaction_description__icontains=search)
             )
 
-        limit = max(1, min(_safe_int(request.query_params.get("limit"), 500), 2000))
-        items = list(queryset[:limit])
+        items, pagination, error = self.paginate_keyset(request, queryset)
+        if error:
+            return error
+        limit = pagination["limit"]
 
         approved_statuses = {"approved", "completed", "active"}
         approved_qs = queryset.filter(status__in=approved_statuses)
-        rejected_qs = queryset.filter(status__iexact="rejected")
+        rejected_qs = queryset.filter(status="rejected")
 
         return Response(
             {
@@ -339,6 +346,7 @@ class AdminSubscriptionHistory(APIView):
                     "total_revenue": float(approved_qs.aggregate(total=Sum("amount")).get("total") or 0),
                 },
                 "items": [_serialize_subscription_tx(item) for item in items],
+                "pagination": pagination,
                 "status": status.HTTP_200_OK,
             }
         )
@@ -4,17 +4,32 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from admin_app.models import Pending_transaction, Transaction_history
 from admin_app.serializers import Pending_transactionSerializer, Transaction_historySerializer
+from core.pagination import KeysetPaginationMixin
 
-class Transactions(APIView):
+class Transactions(KeysetPaginationMixin, APIView):
 	permission_classes = [IsAuthenticated]
+	keyset_field = 'transaction_time'
 
 	def get(self, request):
-		pending = Pending_transaction.objects.all()
-		completed = Transaction_history.objects.all()
+		pending, pending_page, error = self.paginate_keyset(
+			request, Pending_transaction.objects.all(), cursor_param='pending_cursor'
+		)
+		if error:
+			return error
+		completed, completed_page, error = self.paginate_keyset(
+			request, Transaction_history.objects.all(), cursor_param='completed_cursor'
+		)
+		if error:
+			return error
+
 		pending_serializer = Pending_transactionSerializer(pending, many=True)
 		completed_serializer = Transaction_historySerializer(completed, many=True)
 		return Response({
 			'pending_transactions': pending_serializer.data,
 			'completed_transactions': completed_serializer.data,
+			'pagination': {
+				'pending': pending_page,
+				'completed': completed_page,
+			},
 			'status': status.HTTP_200_OK,
 		})
@@ -4,8 +4,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile, User_feedback
+from admin_app.models import User_feedback
 from admin_app.serializers import User_feedbackSerializer
+from core.authentication import request_profile
+from core.pagination import KeysetPaginationMixin
 
 
 ALLOWED_STATUSES = {
@@ -25,7 +27,7 @@ ALLOWED_CATEGORIES = {
 
 
 def _require_admin(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -49,8 +51,11 @@ def _build_summary(queryset):
     }
 
 
-class UserFeedbacksAdmin(APIView):
+class UserFeedbacksAdmin(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_field = "created_at"
+    page_size = 200
+    max_page_size = 1000
 
     def get(self, request):
         _profile, profile_error = _require_admin(request)
@@ -97,14 +102,10 @@ class UserFeedbacksAdmin(APIView):
                 | Q(admin_notes__icontains=search)
             )
 
-        limit_raw = request.query_params.get("limit", 200)
-        try:
-            limit = int(limit_raw)
-        except (TypeError, ValueError):
-            limit = 200
-        limit = max(1, min(limit, 1000))
-
-        items = list(queryset[:limit])
+        items, pagination, error = self.paginate_keyset(request, queryset)
+        if error:
+            return error
+        limit = pagination["limit"]
 
         return Response(
             {
@@ -117,6 +118,7 @@ class UserFeedbacksAdmin(APIView):
                 },
                 "summary": _build_summary(queryset),
                 "feedbacks": User_feedbackSerializer(items, many=True).data,
+                "pagination": pagination,
                 "status": status.HTTP_200_OK,
             }
         )
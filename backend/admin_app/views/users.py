@@ -3,19 +3,63 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
-from admin_app.models import Profile
-from admin_app.serializers import UserSerializer, ProfileSerializer
+from django.db.models import Q
+from admin_app.serializers import AdminUserSerializer, ProfileSerializer
+from core.pagination import KeysetPaginationMixin
+from core.permissions import IsAdmin
 
-class UsersList(APIView):
-	permission_classes = [IsAuthenticated]
+
+def _parse_bool(value):
+	value = str(value or "").strip().lower()
+	if value in {"1", "true", "yes"}:
+		return True
+	if value in {"0", "false", "no"}:
+		return False
+	return None
+
+
+class UsersList(KeysetPaginationMixin, APIView):
+	permission_classes = [IsAuthenticated, IsAdmin]
+	# auth_user ids grow with date_joined, so the primary key alone gives newest-first pages.
+	keyset_field = None
+	page_size = 100
+	max_page_size = 500
 
 	def get(self, request):
-		users = User.objects.all()
-		users_serializer = UserSerializer(users, many=True)
-		profiles = Profile.objects.all()
-		profiles_serializer = ProfileSerializer(profiles, many=True)
+		users_qs = User.objects.select_related('profile')
+
+		role = str(request.query_params.get('role', '')).strip().lower()
+		if role:
+			users_qs = users_qs.filter(profile__role=role)
+
+		banned = _parse_bool(request.query_params.get('banned'))
+		if banned is not None:
+			users_qs = users_qs.filter(profile__is_account_banned=banned)
+
+		search = str(request.query_params.get('search', '')).strip()
+		if search:
+			users_qs = users_qs.filter(
+				Q(username__icontains=search)
+				| Q(email__icontains=search)
+				| Q(first_name__icontains=search)
+				| Q(last_name__icontains=search)
+			)
+
+		users, pagination, error = self.paginate_keyset(request, users_qs)
+		if error:
+			return error
+
+		# Profiles came in with the users; no second query.
+		profiles = [user.profile for user in users if hasattr(user, 'profile')]
 		return Response({
-			'users': users_serializer.data,
-			'profiles': profiles_serializer.data,
+			'filters': {
+				'role': role,
+				'banned': banned,
+				'search': search,
+				'limit': pagination['limit'],
+			},
+			'users': AdminUserSerializer(users, many=True).data,
+			'profiles': ProfileSerializer(profiles, many=True).data,
+			'pagination': pagination,
 			'status': status.HTTP_200_OK,
 		})
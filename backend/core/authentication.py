@@ -0,0 +1,87 @@
+# backend/core/authentication.py
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.tokens import check_token_not_denied
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` that loads the user's ``Profile`` in the same query.
+
+    Role checks then read ``request.user.profile`` from memory instead of issuing their
+    own ``Profile`` lookup, so the profile costs nothing beyond the user fetch. Tokens
+    revoked through ``core.tokens.deny_user_tokens`` are rejected against that profile.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        try:
+            user = self.user_model._default_manager.select_related("profile").get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        check_token_not_denied(validated_token, user_profile(user))
+        return user
+
+
+class TokenRoleAuthentication(ProfileJWTAuthentication):
+    """Stateless variant for read-only endpoints: ``request.user`` is the configured
+    ``TokenUser`` built from the ``username``/``role`` claims, with no database lookup.
+
+    Tokens issued before role claims existed fall back to loading the user. Revocation is
+    checked against the cached ``auth_ver``; the token's role is at most one access-token
+    lifetime old, since refreshing re-reads it from the profile.
+    """
+
+    def get_validated_token(self, raw_token):
+        return check_token_not_denied(super().get_validated_token(raw_token))
+
+    def get_user(self, validated_token):
+        if "role" not in validated_token:
+            return super().get_user(validated_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        return api_settings.TOKEN_USER_CLASS(validated_token)
+
+
+def user_profile(user):
+    """The user's ``Profile`` (loaded at most once per user object), or ``None``."""
+    if user is None or not user.is_authenticated or isinstance(user, api_settings.TOKEN_USER_CLASS):
+        return None
+    try:
+        return user.profile
+    except ObjectDoesNotExist:
+        return None
+
+
+def request_profile(request):
+    return user_profile(getattr(request, "user", None))
+
+
+def user_role(user):
+    if isinstance(user, api_settings.TOKEN_USER_CLASS):
+        return user.token.get("role")
+    profile = user_profile(user)
+    return profile.role if profile else None
+
+
+def request_role(request):
+    return user_role(getattr(request, "user", None))
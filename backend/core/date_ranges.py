@@ -0,0 +1,31 @@
+# backend/core/date_ranges.py
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+
+def day_start(day):
+    """Aware datetime for local midnight at the start of ``day``."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def date_bounds(start_date, end_date):
+    """Half-open ``[start, end)`` datetimes covering the local days ``start_date..end_date``.
+
+    Filtering ``field__gte=start, field__lt=end`` compares the raw column, so the database
+    can range-scan an index on it; ``field__date__gte`` wraps the column in a date cast and
+    has to evaluate every row.
+    """
+    return day_start(start_date), day_start(end_date + timedelta(days=1))
+
+
+def range_bounds(range_info):
+    """``date_bounds`` for the dict returned by the dashboards' ``resolve_range``."""
+    return date_bounds(range_info["start_date"], range_info["end_date"])
+
+
+def in_date_range(field, start_date, end_date):
+    start, end = date_bounds(start_date, end_date)
+    return Q(**{f"{field}__gte": start, f"{field}__lt": end})
@@ -0,0 +1,157 @@
+# backend/core/events.py
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from core.authentication import TokenRoleAuthentication
+
+
+class Subscription:
+    """One listener's bounded mailbox, bound to the event loop that created it.
+
+    Publishers run in worker threads (sync views, ORM signals), so messages are handed
+    to the loop with ``call_soon_threadsafe``. A listener that falls ``maxsize`` messages
+    behind is told to resync instead of growing without bound.
+    """
+
+    RESYNC = {"event": "resync", "data": {}}
+
+    def __init__(self, broker, channel, maxsize):
+        self.broker = broker
+        self.channel = channel
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._overflowed = False
+
+    def deliver(self, message):
+        self._loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message):
+        if self._overflowed:
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._overflowed = True
+
+    async def get(self, timeout=None):
+        if self._overflowed and self._queue.empty():
+            self._overflowed = False
+            return self.RESYNC
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """In-process pub/sub that stands in for an external broker.
+
+    Every subscriber to a channel in this process receives each published message. A
+    multi-process deployment swaps in a broker class with the same ``publish`` /
+    ``subscribe`` / ``unsubscribe`` methods through ``settings.EVENT_BROKER``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, channel, maxsize=None):
+        subscription = Subscription(self, channel, maxsize or _mailbox_size())
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            listeners = self._subscribers.get(subscription.channel)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscribers[subscription.channel]
+
+    def publish(self, channel, message):
+        with self._lock:
+            listeners = list(self._subscribers.get(channel, ()))
+        for subscription in listeners:
+            subscription.deliver(message)
+        return len(listeners)
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+def _mailbox_size():
+    return int(getattr(settings, "EVENT_STREAM_MAILBOX_SIZE", 256))
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(getattr(settings, "EVENT_BROKER", "core.events.LocalBroker"))()
+
+
+def publish_event(channel, event, data):
+    """Publish ``data`` to ``channel`` once the surrounding transaction commits."""
+    message = {"event": event, "data": json.loads(json.dumps(data, cls=DjangoJSONEncoder))}
+    transaction.on_commit(lambda: get_broker().publish(channel, message))
+
+
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'))}\n\n"
+
+
+async def _event_stream(subscription, ready):
+    keepalive = int(getattr(settings, "EVENT_STREAM_KEEPALIVE", 15))
+    try:
+        yield "retry: 5000\n\n"
+        yield format_sse("ready", ready)
+        while True:
+            try:
+                message = await subscription.get(timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(message["event"], message["data"])
+    finally:
+        subscription.close()
+
+
+def sse_response(subscription, ready=None):
+    """Stream a subscription as ``text/event-stream``; needs the ASGI application to stay open."""
+    response = StreamingHttpResponse(_event_stream(subscription, ready or {}), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _authenticate(request):
+    authenticator = TokenRoleAuthentication()
+    try:
+        result = authenticator.authenticate(request)
+        if result is None:
+            # EventSource cannot send headers, so browsers pass the access token as ``?token=``.
+            raw_token = request.GET.get("token")
+            if not raw_token:
+                return None
+            validated = authenticator.get_validated_token(raw_token)
+            return authenticator.get_user(validated)
+        return result[0]
+    except (AuthenticationFailed, InvalidToken):
+        return None
+
+
+async def authenticate_stream(request):
+    """Resolve the JWT user for an async (non-DRF) streaming view, or ``None``."""
+    return await sync_to_async(_authenticate)(request)
@@ -11,5 +11,30 @@ class core_model(models.Model):
         abstract = True
 
 
+def normalize_username(username):
+    return str(username or "").strip().lower()
+
+
+class chef_keyed_model(core_model):
+    """Keeps an indexed lower-case ``chef_key`` in step with the username column.
+
+    Chef-scoped lookups filter on ``chef_key=...`` equality instead of ``chef__iexact``,
+    which cannot use a plain B-tree index.
+    """
+
+    chef_key_source = "chef"
+    chef_key = models.CharField(max_length=100, default="", blank=True, editable=False, db_index=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.chef_key = normalize_username(getattr(self, self.chef_key_source))
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and self.chef_key_source in update_fields:
+            kwargs["update_fields"] = {*update_fields, "chef_key"}
+        super().save(*args, **kwargs)
+
+
 # class site_settings():
 #     domain = models.CharField( max_length=100 , null=True , blank=True )
\ No newline at end of file
@@ -0,0 +1,113 @@
+# backend/core/pagination.py
+
+import base64
+import json
+
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def _encode_cursor(payload):
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    if not isinstance(payload, dict) or "k" not in payload:
+        raise ValueError("Malformed cursor")
+    return payload
+
+
+class KeysetPaginationMixin:
+    """Opaque-cursor pagination for plain ``APIView`` lists.
+
+    Rows are ordered newest first on ``keyset_field`` (an indexed time column) with the
+    primary key as tie-breaker, and each page continues with a ``WHERE (time, pk) < cursor``
+    seek instead of an OFFSET, so every page costs the same however deep the client goes.
+    Set ``keyset_field = None`` to page on the primary key alone.
+    """
+
+    keyset_field = "order_time"
+    page_size = 50
+    max_page_size = 200
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get("limit") or self.page_size)
+        except (TypeError, ValueError):
+            size = self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def keyset_order(self, queryset):
+        pk_name = queryset.model._meta.pk.name
+        if not self.keyset_field:
+            return queryset.order_by(F(pk_name).desc())
+        return queryset.order_by(F(self.keyset_field).desc(nulls_last=True), F(pk_name).desc())
+
+    def _seek(self, queryset, payload):
+        pk_field = queryset.model._meta.pk
+        pk_value = pk_field.to_python(payload["k"])
+        if not self.keyset_field:
+            return queryset.filter(**{f"{pk_field.name}__lt": pk_value})
+
+        field = self.keyset_field
+        if payload.get("t") is None:
+            return queryset.filter(**{f"{field}__isnull": True, f"{pk_field.name}__lt": pk_value})
+
+        time_value = parse_datetime(str(payload["t"]))
+        if time_value is None:
+            raise ValueError("Malformed cursor time")
+        return queryset.filter(
+            Q(**{f"{field}__lt": time_value})
+            | Q(**{field: time_value, f"{pk_field.name}__lt": pk_value})
+            | Q(**{f"{field}__isnull": True})
+        )
+
+    def keyset_sort_key(self, row):
+        """Python-side equivalent of ``keyset_order`` (sort with ``reverse=True``) for merging pages."""
+        if not self.keyset_field:
+            return row.pk
+        value = getattr(row, self.keyset_field)
+        return (value is not None, value.timestamp() if value else 0.0, str(row.pk))
+
+    def cursor_for(self, row):
+        payload = {"k": str(row.pk)}
+        if self.keyset_field:
+            value = getattr(row, self.keyset_field)
+            payload["t"] = value.isoformat() if value else None
+        return _encode_cursor(payload)
+
+    def apply_cursor(self, request, queryset, cursor_param="cursor"):
+        """Order ``queryset`` for keyset paging and seek past ``?cursor=``; returns ``(queryset, error_response)``."""
+        queryset = self.keyset_order(queryset)
+        cursor = str(request.query_params.get(cursor_param) or "").strip()
+        if not cursor:
+            return queryset, None
+        try:
+            return self._seek(queryset, _decode_cursor(cursor)), None
+        except Exception:
+            return None, Response({"message": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build_page(self, rows, page_size):
+        """Trim ``page_size + 1`` ordered rows to one page and describe how to continue."""
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        pagination = {
+            "limit": page_size,
+            "has_more": has_more,
+            "next_cursor": self.cursor_for(rows[-1]) if has_more and rows else None,
+        }
+        return rows, pagination
+
+    def paginate_keyset(self, request, queryset, cursor_param="cursor"):
+        """Return ``(rows, pagination, error_response)`` for one page of ``queryset``."""
+        queryset, error = self.apply_cursor(request, queryset, cursor_param)
+        if error:
+            return None, None, error
+        page_size = self.get_page_size(request)
+        rows, pagination = self.build_page(list(queryset[: page_size + 1]), page_size)
+        return rows, pagination, None
@@ -0,0 +1,28 @@
+# backend/core/permissions.py
+
+from rest_framework.permissions import BasePermission
+
+from core.authentication import request_role
+
+
+class HasRole(BasePermission):
+    """Allow authenticated users whose ``Profile.role`` is in ``allowed_roles``."""
+
+    allowed_roles = frozenset()
+    message = "You are not authorized to access this page."
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and request_role(request) in self.allowed_roles)
+
+
+class IsChef(HasRole):
+    allowed_roles = frozenset({"chef"})
+
+
+class IsAdmin(HasRole):
+    allowed_roles = frozenset({"admin"})
+
+
+class IsChefOrAdmin(HasRole):
+    allowed_roles = frozenset({"chef", "admin"})
@@ -0,0 +1,53 @@
+# backend/core/testing.py
+
+import re
+
+from django.db import connection
+
+
+def explain(sql):
+    """Return the database's query plan for ``sql`` as one string.
+
+    PostgreSQL would seq-scan the tiny test tables regardless of indexes, so sequential
+    scans are disabled for the rest of the test transaction before explaining.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+        if connection.vendor == "postgresql":
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {sql}")
+        return "\n".join(str(row[0]) for row in cursor.fetchall())
+
+
+def _reads_table(sql, table):
+    return sql.lstrip().upper().startswith("SELECT") and re.search(rf'\bFROM "{re.escape(table)}"', sql) is not None
+
+
+def _is_full_scan(plan, table):
+    # SQLite: "SCAN <table>" (optionally "USING INDEX", which still walks every entry);
+    # PostgreSQL: "Seq Scan on <table>".
+    return re.search(rf"\b(SCAN {re.escape(table)}\b|Seq Scan on {re.escape(table)}\b)", plan) is not None
+
+
+class QueryPlanAssertions:
+    """Mixin for ``TestCase`` subclasses that check captured queries against their plans."""
+
+    def assertQueriesUseIndex(self, captured_queries, model, *index_names):
+        """No captured read of ``model``'s table is a full scan, and each index in ``index_names``
+        serves at least one of them."""
+        table = model._meta.db_table
+        plans = [
+            (query["sql"], explain(query["sql"]))
+            for query in captured_queries
+            if _reads_table(query["sql"], table)
+        ]
+        self.assertTrue(plans, f"No query read {table}.")
+        for sql, plan in plans:
+            self.assertFalse(_is_full_scan(plan, table), f"Full scan of {table}:\n{sql}\n{plan}")
+        for index_name in index_names:
+            self.assertTrue(
+                any(index_name in plan for _sql, plan in plans),
+                f"{index_name} unused:\n" + "\n".join(plan for _sql, plan in plans),
+            )
@@ -0,0 +1,97 @@
+# backend/core/tokens.py
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+TOKEN_DENYLIST_PREFIX = "auth:denylist"
+TOKEN_VERSION_CLAIM = "auth_ver"
+
+
+def _denylist_key(user_id):
+    return f"{TOKEN_DENYLIST_PREFIX}:{user_id}"
+
+
+def _profile_version(profile):
+    return int(getattr(profile, TOKEN_VERSION_CLAIM, 0) or 0)
+
+
+def deny_user_tokens(profile):
+    """Revoke every token issued to ``profile.user`` so far by bumping ``Profile.auth_ver``.
+
+    The column is the record: refreshes and database-backed authentication refuse tokens
+    stamped with an older ``auth_ver``. The new version is also cached for one access-token
+    lifetime so the stateless read-only endpoints can refuse old access tokens without a
+    query; where the cache is per-process, other workers stop accepting them when they
+    expire, since they can no longer be refreshed.
+    """
+    profiles = type(profile).objects.filter(pk=profile.pk)
+    profiles.update(auth_ver=F(TOKEN_VERSION_CLAIM) + 1)
+    profile.auth_ver = profiles.values_list(TOKEN_VERSION_CLAIM, flat=True).get()
+    lifetime = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    cache.set(_denylist_key(profile.user_id), _profile_version(profile), lifetime)
+
+
+def is_token_denied(token, profile=None):
+    """Compare the token's ``auth_ver`` with ``profile`` when it was loaded, else with the cache."""
+    if profile is not None:
+        current = _profile_version(profile)
+    else:
+        current = int(cache.get(_denylist_key(token.get(api_settings.USER_ID_CLAIM))) or 0)
+    return int(token.get(TOKEN_VERSION_CLAIM) or 0) < current
+
+
+def check_token_not_denied(token, profile=None):
+    if is_token_denied(token, profile):
+        raise InvalidToken(_("Token has been revoked."))
+    return token
+
+
+def stamp_role_claims(token, user):
+    """Embed ``username`` and ``role`` so read-only endpoints can authorize from the token alone,
+    plus the revocation version the token was issued under."""
+    from core.authentication import user_profile
+
+    profile = user_profile(user)
+    token["username"] = user.get_username()
+    token["role"] = profile.role if profile else "user"
+    token[TOKEN_VERSION_CLAIM] = _profile_version(profile)
+    return token
+
+
+def tokens_for_user(user):
+    """Refresh/access pair carrying the role claims; access tokens get them re-stamped on refresh."""
+    return stamp_role_claims(RefreshToken.for_user(user), user)
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return stamp_role_claims(super().get_token(user), user)
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """Check the refresh token against the user's current ``Profile`` and re-stamp its claims,
+    so access tokens minted from it carry the role the user has now, not the one at login."""
+
+    def validate(self, attrs):
+        from core.authentication import user_profile
+
+        refresh = self.token_class(attrs["refresh"])
+        user = (
+            get_user_model()
+            ._default_manager.select_related("profile")
+            .filter(**{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)})
+            .first()
+        )
+        if user is None:
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        check_token_not_denied(refresh, user_profile(user))
+        stamp_role_claims(refresh, user)
+        return super().validate({**attrs, "refresh": str(refresh)})
@@ -13,6 +13,7 @@ urlpatterns = [
     path('auth/reset-password/', reset_password.as_view()),
     path('auth/token/refresh/', TokenRefreshView.as_view()),
     path('admin/', include('admin_app.urls')),
+    path('notifications/', include('notifications.urls')),
     path('', include('home_app.urls')),
     path('', include('user_app.urls')),
     # path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -0,0 +1 @@
+# home_app/management
\ No newline at end of file
@@ -0,0 +1 @@
+# home_app/management/commands
\ No newline at end of file
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from home_app.services.home_feed import refresh_home_feed
+
+
+class Command(BaseCommand):
+    help = "Recompute popular foods and re-warm the cached public home feed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep running and refresh every N seconds (default: refresh once and exit).",
+        )
+
+    def handle(self, *args, **options):
+        interval = max(int(options["interval"] or 0), 0)
+        while True:
+            payload = refresh_home_feed()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Home feed refreshed. Campaigns: {len(payload['campaigns'])}, "
+                    f"Featured foods: {len(payload['featured_foods'])}."
+                )
+            )
+            if not interval:
+                return
+            time.sleep(interval)
@@ -0,0 +1 @@
+# home_app/services
\ No newline at end of file
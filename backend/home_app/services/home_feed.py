@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Q, Sum
+from django.utils import timezone
+from rest_framework import status
+
+from admin_app.serializers import ChefSerializer, FoodSerializer
+from user_app.models import Campaign, Chef, Food, Order_line
+from user_app.services.campaign_serialization import serialize_public_campaigns
+
+
+HOME_FEED_CACHE_KEY = "home_feed:payload"
+POPULAR_FOODS_CACHE_KEY = "home_feed:popular_foods"
+
+
+def _feed_ttl():
+    return int(getattr(settings, "HOME_FEED_CACHE_TTL", 60))
+
+
+def _popular_foods_ttl():
+    return int(getattr(settings, "HOME_FEED_POPULAR_FOODS_TTL", 900))
+
+
+def compute_popular_foods(limit=5):
+    """Rank foods by quantity across pending orders with one grouped query on ``Order_line``."""
+    ranking = list(
+        Order_line.objects.filter(order__isnull=False, food__isnull=False)
+        .values("food_id")
+        .annotate(total=Sum("quantity"))
+        .order_by("-total")[:limit]
+    )
+    food_ids = [row["food_id"] for row in ranking]
+    foods = {food.uid: food for food in Food.objects.filter(uid__in=food_ids)}
+    return [FoodSerializer(foods[food_id]).data for food_id in food_ids if food_id in foods]
+
+
+def refresh_popular_foods():
+    popular_foods = compute_popular_foods()
+    cache.set(POPULAR_FOODS_CACHE_KEY, popular_foods, _popular_foods_ttl())
+    return popular_foods
+
+
+def get_popular_foods():
+    popular_foods = cache.get(POPULAR_FOODS_CACHE_KEY)
+    if popular_foods is None:
+        popular_foods = refresh_popular_foods()
+    return popular_foods
+
+
+def build_home_feed():
+    now = timezone.now()
+    running_campaigns = Campaign.objects.filter(
+        Q(status="running")
+        & Q(start_time__lte=now)
+        & (Q(end_time__gte=now) | Q(end_time__isnull=True))
+        & Q(quantity_available__gte=1)
+    ).order_by("-start_time")
+    campaigns_data = serialize_public_campaigns(running_campaigns)
+
+    top_chefs = Chef.objects.order_by("-total_campaigns", "-this_month_sales")[:5]
+
+    return {
+        "campaigns": campaigns_data,
+        "featured_foods": get_popular_foods(),
+        "top_chefs": ChefSerializer(top_chefs, many=True).data,
+        "statistics": {
+            "total_campaigns_running": len(campaigns_data),
+            "total_food_items_available": Food.objects.count(),
+            "total_users": User.objects.count(),
+            "total_chefs": Chef.objects.count(),
+        },
+        "status": status.HTTP_200_OK,
+    }
+
+
+def get_home_feed():
+    payload = cache.get(HOME_FEED_CACHE_KEY)
+    if payload is None:
+        payload = build_home_feed()
+        cache.set(HOME_FEED_CACHE_KEY, payload, _feed_ttl())
+    return payload
+
+
+def refresh_home_feed():
+    """Recompute popular foods and re-warm the feed; run from the background refresher."""
+    refresh_popular_foods()
+    payload = build_home_feed()
+    cache.set(HOME_FEED_CACHE_KEY, payload, _feed_ttl())
+    return payload
+
+
+def invalidate_home_feed(**kwargs):
+    cache.delete(HOME_FEED_CACHE_KEY)
@@ -0,0 +1,26 @@
+# home_app/signals.py
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from home_app.services.home_feed import invalidate_home_feed
+from user_app.models import Campaign, Chef, Food
+
+
+# Only changes to what the landing page renders drop the cached feed; popular foods are
+# left to the background refresher. Order placement writes campaign stock with
+# QuerySet.update(), so place_order drops the feed itself.
+for model in (Campaign, Food, Chef):
+    post_save.connect(invalidate_home_feed, sender=model, dispatch_uid=f"home_feed_save_{model.__name__}")
+    post_delete.connect(invalidate_home_feed, sender=model, dispatch_uid=f"home_feed_delete_{model.__name__}")
+
+
+@receiver(post_save, sender=User, dispatch_uid="home_feed_save_User")
+def invalidate_home_feed_on_signup(sender, instance, created, **kwargs):
+    # The feed only shows the user count; logins (``last_login``) and profile edits leave it alone.
+    if created:
+        invalidate_home_feed()
+
+
+post_delete.connect(invalidate_home_feed, sender=User, dispatch_uid="home_feed_delete_User")
@@ -1,3 +1,82 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from user_app.models import Campaign, Food, Order
+from user_app.services.order_placement import place_order
+
+
+class HomeFeedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.soup = Food.objects.create(food_name="Soup", chef="chef_ed", food_price=3.0)
+        self.campaign = Campaign.objects.create(
+            chef="chef_ed",
+            title="Soup Night",
+            food_items={str(self.soup.uid): 10},
+            start_time=timezone.now() - timedelta(hours=1),
+            quantity_available=10,
+        )
+
+    def test_cached_feed_is_served_without_queries(self):
+        self.client.get("/")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([campaign["id"] for campaign in response.data["campaigns"]], [str(self.campaign.uid)])
+
+    def test_campaign_change_invalidates_feed(self):
+        self.client.get("/")
+
+        self.campaign.status = "completed"
+        self.campaign.save(update_fields=["status"])
+
+        response = self.client.get("/")
+        self.assertEqual(response.data["campaigns"], [])
+
+    def test_refresher_ranks_popular_foods(self):
+        tea = Food.objects.create(food_name="Tea", chef="chef_ed", food_price=1.0)
+        Order.objects.create(user="buyer", quantity=1, food_items={str(self.soup.uid): 1})
+        Order.objects.create(user="buyer", quantity=5, food_items={str(tea.uid): 5})
+
+        call_command("refresh_home_feed", stdout=StringIO())
+
+        response = self.client.get("/")
+        self.assertEqual(
+            [food["uid"] for food in response.data["featured_foods"]],
+            [str(tea.uid), str(self.soup.uid)],
+        )
+
+    def test_logins_keep_cached_feed(self):
+        buyer = User.objects.create_user(username="buyer", password="pass12345")
+        self.client.get("/")
+
+        buyer.last_login = timezone.now()
+        buyer.save(update_fields=["last_login"])
+
+        with self.assertNumQueries(0):
+            self.client.get("/")
+
+    def test_placed_order_refreshes_feed_stock(self):
+        buyer = User.objects.create_user(username="buyer", password="pass12345")
+        self.client.get("/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            _order, _campaign, error = place_order(
+                user=buyer,
+                campaign_id=str(self.campaign.uid),
+                requested_items={str(self.soup.uid): 3},
+            )
 
-# Create your tests here.
+        self.assertIsNone(error)
+        response = self.client.get("/")
+        self.assertEqual(response.data["campaigns"][0]["food_items"][0]["campaign_quantity"], 7)
@@ -8,3 +8,4 @@ from notifications.models import *
 admin.site.register(Notification),
 admin.site.register(Announcement),
 admin.site.register(Error_log),
+admin.site.register(Announcement_receipt),
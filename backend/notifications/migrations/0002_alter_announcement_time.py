@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='announcement',
+            name='time',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:31
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_alter_announcement_time'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Announcement_receipt',
+            fields=[
+                ('uid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('username', models.CharField(default='', max_length=100)),
+                ('seen_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='announcement',
+            name='sender',
+            field=models.CharField(default='Admin', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='announcement_receipt',
+            name='announcement',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='notifications.announcement'),
+        ),
+        migrations.AddConstraint(
+            model_name='announcement_receipt',
+            constraint=models.UniqueConstraint(fields=('username', 'announcement'), name='unique_announcement_receipt'),
+        ),
+    ]
@@ -13,19 +13,43 @@ class Notification(core_model):
     is_seen = models.BooleanField(default=False)
     time = models.DateTimeField(auto_now_add=True, null=True, blank=True )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["username", "is_seen"], name="notification_unread_idx"),
+        ]
+
     def __str__(self):
         return f"{self.uid}"
 
 
 class Announcement(core_model):
+    """Broadcast content stored once; per-user read state lives in ``Announcement_receipt``."""
+
+    TARGET_ALL = "all"
+    TARGET_CHEFS = "chefs"
+
     target = models.CharField(max_length=100, default="")
+    sender = models.CharField(max_length=100, default="Admin")
     title = models.CharField(max_length=300, default="Notification title")
     message = HTMLField( default="message")
-    time = models.DateTimeField(auto_now_add=True, null=True, blank=True )
+    time = models.DateTimeField(auto_now_add=True, null=True, blank=True, db_index=True)
 
     def __str__(self):
         return f"{self.uid}"
 
+class Announcement_receipt(core_model):
+    announcement = models.ForeignKey(Announcement, on_delete=models.CASCADE, related_name="receipts")
+    username = models.CharField(max_length=100, default="")
+    seen_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["username", "announcement"], name="unique_announcement_receipt"),
+        ]
+
+    def __str__(self):
+        return f"{self.username}: {self.announcement_id}"
+
 class Error_log(core_model):
     occured = models.CharField(max_length=100, default="")
     title = models.CharField(max_length=300, default="Notification title")
@@ -34,5 +58,3 @@ class Error_log(core_model):
 
     def __str__(self):
         return f"{self.uid}"
-
-
@@ -0,0 +1 @@
+# notifications/services
\ No newline at end of file
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef
+
+from admin_app.models import Profile
+from core.authentication import user_profile
+from notifications.models import Announcement, Announcement_receipt, Notification
+
+
+def announce(*, target, title, message, sender="Admin"):
+    """Store a broadcast once; recipients resolve it at read time.
+
+    The INSERT plus one UPDATE that bumps the audience's unread counters (see
+    ``notifications.signals``) replace a per-user copy of the message.
+    """
+    return Announcement.objects.create(target=target, title=title, message=message, sender=sender)
+
+
+def audience_profiles(target):
+    if target == Announcement.TARGET_CHEFS:
+        return Profile.objects.filter(role="chef")
+    return Profile.objects.all()
+
+
+def audience_size(target):
+    if target == Announcement.TARGET_CHEFS:
+        return audience_profiles(target).count()
+    return User.objects.count()
+
+
+def _targets_for(user):
+    targets = ["", Announcement.TARGET_ALL]
+    profile = user_profile(user)
+    if profile and profile.role == "chef":
+        targets.append(Announcement.TARGET_CHEFS)
+    return targets
+
+
+def announcements_for(user):
+    """Broadcasts addressed to ``user``, annotated with ``is_seen`` from their receipt (if any).
+
+    Only broadcasts sent after the account was created are included, matching what a
+    per-user copy made at send time would have delivered.
+    """
+    receipts = Announcement_receipt.objects.filter(announcement=OuterRef("pk"), username=user.username)
+    queryset = Announcement.objects.filter(target__in=_targets_for(user))
+    if user.date_joined:
+        queryset = queryset.filter(time__gte=user.date_joined)
+    return queryset.annotate(is_seen=Exists(receipts))
+
+
+def unread_announcements(user):
+    return announcements_for(user).filter(is_seen=False)
+
+
+def mark_announcements_seen(username, announcement_ids):
+    """Create the missing receipts for ``announcement_ids``; returns how many were new."""
+    seen = {
+        str(pk)
+        for pk in Announcement_receipt.objects.filter(
+            username=username, announcement_id__in=announcement_ids
+        ).values_list("announcement_id", flat=True)
+    }
+    new_ids = [pk for pk in announcement_ids if str(pk) not in seen]
+    Announcement_receipt.objects.bulk_create(
+        [Announcement_receipt(announcement_id=pk, username=username) for pk in new_ids],
+        ignore_conflicts=True,
+    )
+    return len(new_ids)
+
+
+def serialize_inbox_item(item):
+    is_announcement = isinstance(item, Announcement)
+    return {
+        "id": str(item.uid),
+        "kind": "announcement" if is_announcement else "notification",
+        "sender": item.sender,
+        "title": item.title,
+        "message": item.message,
+        "is_seen": bool(item.is_seen),
+        "time": item.time,
+    }
+
+
+def inbox_sources(user):
+    """Direct notifications and broadcasts for ``user``; both are ordered on ``(time, uid)``."""
+    return Notification.objects.filter(username=user.username), announcements_for(user)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Value
+from django.db.models.functions import Greatest
+
+from admin_app.models import Profile
+from notifications.models import Announcement_receipt, Notification
+from notifications.services.broadcasts import audience_profiles, mark_announcements_seen, unread_announcements
+
+
+def unread_count(user):
+    """The user's unread badge: one primary-key read of ``Profile.unread_notifications``.
+
+    The counter lives in the database, so every worker sees the same value, and reading it
+    does not grow with the number of broadcasts.
+    """
+    value = Profile.objects.filter(user_id=user.pk).values_list("unread_notifications", flat=True).first()
+    return int(value or 0)
+
+
+def _shifted(delta):
+    return Greatest(F("unread_notifications") + delta, Value(0))
+
+
+def adjust_unread(username, delta):
+    """Shift one user's counter in place; it never drops below zero."""
+    if not delta:
+        return
+    Profile.objects.filter(user__username=username).update(unread_notifications=_shifted(delta))
+
+
+def announcement_sent(announcement):
+    """One UPDATE bumps the counter of everyone the broadcast is addressed to."""
+    audience_profiles(announcement.target).update(unread_notifications=_shifted(1))
+
+
+def announcement_withdrawn(announcement):
+    """Take a deleted broadcast off the counters of recipients who had not read it yet."""
+    receipts = Announcement_receipt.objects.filter(announcement=announcement, username=OuterRef("user__username"))
+    recipients = audience_profiles(announcement.target).filter(~Exists(receipts))
+    if announcement.time:
+        recipients = recipients.filter(user__date_joined__lte=announcement.time)
+    recipients.update(unread_notifications=_shifted(-1))
+
+
+def mark_all_seen(user):
+    """Mark every direct notification seen with one UPDATE, receipt the unread broadcasts and zero the counter."""
+    with transaction.atomic():
+        # Reset first: the row lock makes a concurrent new notification's increment land afterwards.
+        Profile.objects.filter(user_id=user.pk).update(unread_notifications=0)
+        updated = Notification.objects.filter(username=user.username, is_seen=False).update(is_seen=True)
+        announcement_ids = list(unread_announcements(user).values_list("uid", flat=True))
+        created = mark_announcements_seen(user.username, announcement_ids) if announcement_ids else 0
+    return updated + created
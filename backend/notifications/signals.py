@@ -0,0 +1,49 @@
+# notifications/signals.py
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+
+from notifications.models import Announcement, Notification
+from notifications.services.unread import adjust_unread, announcement_sent, announcement_withdrawn
+
+
+# Unread badges are a per-profile counter in the database. Every write that creates, reads
+# or removes an unread item shifts it with an F() update; QuerySet.update() callers in
+# notifications.services and views adjust it themselves.
+def remember_unread_state(sender, instance, **kwargs):
+    username = instance.__dict__.get("username")
+    is_seen = instance.__dict__.get("is_seen")
+    instance._unread_owner = username if is_seen is False else None
+
+
+def notification_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    previous = None if created else getattr(instance, "_unread_owner", None)
+    current = None if instance.is_seen else instance.username
+    if previous != current:
+        if previous:
+            adjust_unread(previous, -1)
+        if current:
+            adjust_unread(current, 1)
+    instance._unread_owner = current
+
+
+def notification_deleted(sender, instance, **kwargs):
+    if not instance.is_seen:
+        adjust_unread(instance.username, -1)
+
+
+def announcement_saved(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw:
+        announcement_sent(instance)
+
+
+def announcement_deleted(sender, instance, **kwargs):
+    announcement_withdrawn(instance)
+
+
+post_init.connect(remember_unread_state, sender=Notification, dispatch_uid="notifications_unread_init")
+post_save.connect(notification_saved, sender=Notification, dispatch_uid="notifications_unread_save")
+post_delete.connect(notification_deleted, sender=Notification, dispatch_uid="notifications_unread_delete")
+post_save.connect(announcement_saved, sender=Announcement, dispatch_uid="notifications_broadcast_save")
+pre_delete.connect(announcement_deleted, sender=Announcement, dispatch_uid="notifications_broadcast_delete")
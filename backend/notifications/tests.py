@@ -1,3 +1,155 @@
+import importlib
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from admin_app.models import Profile
+from notifications.models import Announcement, Announcement_receipt, Notification
+from notifications.services.broadcasts import unread_announcements
+
+
+class BroadcastNotificationTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="admin_joy", password="pass12345")
+        self.admin.profile.role = "admin"
+        self.admin.profile.save(update_fields=["role"])
+        for idx in range(6):
+            user = User.objects.create_user(username=f"member{idx}", password="pass12345")
+            if idx < 2:
+                user.profile.role = "chef"
+                user.profile.save(update_fields=["role"])
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _send(self, path, title="Hello", message="<p>Hi</p>"):
+        return self.client.post(f"/notifications/{path}/", {"title": title, "message": message}, format="json")
+
+    def _inbox(self, username):
+        self.client.force_authenticate(User.objects.get(username=username))
+        return self.client.get("/notifications/inbox/").data["notifications"]
+
+    def test_send_to_all_stores_the_broadcast_once(self):
+        with self.assertNumQueries(3):
+            # One INSERT, one UPDATE of the audience's unread counters and the recipient count
+            # for the response; the admin check reads the cached profile.
+            response = self._send("send_notification_to_all")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["recipients"], 7)
+        self.assertEqual(Announcement.objects.count(), 1)
+        self.assertFalse(Notification.objects.exists())
+        self.assertFalse(Announcement_receipt.objects.exists())
+
+    def test_chef_broadcast_only_reaches_chefs(self):
+        self._send("send_notification_to_chefs", title="Kitchen")
+
+        self.assertEqual([item["title"] for item in self._inbox("member0")], ["Kitchen"])
+        self.assertEqual(self._inbox("member4"), [])
+
+    def test_receipt_is_created_on_first_read_only(self):
+        announcement_id = self._send("send_notification_to_all").data["announcement_id"]
+        Notification.objects.create(sender="Admin", username="member3", title="Direct", message="Only you")
+
+        inbox = self._inbox("member3")
+        self.assertEqual([item["kind"] for item in inbox], ["notification", "announcement"])
+        self.assertEqual([item["is_seen"] for item in inbox], [False, False])
+
+        for _ in range(2):
+            response = self.client.post(f"/notifications/{announcement_id}/seen/")
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(Announcement_receipt.objects.filter(username="member3").count(), 1)
+        self.assertEqual([item["is_seen"] for item in self._inbox("member3")], [False, True])
+        self.assertEqual([item["is_seen"] for item in self._inbox("member4")], [False])
+
+    def test_broadcasts_before_signup_are_not_delivered(self):
+        self._send("send_notification_to_all")
+        User.objects.create_user(username="latecomer", password="pass12345")
+
+        self.assertEqual(self._inbox("latecomer"), [])
+
+    def test_non_admin_cannot_broadcast(self):
+        self.client.force_authenticate(User.objects.get(username="member3"))
+
+        response = self._send("send_notification_to_all", title="Spam", message="Spam")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Announcement.objects.exists())
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="reader", password="pass12345")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.direct = [
+            Notification.objects.create(sender="Admin", username="reader", title=f"Note {idx}", message="Hi")
+            for idx in range(2)
+        ]
+        self.broadcast = Announcement.objects.create(target=Announcement.TARGET_ALL, title="Everyone", message="Hi")
+
+    def _unread(self):
+        return self.client.get("/notifications/unread_count/").data["unread"]
+
+    def test_counter_is_a_single_row_read(self):
+        self.assertEqual(self._unread(), 3)
+
+        self.client.post(f"/notifications/{self.direct[0].uid}/seen/")
+        Notification.objects.create(sender="Admin", username="reader", title="Another", message="Hi")
+        # An edit through the admin site goes through save().
+        edited = Notification.objects.get(uid=self.direct[1].uid)
+        edited.is_seen = True
+        edited.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self._unread(), 2)
+
+    def test_broadcasts_shift_their_audience_counters(self):
+        Announcement.objects.create(target=Announcement.TARGET_ALL, title="Again", message="Hi")
+        Announcement.objects.create(target=Announcement.TARGET_CHEFS, title="Kitchen", message="Hi")
+        self.assertEqual(self._unread(), 4)
+
+        for _ in range(2):
+            self.client.post(f"/notifications/{self.broadcast.uid}/seen/")
+        self.assertEqual(self._unread(), 3)
+
+        # Withdrawing a read broadcast leaves the counter alone; an unread one comes off it.
+        self.broadcast.delete()
+        self.assertEqual(self._unread(), 3)
+        Announcement.objects.get(title="Again").delete()
+        self.assertEqual(self._unread(), 2)
+
+    def test_mark_all_seen_zeroes_the_counter(self):
+        self.assertEqual(self._unread(), 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post("/notifications/mark_all_seen/")
+
+        self.assertEqual(response.data["marked"], 3)
+        updates = [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+        # The counter reset and one UPDATE for every direct notification.
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(self._unread(), 0)
+        Notification.objects.create(sender="Admin", username="reader", title="Later", message="Hi")
+        self.assertEqual(self._unread(), 1)
+
+    def test_migration_backfills_existing_counters(self):
+        migration = importlib.import_module("admin_app.migrations.0014_profile_unread_notifications")
+        Announcement_receipt.objects.create(announcement=self.broadcast, username="reader")
+        Profile.objects.update(unread_notifications=0)
+
+        migration.backfill_unread_notifications(apps, None)
+
+        self.assertEqual(self._unread(), 2)
+
+    def test_unread_lookup_uses_composite_index(self):
+        plan = Notification.objects.filter(username="reader", is_seen=False).explain()
 
-# Create your tests here.
+        self.assertIn("notification_unread_idx", plan)
+        receipt_plan = unread_announcements(self.user).explain()
+        # The receipt check is a lookup on the (username, announcement) unique index.
+        self.assertIn("username=? AND announcement_id=?", receipt_plan)
@@ -8,4 +8,8 @@ urlpatterns = [
     path('send_notification_to_all/', SendNotificationToAll.as_view()),
 	path('send_notification_to_chefs/', SendNotificationToChefs.as_view()),
 	path('send_notification_to_user/', SendNotificationToUser.as_view()),
+	path('inbox/', Inbox.as_view()),
+	path('<uuid:notification_id>/seen/', MarkNotificationSeen.as_view()),
+	path('mark_all_seen/', MarkAllNotificationsSeen.as_view()),
+	path('unread_count/', UnreadNotificationCount.as_view()),
 ]
\ No newline at end of file
@@ -6,7 +6,45 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
 from admin_app.models import Profile
-from notifications.models import Notification
+from core.authentication import request_role
+from core.pagination import KeysetPaginationMixin
+from notifications.models import Announcement, Notification
+from notifications.services.broadcasts import (
+    announce,
+    audience_size,
+    inbox_sources,
+    mark_announcements_seen,
+    serialize_inbox_item,
+)
+from notifications.services.unread import adjust_unread, mark_all_seen, unread_count
+
+
+def _require_admin(request):
+    if request_role(request) != "admin":
+        return Response({
+            'status': status.HTTP_403_FORBIDDEN,
+            'message': 'You are not authorized to send notifications.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+def _broadcast(request, target, success_message):
+    title = request.data.get('title')
+    message = request.data.get('message')
+
+    if not title or not message:
+        return Response({
+            'status': status.HTTP_400_BAD_REQUEST,
+            'message': 'Title and message are required.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    announcement = announce(target=target, title=title, message=message)
+    return Response({
+        'status': status.HTTP_200_OK,
+        'message': success_message,
+        'announcement_id': str(announcement.uid),
+        'recipients': audience_size(target),
+    }, status=status.HTTP_200_OK)
 
 
 # Create your views here.
@@ -14,80 +52,38 @@ class SendNotificationToAll(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        title = request.data.get('title')
-        message = request.data.get('message')
+        guard = _require_admin(request)
+        if guard:
+            return guard
 
-        if not title or not message:
-            return Response({
-                'status': status.HTTP_400_BAD_REQUEST,
-                'message': 'Title and message are required.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        all_users = User.objects.all()
-        
-        for user in all_users:
-            username = user.username
-            # Create new notification
-            Notification.objects.create(
-                sender="Admin",
-                username=username,
-                title=title,
-                message=message,
-            )
-
-        return Response({
-            'status': status.HTTP_200_OK,
-            'message': 'Notifications sent successfully.'
-        }, status=status.HTTP_200_OK)
+        return _broadcast(request, Announcement.TARGET_ALL, 'Notifications sent successfully.')
 
 
 class SendNotificationToChefs(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        title = request.data.get('title')
-        message = request.data.get('message')
-
-        if not title or not message:
-            return Response({
-                'status': status.HTTP_400_BAD_REQUEST,
-                'message': 'Title and message are required.'
-            }, status=status.HTTP_400_BAD_REQUEST)
+        guard = _require_admin(request)
+        if guard:
+            return guard
 
-        all_chefs = Profile.objects.filter(role="Chef")
-        
-        if not all_chefs.exists():
+        if not Profile.objects.filter(role="chef").exists():
             return Response({
                 'status': status.HTTP_404_NOT_FOUND,
                 'message': 'No chefs found.'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            for chef_profile in all_chefs:
-                username = chef_profile.user.username
-                # Create new notification
-                Notification.objects.create(
-                    sender="Admin",
-                    username=username,
-                    title=title,
-                    message=message,
-                )
-        except Exception as e:
-            return Response({
-                'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
-                'message': f'Error: {str(e)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        return Response({
-            'status': status.HTTP_200_OK,
-            'message': 'Notifications sent to chefs successfully.'
-        }, status=status.HTTP_200_OK)
+        return _broadcast(request, Announcement.TARGET_CHEFS, 'Notifications sent to chefs successfully.')
 
 
 class SendNotificationToUser(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        guard = _require_admin(request)
+        if guard:
+            return guard
+
         username = request.data.get('username')
         title = request.data.get('title')
         message = request.data.get('message')
@@ -98,9 +94,7 @@ class SendNotificationToUser(APIView):
                 'message': 'Username, title, and message are required.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
+        if not User.objects.filter(username=username).exists():
             return Response({
                 'status': status.HTTP_404_NOT_FOUND,
                 'message': 'User not found.'
@@ -117,4 +111,88 @@ class SendNotificationToUser(APIView):
         return Response({
             'status': status.HTTP_200_OK,
             'message': 'Notification sent successfully.'
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        }, status=status.HTTP_200_OK)
+
+
+class Inbox(KeysetPaginationMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    keyset_field = 'time'
+
+    def get(self, request):
+        notifications_qs, announcements_qs = inbox_sources(request.user)
+
+        page_size = self.get_page_size(request)
+        notifications_qs, error = self.apply_cursor(request, notifications_qs)
+        if error:
+            return error
+        announcements_qs, error = self.apply_cursor(request, announcements_qs)
+        if error:
+            return error
+
+        # Both sources share the (time, uid) ordering, so one cursor continues the merged stream.
+        merged = sorted(
+            list(notifications_qs[: page_size + 1]) + list(announcements_qs[: page_size + 1]),
+            key=self.keyset_sort_key,
+            reverse=True,
+        )
+        rows, pagination = self.build_page(merged, page_size)
+
+        return Response({
+            'status': status.HTTP_200_OK,
+            'notifications': [serialize_inbox_item(row) for row in rows],
+            'pagination': pagination,
+        }, status=status.HTTP_200_OK)
+
+
+class MarkNotificationSeen(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, notification_id):
+        username = request.user.username
+
+        direct = Notification.objects.filter(uid=notification_id, username=username)
+        marked = direct.filter(is_seen=False).update(is_seen=True)
+        if marked:
+            adjust_unread(username, -marked)
+        if marked or direct.exists():
+            return Response({
+                'status': status.HTTP_200_OK,
+                'message': 'Notification marked as seen.'
+            }, status=status.HTTP_200_OK)
+
+        announcement = inbox_sources(request.user)[1].filter(uid=notification_id).first()
+        if not announcement:
+            return Response({
+                'status': status.HTTP_404_NOT_FOUND,
+                'message': 'Notification not found.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if not announcement.is_seen and mark_announcements_seen(username, [announcement.uid]):
+            adjust_unread(username, -1)
+
+        return Response({
+            'status': status.HTTP_200_OK,
+            'message': 'Notification marked as seen.'
+        }, status=status.HTTP_200_OK)
+
+
+class MarkAllNotificationsSeen(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        marked = mark_all_seen(request.user)
+        return Response({
+            'status': status.HTTP_200_OK,
+            'message': 'All notifications marked as seen.',
+            'marked': marked,
+        }, status=status.HTTP_200_OK)
+
+
+class UnreadNotificationCount(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({
+            'status': status.HTTP_200_OK,
+            'unread': unread_count(request.user),
+        }, status=status.HTTP_200_OK)
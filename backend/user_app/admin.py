@@ -19,6 +19,23 @@ class OrderAdmin(admin.ModelAdmin):
 class Order_historyAdmin(admin.ModelAdmin):
     readonly_fields = ('order_time', )
 
+class Order_lineAdmin(admin.ModelAdmin):
+    readonly_fields = ('uid', )
+    list_display = ('chef', 'food', 'quantity', 'unit_price', 'order_time')
+
+class Chef_daily_salesAdmin(admin.ModelAdmin):
+    list_display = ('chef', 'day', 'orders', 'revenue', 'items', 'updated_at')
+    list_filter = ('day', )
+    search_fields = ('chef', )
+
+class User_daily_spendAdmin(admin.ModelAdmin):
+    list_display = ('user', 'day', 'orders', 'spend', 'items', 'updated_at')
+    list_filter = ('day', )
+    search_fields = ('user', )
+
+class User_spend_totalAdmin(admin.ModelAdmin):
+    list_display = ('user', 'orders', 'spend', 'last_order_at', 'updated_at')
+    search_fields = ('user', )
 
 
 
@@ -29,3 +46,7 @@ admin.site.register(Campaign, CampaignAdmin),
 admin.site.register(Campaign_history, Campaign_historyAdmin),
 admin.site.register(Order, OrderAdmin),
 admin.site.register(Order_history, Order_historyAdmin),
+admin.site.register(Order_line, Order_lineAdmin),
+admin.site.register(Chef_daily_sales, Chef_daily_salesAdmin),
+admin.site.register(User_daily_spend, User_daily_spendAdmin),
+admin.site.register(User_spend_total, User_spend_totalAdmin),
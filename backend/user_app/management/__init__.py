@@ -0,0 +1 @@
+# user_app/management
\ No newline at end of file
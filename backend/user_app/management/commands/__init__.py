@@ -0,0 +1 @@
+# user_app/management/commands
\ No newline at end of file
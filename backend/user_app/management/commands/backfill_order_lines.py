@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from user_app.models import Order, Order_history, Order_line
+from user_app.services.order_lines import build_order_lines, load_food_catalogue
+from user_app.services.sales_rollups import rebuild_chef_daily_sales
+
+
+class Command(BaseCommand):
+    help = "Build Order_line rows for existing orders and order history from their food_items."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of order rows to read per chunk (default: 1000).",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Delete all existing order lines before backfilling.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(int(options["batch_size"] or 1000), 1)
+
+        if options["rebuild"]:
+            deleted, _details = Order_line.objects.all().delete()
+            self.stdout.write(f"Deleted {deleted} existing order lines.")
+
+        catalogue = load_food_catalogue()
+
+        pending_lines = self._backfill(
+            Order.objects.filter(lines__isnull=True),
+            lambda row: build_order_lines(row, order=row, catalogue=catalogue),
+            batch_size,
+        )
+        history_lines = self._backfill(
+            Order_history.objects.filter(lines__isnull=True),
+            lambda row: build_order_lines(row, order_history=row, catalogue=catalogue),
+            batch_size,
+        )
+
+        rollup_rows = rebuild_chef_daily_sales()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Order line backfill complete. Pending order lines: {pending_lines}, "
+                f"Order history lines: {history_lines}, Chef daily sales rows: {rollup_rows}."
+            )
+        )
+
+    def _backfill(self, queryset, build_lines, batch_size):
+        created = 0
+        buffer = []
+        for row in queryset.order_by("order_time").iterator(chunk_size=batch_size):
+            buffer.extend(build_lines(row))
+            if len(buffer) >= batch_size:
+                created += self._flush(buffer, batch_size)
+                buffer = []
+        if buffer:
+            created += self._flush(buffer, batch_size)
+        return created
+
+    @staticmethod
+    def _flush(lines, batch_size):
+        with transaction.atomic():
+            Order_line.objects.bulk_create(lines, batch_size=batch_size)
+        return len(lines)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from user_app.services.order_lines import normalize_chef
+from user_app.services.sales_rollups import rebuild_chef_daily_sales
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Chef_daily_sales rollup table from order lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chef",
+            default="",
+            help="Only rebuild rows for this chef username.",
+        )
+
+    def handle(self, *args, **options):
+        chef = normalize_chef(options["chef"])
+        rows = rebuild_chef_daily_sales(chef=chef or None)
+        scope = f"chef '{chef}'" if chef else "all chefs"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} chef daily sales rows for {scope}."))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from user_app.services.spend_rollups import rebuild_user_spend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the User_daily_spend and User_spend_total rollups from orders and order history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            default="",
+            help="Only rebuild rows for this username.",
+        )
+
+    def handle(self, *args, **options):
+        user = str(options["user"] or "").strip()
+        rows = rebuild_user_spend(user=user or None)
+        scope = f"user '{user}'" if user else "all users"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} user daily spend rows for {scope}."))
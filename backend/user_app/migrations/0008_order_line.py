@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:12
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0007_alter_campaign_delivery_time_alter_campaign_end_time_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order_line',
+            fields=[
+                ('uid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('chef', models.CharField(db_index=True, max_length=100)),
+                ('quantity', models.IntegerField(default=1)),
+                ('unit_price', models.FloatField(default=0)),
+                ('order_time', models.DateTimeField(blank=True, null=True)),
+                ('food', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_lines', to='user_app.food')),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='user_app.order')),
+                ('order_history', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='user_app.order_history')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['chef', 'order_time'], name='order_line_chef_time_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0008_order_line'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Chef_daily_sales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('chef', models.CharField(max_length=100)),
+                ('day', models.DateField()),
+                ('orders', models.IntegerField(default=0)),
+                ('revenue', models.FloatField(default=0.0)),
+                ('items', models.IntegerField(default=0)),
+                ('food_quantities', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('chef', 'day'), name='chef_daily_sales_chef_day_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,116 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:40
+
+import json
+
+from django.db import migrations, models
+
+
+def _to_food_quantities(raw, quantity):
+    """Convert legacy comma-separated / JSON list text into ``{food_id: qty}``."""
+    if not raw:
+        return {}
+
+    raw = str(raw).strip()
+    parsed = None
+    if raw.startswith("[") or raw.startswith("{"):
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            parsed = None
+    if not isinstance(parsed, (dict, list)):
+        parsed = raw.split(",")
+
+    total_quantity = max(int(quantity or 0), 1)
+    food_quantities = {}
+    if isinstance(parsed, dict):
+        for food_id, food_quantity in parsed.items():
+            food_id = str(food_id).strip()
+            try:
+                food_quantity = int(food_quantity or 0)
+            except (TypeError, ValueError):
+                food_quantity = 0
+            if food_id:
+                food_quantities[food_id] = food_quantities.get(food_id, 0) + max(food_quantity, 1)
+    else:
+        # A legacy list carries no per-food quantities: split the order's quantity across the
+        # entries (at least one each, remainder to the first) so they add up to ``quantity``.
+        food_ids = [str(food_id).strip() for food_id in parsed]
+        food_ids = [food_id for food_id in food_ids if food_id]
+        if food_ids:
+            share, remainder = divmod(max(total_quantity, len(food_ids)), len(food_ids))
+            for index, food_id in enumerate(food_ids):
+                food_quantities[food_id] = (
+                    food_quantities.get(food_id, 0) + share + (remainder if index == 0 else 0)
+                )
+    return food_quantities
+
+
+def _to_legacy_text(food_quantities):
+    return ",".join(str(food_id) for food_id in (food_quantities or {}).keys())
+
+
+def forwards(apps, schema_editor):
+    for model_name in ("Order", "Order_history"):
+        model = apps.get_model("user_app", model_name)
+        batch = []
+        for row in model.objects.only("uid", "food_items", "quantity").iterator(chunk_size=1000):
+            row.food_items_json = _to_food_quantities(row.food_items, row.quantity)
+            batch.append(row)
+            if len(batch) >= 1000:
+                model.objects.bulk_update(batch, ["food_items_json"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["food_items_json"])
+
+
+def backwards(apps, schema_editor):
+    for model_name in ("Order", "Order_history"):
+        model = apps.get_model("user_app", model_name)
+        batch = []
+        for row in model.objects.only("uid", "food_items_json").iterator(chunk_size=1000):
+            row.food_items = _to_legacy_text(row.food_items_json)
+            batch.append(row)
+            if len(batch) >= 1000:
+                model.objects.bulk_update(batch, ["food_items"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["food_items"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0009_chef_daily_sales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='food_items_json',
+            field=models.JSONField(blank=True, default=dict, null=True),
+        ),
+        migrations.AddField(
+            model_name='order_history',
+            name='food_items_json',
+            field=models.JSONField(blank=True, default=dict, null=True),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(
+            model_name='order',
+            name='food_items',
+        ),
+        migrations.RemoveField(
+            model_name='order_history',
+            name='food_items',
+        ),
+        migrations.RenameField(
+            model_name='order',
+            old_name='food_items_json',
+            new_name='food_items',
+        ),
+        migrations.RenameField(
+            model_name='order_history',
+            old_name='food_items_json',
+            new_name='food_items',
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:20
+
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+CHEF_KEY_SOURCES = (
+    ("Campaign", "chef"),
+    ("Campaign_history", "chef"),
+    ("Chef", "chef_username"),
+    ("Food", "chef"),
+)
+
+
+def fill_chef_keys(apps, schema_editor):
+    for model_name, source in CHEF_KEY_SOURCES:
+        apps.get_model("user_app", model_name).objects.update(chef_key=Lower(Trim(source)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0010_order_food_items_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='campaign_history',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='chef',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='food',
+            name='chef_key',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='user',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='order_history',
+            name='user',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.RunPython(fill_chef_keys, migrations.RunPython.noop),
+    ]
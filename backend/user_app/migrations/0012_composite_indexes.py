@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0011_chef_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='user',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='order_history',
+            name='user',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['chef_key', 'start_time'], name='campaign_chef_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'start_time', 'end_time'], name='campaign_running_window_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign_history',
+            index=models.Index(fields=['chef_key', 'start_time'], name='campaign_hist_chef_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', '-order_time'], name='order_user_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order_history',
+            index=models.Index(fields=['user', '-order_time'], name='order_hist_user_time_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0012_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order_line',
+            index=models.Index(fields=['order_time'], name='order_line_time_idx'),
+        ),
+    ]
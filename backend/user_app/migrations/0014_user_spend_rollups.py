@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-17 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_app', '0013_order_line_time_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User_spend_total',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user', models.CharField(max_length=100, unique=True)),
+                ('orders', models.IntegerField(default=0)),
+                ('spend', models.FloatField(default=0.0)),
+                ('last_order_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='User_daily_spend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user', models.CharField(max_length=100)),
+                ('day', models.DateField()),
+                ('orders', models.IntegerField(default=0)),
+                ('spend', models.FloatField(default=0.0)),
+                ('items', models.IntegerField(default=0)),
+                ('food_quantities', models.JSONField(blank=True, default=dict)),
+                ('food_orders', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'day'), name='user_daily_spend_user_day_uniq')],
+            },
+        ),
+    ]
@@ -2,14 +2,16 @@
 
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
-from core.models import core_model
+from core.models import chef_keyed_model, core_model
 
 
 # Create your models here.
 
 
-class Campaign(core_model):
+class Campaign(chef_keyed_model):
     chef = models.CharField(max_length=100, default="Chef Username")
     status = models.CharField(max_length=100, default="running")
     food_status = models.CharField(max_length=100, default="cooking")
@@ -22,6 +24,14 @@ class Campaign(core_model):
     quantity_available = models.IntegerField(default=0)
     total_orders = models.IntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            # Chef dashboard and campaign lists: one chef's campaigns by start time.
+            models.Index(fields=["chef_key", "start_time"], name="campaign_chef_start_idx"),
+            # available/ and the home feed: running campaigns whose window contains now.
+            models.Index(fields=["status", "start_time", "end_time"], name="campaign_running_window_idx"),
+        ]
+
     @property
     def food_quantities(self):
         return self.food_items or {}
@@ -34,7 +44,7 @@ class Campaign(core_model):
         return self.title
 
 
-class Campaign_history(core_model):
+class Campaign_history(chef_keyed_model):
     chef = models.CharField(max_length=100, default="Chef Username")
     status = models.CharField(max_length=100, default="active")
     title = models.CharField(max_length=100, default="Campaign Title")
@@ -45,11 +55,18 @@ class Campaign_history(core_model):
     delivery_time = models.DateTimeField(null=True, blank=True, editable=True)
     total_orders = models.IntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["chef_key", "start_time"], name="campaign_hist_chef_start_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
 
-class Chef(core_model):
+class Chef(chef_keyed_model):
+    chef_key_source = "chef_username"
+
     chef_username = models.CharField(max_length=100, default="Chef Name")
     chef_description = models.TextField(blank=True, null=True)
     chef_image = models.ImageField(upload_to='chef_images/', default='chef_images/default.png')
@@ -80,7 +97,7 @@ class Chef(core_model):
 
 
 
-class Food(core_model):
+class Food(chef_keyed_model):
     food_name = models.CharField(max_length=100, default="Food Name")
     food_description = models.TextField(blank=True, null=True)
     chef = models.CharField(max_length=100, default="Chef Name")
@@ -96,11 +113,17 @@ class Order(core_model):
     user_address = models.CharField(max_length=255, default="User Address")
     user_phone = models.CharField(max_length=15, default="User Phone")
     quantity = models.IntegerField(default=0)
-    food_items = models.TextField(blank=True, null=True)
+    food_items = models.JSONField(default=dict, blank=True, null=True)
     custom_order_details = models.TextField(blank=True, null=True)
     food_price = models.FloatField(default=0)
     order_time = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    class Meta:
+        indexes = [
+            # Also serves plain ``user=`` lookups, so ``user`` needs no index of its own.
+            models.Index(fields=["user", "-order_time"], name="order_user_time_idx"),
+        ]
+
     def __str__(self):
         return f"{self.uid}"
     
@@ -109,10 +132,117 @@ class Order(core_model):
 class Order_history(core_model):
     user = models.CharField(max_length=100)
     quantity = models.IntegerField(default=0)
-    food_items = models.TextField(blank=True, null=True)
+    food_items = models.JSONField(default=dict, blank=True, null=True)
     food_price = models.FloatField(default=0)
     order_id = models.CharField(max_length=200, null = True, blank = True)
     order_time = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-order_time"], name="order_hist_user_time_idx"),
+        ]
+
     def __str__(self):
         return self.order_id
+
+
+class Order_line(core_model):
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, null=True, blank=True, related_name="lines")
+    order_history = models.ForeignKey(
+        Order_history, on_delete=models.CASCADE, null=True, blank=True, related_name="lines"
+    )
+    food = models.ForeignKey(Food, on_delete=models.SET_NULL, null=True, blank=True, related_name="order_lines")
+    # Lower-cased chef username so chef-scoped lookups are plain indexed equality.
+    chef = models.CharField(max_length=100, db_index=True)
+    quantity = models.IntegerField(default=1)
+    unit_price = models.FloatField(default=0)
+    order_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["chef", "order_time"], name="order_line_chef_time_idx"),
+            # Admin dashboard food totals across all chefs for a date range.
+            models.Index(fields=["order_time"], name="order_line_time_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.chef} x{self.quantity}"
+
+
+class Chef_daily_sales(models.Model):
+    chef = models.CharField(max_length=100)
+    day = models.DateField()
+    orders = models.IntegerField(default=0)
+    revenue = models.FloatField(default=0.0)
+    items = models.IntegerField(default=0)
+    food_quantities = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["chef", "day"], name="chef_daily_sales_chef_day_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.chef} {self.day}"
+
+
+class User_daily_spend(models.Model):
+    """One buyer's orders on one local day; a completed order stays on the day it was placed."""
+
+    user = models.CharField(max_length=100)
+    day = models.DateField()
+    orders = models.IntegerField(default=0)
+    spend = models.FloatField(default=0.0)
+    items = models.IntegerField(default=0)
+    food_quantities = models.JSONField(default=dict, blank=True)
+    # Number of orders each food appeared in, for the "times ordered" column.
+    food_orders = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "day"], name="user_daily_spend_user_day_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.day}"
+
+
+class User_spend_total(models.Model):
+    user = models.CharField(max_length=100, unique=True)
+    orders = models.IntegerField(default=0)
+    spend = models.FloatField(default=0.0)
+    last_order_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.user
+
+
+@receiver(post_save, sender=Order)
+def create_order_lines(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        from user_app.services.order_lines import write_order_lines
+        from user_app.services.spend_rollups import record_user_order
+
+        write_order_lines(instance)
+        record_user_order(instance)
+
+
+@receiver(post_save, sender=Order_history)
+def attach_order_history_lines(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        from user_app.services.order_lines import attach_history_lines
+        from user_app.services.spend_rollups import record_user_history
+
+        attach_history_lines(instance)
+        record_user_history(instance)
+
+
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=Order_history)
+def forget_deleted_order_spend(sender, instance, **kwargs):
+    from user_app.services.spend_rollups import forget_user_order
+
+    forget_user_order(instance)
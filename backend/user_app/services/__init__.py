@@ -0,0 +1 @@
+# user_app/services
\ No newline at end of file
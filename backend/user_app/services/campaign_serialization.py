@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from admin_app.serializers import CampaignSerializer, FoodSerializer
+from user_app.models import Food
+from user_app.services.food_items import is_valid_uuid
+
+
+def _to_int(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_campaign_food_map(campaigns):
+    """Serialize every food referenced by ``campaigns`` with a single ``uid__in`` query.
+
+    Returns ``str(uid) -> serialized food``; each food is serialized once however many
+    campaigns list it.
+    """
+    food_ids = set()
+    for campaign in campaigns:
+        food_ids.update(str(food_id) for food_id in (campaign.food_items or {}).keys())
+
+    valid_ids = [food_id for food_id in food_ids if is_valid_uuid(food_id)]
+    if not valid_ids:
+        return {}
+
+    return {
+        str(food.uid): FoodSerializer(food).data
+        for food in Food.objects.filter(uid__in=valid_ids)
+    }
+
+
+def campaign_food_items(campaign, food_map, skip_missing=False):
+    food_items = []
+    for food_id, quantity in (campaign.food_items or {}).items():
+        food_data = food_map.get(str(food_id))
+        if food_data is None:
+            if skip_missing:
+                continue
+            food_items.append(
+                {
+                    "uid": str(food_id),
+                    "food_name": "Unknown Food",
+                    "food_price": 0,
+                    "campaign_quantity": _to_int(quantity),
+                }
+            )
+            continue
+
+        food_items.append({**food_data, "campaign_quantity": _to_int(quantity)})
+    return food_items
+
+
+def serialize_campaigns_with_foods(campaigns):
+    """Full ``CampaignSerializer`` payloads with food details, used by the chef campaign pages."""
+    campaigns = list(campaigns)
+    food_map = build_campaign_food_map(campaigns)
+    serialized = []
+    for campaign in campaigns:
+        campaign_data = CampaignSerializer(campaign).data
+        campaign_data["food_items"] = campaign_food_items(campaign, food_map)
+        campaign_data["id"] = str(campaign.uid)
+        serialized.append(campaign_data)
+    return serialized
+
+
+def serialize_public_campaigns(campaigns, include_stock=False):
+    """Compact campaign cards used by ``/available/`` and the home feed; unknown foods are dropped."""
+    campaigns = list(campaigns)
+    food_map = build_campaign_food_map(campaigns)
+    serialized = []
+    for campaign in campaigns:
+        campaign_data = {
+            "id": str(campaign.uid),
+            "title": campaign.title,
+            "description": campaign.campaign_description,
+            "chef": campaign.chef,
+            "start_time": campaign.start_time,
+            "end_time": campaign.end_time,
+            "delivery_time": campaign.delivery_time,
+        }
+        if include_stock:
+            campaign_data["quantity_available"] = campaign.quantity_available
+        campaign_data["food_items"] = campaign_food_items(campaign, food_map, skip_missing=True)
+        serialized.append(campaign_data)
+    return serialized
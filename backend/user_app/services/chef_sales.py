@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.conf import settings
+from django.db.models import Count, F, Sum
+from django.db.models.functions import ExtractMonth, TruncDate
+
+from core.date_ranges import in_date_range
+from user_app.models import Chef_daily_sales, Order_line
+
+
+SALES_SOURCE_ROLLUP = "rollup"
+SALES_SOURCE_LINES = "lines"
+
+
+def _sales_source(source):
+    source = source or getattr(settings, "CHEF_SALES_SOURCE", SALES_SOURCE_ROLLUP)
+    if source not in {SALES_SOURCE_ROLLUP, SALES_SOURCE_LINES}:
+        raise ValueError(f"Unknown chef sales source: {source!r}")
+    return source
+
+
+def _line_revenue():
+    return Sum(F("unit_price") * F("quantity"))
+
+
+def _empty_day():
+    return {"orders": 0, "revenue": 0.0}
+
+
+def chef_sales_in_range(chef_key, start_date, end_date, source=None):
+    """Per-day ``{"orders", "revenue"}`` and total quantity per food for one chef.
+
+    ``rollup`` reads the maintained ``Chef_daily_sales`` rows; ``lines`` groups
+    ``Order_line`` by day and by food in the database. Both return the same numbers, and the
+    dashboard reads whichever ``settings.CHEF_SALES_SOURCE`` names.
+    """
+    if _sales_source(source) == SALES_SOURCE_LINES:
+        return _sales_from_lines(chef_key, start_date, end_date)
+    return _sales_from_rollup(chef_key, start_date, end_date)
+
+
+def chef_revenue_by_month(chef_key, year, source=None):
+    """``{month: revenue}`` for the twelve months of ``year``."""
+    start_date, end_date = date(year, 1, 1), date(year, 12, 31)
+    if _sales_source(source) == SALES_SOURCE_LINES:
+        rows = (
+            Order_line.objects.filter(in_date_range("order_time", start_date, end_date), chef=chef_key)
+            .annotate(month=ExtractMonth("order_time"))
+            .values("month")
+            .annotate(total=_line_revenue())
+            .order_by()
+        )
+    else:
+        rows = (
+            Chef_daily_sales.objects.filter(chef=chef_key, day__gte=start_date, day__lte=end_date)
+            .annotate(month=ExtractMonth("day"))
+            .values("month")
+            .annotate(total=Sum("revenue"))
+            .order_by()
+        )
+
+    revenue = {month: 0.0 for month in range(1, 13)}
+    for row in rows:
+        if row["month"]:
+            revenue[row["month"]] += float(row["total"] or 0.0)
+    return revenue
+
+
+def _sales_from_rollup(chef_key, start_date, end_date):
+    by_day = {}
+    food_quantities = {}
+    rows = Chef_daily_sales.objects.filter(chef=chef_key, day__gte=start_date, day__lte=end_date).values(
+        "day", "orders", "revenue", "food_quantities"
+    )
+    for row in rows:
+        day = by_day.setdefault(row["day"], _empty_day())
+        day["orders"] += int(row["orders"] or 0)
+        day["revenue"] += float(row["revenue"] or 0.0)
+        for food_id, quantity in (row["food_quantities"] or {}).items():
+            food_quantities[food_id] = food_quantities.get(food_id, 0) + int(quantity or 0)
+    return by_day, food_quantities
+
+
+def _sales_from_lines(chef_key, start_date, end_date):
+    lines = Order_line.objects.filter(in_date_range("order_time", start_date, end_date), chef=chef_key)
+
+    by_day = {}
+    day_rows = (
+        lines.annotate(day=TruncDate("order_time"))
+        .values("day")
+        .annotate(
+            # A line belongs to its pending order until completion moves it onto the history row.
+            pending_orders=Count("order", distinct=True),
+            history_orders=Count("order_history", distinct=True),
+            revenue=_line_revenue(),
+        )
+        .order_by()
+    )
+    for row in day_rows:
+        day = by_day.setdefault(row["day"], _empty_day())
+        day["orders"] += int(row["pending_orders"] or 0) + int(row["history_orders"] or 0)
+        day["revenue"] += float(row["revenue"] or 0.0)
+
+    food_rows = lines.filter(food__isnull=False).values("food_id").annotate(total=Sum("quantity")).order_by()
+    food_quantities = {str(row["food_id"]): int(row["total"] or 0) for row in food_rows}
+    return by_day, food_quantities
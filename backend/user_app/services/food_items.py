@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import uuid
+from functools import lru_cache
+
+
+def is_valid_uuid(value):
+    try:
+        uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return True
+
+
+def _to_quantity(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _split_quantity(food_ids, total_quantity):
+    """Share ``total_quantity`` across the entries of a legacy id list: at least one each,
+    the remainder to the first, so the values add up to the order's quantity whenever it
+    covers every entry."""
+    count = len(food_ids)
+    share, remainder = divmod(max(total_quantity, count), count)
+    pairs = {}
+    for index, food_id in enumerate(food_ids):
+        pairs[food_id] = pairs.get(food_id, 0) + share + (remainder if index == 0 else 0)
+    return pairs
+
+
+def _collect(parsed, total_quantity):
+    pairs = {}
+    if isinstance(parsed, dict):
+        for food_id, quantity in parsed.items():
+            food_id = str(food_id).strip()
+            if food_id:
+                pairs[food_id] = pairs.get(food_id, 0) + max(_to_quantity(quantity), 1)
+    else:
+        food_ids = [str(food_id).strip() for food_id in parsed]
+        food_ids = [food_id for food_id in food_ids if food_id]
+        if food_ids:
+            pairs = _split_quantity(food_ids, total_quantity)
+    return tuple(pairs.items())
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(raw, total_quantity):
+    raw = raw.strip()
+    if not raw:
+        return ()
+
+    parsed = None
+    if raw.startswith("[") or raw.startswith("{"):
+        try:
+            parsed = json.loads(raw)
+        except ValueError:
+            parsed = None
+    if not isinstance(parsed, (dict, list)):
+        parsed = raw.split(",")
+    return _collect(parsed, total_quantity)
+
+
+def parse_food_items(food_items, total_quantity=1):
+    """Return ``{food_id: quantity}`` from any stored ``food_items`` shape.
+
+    ``Order.food_items`` is a ``{food_id: qty}`` JSON object; legacy rows and older clients
+    may still hand over a JSON list or comma-separated text, in which case the order's
+    ``total_quantity`` is split across the listed foods, the way ``place_order`` stores it.
+    Text values are memoized since the same rows are parsed repeatedly.
+    """
+    total_quantity = max(_to_quantity(total_quantity), 1)
+    if not food_items:
+        return {}
+    if isinstance(food_items, (dict, list, tuple)):
+        return dict(_collect(food_items, total_quantity))
+    return dict(_parse_text(str(food_items), total_quantity))
+
+
+def parse_food_ids(food_items):
+    return list(parse_food_items(food_items).keys())
+
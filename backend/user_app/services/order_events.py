@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from core.events import publish_event
+from core.models import normalize_username
+
+
+CAMPAIGN_STOCK_CHANNEL = "campaign_stock"
+
+
+def chef_orders_channel(chef):
+    return f"chef_orders:{normalize_username(chef)}"
+
+
+def publish_order_placed(order, lines):
+    """Push a new order to every chef it has lines for, carrying only that chef's lines."""
+    lines_by_chef = defaultdict(list)
+    for line in lines:
+        if line.chef:
+            lines_by_chef[line.chef].append(line)
+
+    for chef, chef_lines in lines_by_chef.items():
+        publish_event(
+            chef_orders_channel(chef),
+            "order.placed",
+            {
+                "order_id": str(order.uid),
+                "user": order.user,
+                "user_address": order.user_address,
+                "user_phone": order.user_phone,
+                "quantity": order.quantity,
+                "food_price": order.food_price,
+                "custom_order_details": order.custom_order_details,
+                "order_time": order.order_time,
+                "matched_food_item_ids": [str(line.food_id) for line in chef_lines if line.food_id],
+                "lines": [
+                    {"food_id": str(line.food_id), "quantity": line.quantity, "unit_price": line.unit_price}
+                    for line in chef_lines
+                ],
+            },
+        )
+
+
+def publish_order_completed(history, chefs):
+    for chef in chefs:
+        publish_event(
+            chef_orders_channel(chef),
+            "order.completed",
+            {
+                "order_id": history.order_id,
+                "history_id": str(history.uid),
+            },
+        )
+
+
+def publish_stock_change(campaign, food_ids):
+    """Push the new remaining quantity of just the foods an order took from ``campaign``."""
+    stock = campaign.food_items or {}
+    publish_event(
+        CAMPAIGN_STOCK_CHANNEL,
+        "stock",
+        {
+            "campaign_id": str(campaign.uid),
+            "quantity_available": int(campaign.quantity_available or 0),
+            "foods": {str(food_id): int(stock.get(str(food_id), 0) or 0) for food_id in food_ids},
+        },
+    )
+
+
+def publish_campaign_status(campaign):
+    """Announce a campaign opening or closing; buyers refetch ``available/`` for new campaigns."""
+    publish_event(
+        CAMPAIGN_STOCK_CHANNEL,
+        "campaign",
+        {
+            "campaign_id": str(campaign.uid),
+            "status": campaign.status,
+            "quantity_available": int(campaign.quantity_available or 0),
+        },
+    )
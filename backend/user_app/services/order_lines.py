@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from core.models import normalize_username
+from user_app.models import Food, Order_line
+from user_app.services.food_items import is_valid_uuid, parse_food_items
+from user_app.services.order_events import publish_order_completed, publish_order_placed
+from user_app.services.sales_rollups import apply_lines_to_daily_sales
+
+
+def normalize_chef(username):
+    return normalize_username(username)
+
+
+def load_food_catalogue(food_ids=None):
+    """Map ``str(uid) -> (chef, price)`` for the given food ids, or for every food when omitted."""
+    queryset = Food.objects.all()
+    if food_ids is not None:
+        valid_ids = [food_id for food_id in food_ids if is_valid_uuid(food_id)]
+        if not valid_ids:
+            return {}
+        queryset = queryset.filter(uid__in=valid_ids)
+    return {
+        str(uid): (chef, float(price or 0.0))
+        for uid, chef, price in queryset.values_list("uid", "chef", "food_price")
+    }
+
+
+def build_order_lines(source, *, order=None, order_history=None, catalogue=None):
+    """Build unsaved ``Order_line`` rows for an ``Order`` or ``Order_history`` row.
+
+    Unit prices come from the food catalogue and are scaled so the lines add up to what
+    the buyer was actually charged (``source.food_price``) whenever that total is known.
+    """
+    pairs = list(parse_food_items(source.food_items, total_quantity=source.quantity).items())
+    if not pairs:
+        return []
+
+    if catalogue is None:
+        catalogue = load_food_catalogue([food_id for food_id, _quantity in pairs])
+
+    matched = [(food_id, quantity) for food_id, quantity in pairs if food_id in catalogue]
+    if not matched:
+        return []
+
+    catalogue_total = sum(catalogue[food_id][1] * quantity for food_id, quantity in matched)
+    charged_total = float(source.food_price or 0.0)
+    scale = charged_total / catalogue_total if charged_total > 0 and catalogue_total > 0 else 1.0
+
+    return [
+        Order_line(
+            order=order,
+            order_history=order_history,
+            food_id=food_id,
+            chef=normalize_chef(catalogue[food_id][0]),
+            quantity=quantity,
+            unit_price=round(catalogue[food_id][1] * scale, 4),
+            order_time=source.order_time,
+        )
+        for food_id, quantity in matched
+    ]
+
+
+def write_order_lines(order):
+    lines = Order_line.objects.bulk_create(build_order_lines(order, order=order))
+    apply_lines_to_daily_sales(lines)
+    publish_order_placed(order, lines)
+    return lines
+
+
+def attach_history_lines(history):
+    """Move the lines of a completed order onto its history row, or build them for a fresh history row."""
+    if history.order_id and is_valid_uuid(history.order_id):
+        moving = Order_line.objects.filter(order_id=history.order_id)
+        chefs = set(moving.values_list("chef", flat=True))
+        moved = moving.update(order=None, order_history=history)
+        if moved:
+            publish_order_completed(history, chefs)
+            return moved
+
+    lines = Order_line.objects.bulk_create(build_order_lines(history, order_history=history))
+    apply_lines_to_daily_sales(lines)
+    return len(lines)
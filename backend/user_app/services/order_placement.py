@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework import status
+
+from admin_app.models import Profile
+from home_app.services.home_feed import invalidate_home_feed
+from user_app.models import Campaign, Food, Order
+from user_app.services.food_items import is_valid_uuid
+from user_app.services.order_events import publish_stock_change
+
+
+class _PlacementRejected(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.error = {"message": message, "status": status_code}
+
+
+def parse_requested_items(food_items_payload):
+    """Validate a ``[{"food_id": ..., "quantity": ...}]`` payload into ``{food_id: quantity}``."""
+    if not isinstance(food_items_payload, list) or not food_items_payload:
+        return None, {"message": "food_items must be a non-empty list.", "status": status.HTTP_400_BAD_REQUEST}
+
+    requested = {}
+    for item in food_items_payload:
+        if not isinstance(item, dict):
+            return None, {
+                "message": "Each food item must be an object with food_id and quantity.",
+                "status": status.HTTP_400_BAD_REQUEST,
+            }
+
+        food_id = str(item.get("food_id", "")).strip()
+        try:
+            quantity = int(item.get("quantity", 0))
+        except (TypeError, ValueError):
+            quantity = 0
+
+        if not food_id or not is_valid_uuid(food_id):
+            return None, {"message": f"Invalid food_id: {food_id}", "status": status.HTTP_400_BAD_REQUEST}
+        if quantity <= 0:
+            return None, {
+                "message": f"Quantity must be greater than 0 for food {food_id}.",
+                "status": status.HTTP_400_BAD_REQUEST,
+            }
+
+        requested[food_id] = requested.get(food_id, 0) + quantity
+
+    return requested, None
+
+
+def _running_campaign_filter(now):
+    return Q(status="running") & Q(start_time__lte=now) & (Q(end_time__isnull=True) | Q(end_time__gte=now))
+
+
+def _lock_campaign(campaign_id, total_quantity, now):
+    """Take the write lock on the campaign row before reading its stock.
+
+    The conditional UPDATE is the first statement of the transaction, so concurrent buyers
+    queue on the row (PostgreSQL) or on the database write lock (SQLite) instead of racing
+    on a stale read. The WHERE clause also rejects campaigns whose total stock is already short.
+    """
+    locked = (
+        Campaign.objects.filter(pk=campaign_id)
+        .filter(_running_campaign_filter(now))
+        .filter(quantity_available__gte=total_quantity)
+        .update(total_orders=F("total_orders") + 1)
+    )
+    if locked:
+        return
+
+    campaign = Campaign.objects.filter(pk=campaign_id).first()
+    if not campaign:
+        raise _PlacementRejected("Campaign not found.", status.HTTP_404_NOT_FOUND)
+    if not Campaign.objects.filter(pk=campaign_id).filter(_running_campaign_filter(now)).exists():
+        raise _PlacementRejected("This campaign is not accepting orders.", status.HTTP_400_BAD_REQUEST)
+    raise _PlacementRejected("Not enough stock left in this campaign.", status.HTTP_409_CONFLICT)
+
+
+def place_order(*, user, campaign_id, requested_items, user_address="", user_phone="", custom_order_details=""):
+    """Create an ``Order`` and decrement campaign stock in one transaction.
+
+    Returns ``(order, campaign, None)`` on success or ``(None, None, error)`` where ``error``
+    carries ``message`` and ``status`` for the view to return.
+    """
+    if not is_valid_uuid(campaign_id):
+        return None, None, {"message": "Campaign not found.", "status": status.HTTP_404_NOT_FOUND}
+
+    prices = {
+        str(uid): float(price or 0.0)
+        for uid, price in Food.objects.filter(uid__in=list(requested_items.keys())).values_list("uid", "food_price")
+    }
+    missing = [food_id for food_id in requested_items if food_id not in prices]
+    if missing:
+        return None, None, {"message": f"Invalid food_id: {missing[0]}", "status": status.HTTP_400_BAD_REQUEST}
+
+    total_quantity = int(sum(requested_items.values()))
+    total_price = round(sum(prices[food_id] * quantity for food_id, quantity in requested_items.items()), 2)
+    now = timezone.now()
+
+    try:
+        with transaction.atomic():
+            _lock_campaign(campaign_id, total_quantity, now)
+
+            campaign = Campaign.objects.get(pk=campaign_id)
+            stock = {str(food_id): int(quantity or 0) for food_id, quantity in (campaign.food_items or {}).items()}
+            for food_id, quantity in requested_items.items():
+                if food_id not in stock:
+                    raise _PlacementRejected(
+                        f"Food {food_id} is not part of this campaign.", status.HTTP_400_BAD_REQUEST
+                    )
+                if stock[food_id] < quantity:
+                    raise _PlacementRejected(
+                        f"Not enough stock for food {food_id}. Only {stock[food_id]} left.",
+                        status.HTTP_409_CONFLICT,
+                    )
+                stock[food_id] -= quantity
+
+            campaign.food_items = stock
+            campaign.quantity_available = int(sum(stock.values()))
+            Campaign.objects.filter(pk=campaign.pk).update(
+                food_items=campaign.food_items,
+                quantity_available=campaign.quantity_available,
+            )
+            publish_stock_change(campaign, requested_items)
+            # QuerySet.update() sends no post_save, so the home feed receivers never see it.
+            transaction.on_commit(invalidate_home_feed)
+
+            order = Order.objects.create(
+                user=user.username,
+                user_address=user_address or "User Address",
+                user_phone=user_phone or "User Phone",
+                quantity=total_quantity,
+                food_items=dict(requested_items),
+                custom_order_details=custom_order_details or None,
+                food_price=total_price,
+            )
+
+            Profile.objects.filter(user=user).update(
+                total_orders=Coalesce(F("total_orders"), 0) + 1,
+                last_order=order.order_time,
+            )
+    except _PlacementRejected as rejected:
+        return None, None, rejected.error
+
+    return order, campaign, None
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from user_app.models import Order_line
+
+
+def _line_count(model):
+    """Correlated count of the ``Order_line`` rows that belong to each ``model`` row."""
+    link = model._meta.get_field("lines").field.name
+    counts = (
+        Order_line.objects.filter(**{link: OuterRef("pk")})
+        .order_by()
+        .values(link)
+        .annotate(lines=Count("pk"))
+        .values("lines")
+    )
+    return Subquery(counts, output_field=IntegerField())
+
+
+def summarize_orders(queryset):
+    """Totals for an ``Order`` / ``Order_history`` queryset computed in one aggregate query.
+
+    Rows without a positive ``quantity`` count one item per food, at least one, as the
+    per-row summaries did; the food count comes from the row's order lines.
+    """
+    totals = queryset.order_by().aggregate(
+        total_orders=Count("pk"),
+        total_amount=Sum("food_price"),
+        total_items=Sum(
+            Case(
+                When(quantity__gt=0, then=F("quantity")),
+                default=Greatest(Coalesce(_line_count(queryset.model), Value(0)), Value(1)),
+                output_field=IntegerField(),
+            )
+        ),
+    )
+    return {
+        "total_orders": int(totals["total_orders"] or 0),
+        "total_amount": round(float(totals["total_amount"] or 0.0), 2),
+        "total_items": int(totals["total_items"] or 0),
+    }
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from user_app.models import Chef_daily_sales, Order_line
+
+
+def _line_day(line):
+    if not line.order_time:
+        return timezone.localdate()
+    return timezone.localdate(line.order_time)
+
+
+def _order_key(line):
+    if line.order_id:
+        return ("order", str(line.order_id))
+    return ("history", str(line.order_history_id))
+
+
+def apply_lines_to_daily_sales(lines):
+    """Fold freshly written order lines into the matching ``Chef_daily_sales`` rows."""
+    buckets = defaultdict(lambda: {"orders": set(), "revenue": 0.0, "items": 0, "foods": defaultdict(int)})
+    for line in lines:
+        if not line.chef:
+            continue
+        bucket = buckets[(line.chef, _line_day(line))]
+        quantity = int(line.quantity or 0)
+        bucket["orders"].add(_order_key(line))
+        bucket["revenue"] += float(line.unit_price or 0.0) * quantity
+        bucket["items"] += quantity
+        if line.food_id:
+            bucket["foods"][str(line.food_id)] += quantity
+
+    if not buckets:
+        return 0
+
+    with transaction.atomic():
+        for (chef, day), bucket in buckets.items():
+            rollup, _created = Chef_daily_sales.objects.select_for_update().get_or_create(chef=chef, day=day)
+            food_quantities = dict(rollup.food_quantities or {})
+            for food_id, quantity in bucket["foods"].items():
+                food_quantities[food_id] = int(food_quantities.get(food_id, 0)) + quantity
+
+            rollup.orders = int(rollup.orders or 0) + len(bucket["orders"])
+            rollup.revenue = round(float(rollup.revenue or 0.0) + bucket["revenue"], 4)
+            rollup.items = int(rollup.items or 0) + bucket["items"]
+            rollup.food_quantities = food_quantities
+            rollup.save(update_fields=["orders", "revenue", "items", "food_quantities", "updated_at"])
+
+    return len(buckets)
+
+
+def rebuild_chef_daily_sales(chef=None):
+    """Recompute rollups from ``Order_line`` with grouped queries; optionally for one chef key."""
+    lines = Order_line.objects.exclude(chef="").filter(order_time__isnull=False)
+    rollups = Chef_daily_sales.objects.all()
+    if chef:
+        lines = lines.filter(chef=chef)
+        rollups = rollups.filter(chef=chef)
+
+    lines = lines.annotate(day=TruncDate("order_time"))
+
+    food_rows = (
+        lines.filter(food__isnull=False)
+        .values("chef", "day", "food_id")
+        .annotate(total=Sum("quantity"))
+        .order_by()
+    )
+    food_quantities = defaultdict(dict)
+    for row in food_rows:
+        food_quantities[(row["chef"], row["day"])][str(row["food_id"])] = int(row["total"] or 0)
+
+    totals = (
+        lines.values("chef", "day")
+        .annotate(
+            pending_orders=Count("order", distinct=True),
+            history_orders=Count("order_history", distinct=True),
+            revenue=Sum(F("unit_price") * F("quantity")),
+            items=Sum("quantity"),
+        )
+        .order_by()
+    )
+    rows = [
+        Chef_daily_sales(
+            chef=row["chef"],
+            day=row["day"],
+            orders=int(row["pending_orders"] or 0) + int(row["history_orders"] or 0),
+            revenue=round(float(row["revenue"] or 0.0), 4),
+            items=int(row["items"] or 0),
+            food_quantities=food_quantities.get((row["chef"], row["day"]), {}),
+        )
+        for row in totals
+    ]
+
+    with transaction.atomic():
+        rollups.delete()
+        Chef_daily_sales.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from user_app.models import Order, Order_history, User_daily_spend, User_spend_total
+from user_app.services.food_items import is_valid_uuid, parse_food_items
+
+
+REBUILD_USER_BATCH = 200
+
+
+def _to_int(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _order_day(order_time):
+    return timezone.localdate(order_time) if order_time else timezone.localdate()
+
+
+def _order_facts(food_items, quantity, food_price):
+    """``(spend, items, {food_id: qty})`` for one order, counted the way the dashboard always has:
+    a missing quantity counts one item per food."""
+    food_quantities = parse_food_items(food_items, total_quantity=quantity)
+    items = _to_int(quantity)
+    if items <= 0:
+        items = max(len(food_quantities), 1)
+    return float(food_price or 0.0), items, food_quantities
+
+
+def _add_foods(target, food_quantities, sign):
+    for food_id, quantity in food_quantities.items():
+        remaining = int(target.get(food_id, 0)) + sign * quantity
+        if remaining > 0:
+            target[food_id] = remaining
+        else:
+            target.pop(food_id, None)
+    return target
+
+
+def _latest_order_time(user):
+    latest = [
+        Order.objects.filter(user=user).order_by("-order_time").values_list("order_time", flat=True).first(),
+        Order_history.objects.filter(user=user).order_by("-order_time").values_list("order_time", flat=True).first(),
+    ]
+    latest = [value for value in latest if value]
+    return max(latest) if latest else None
+
+
+def _apply(source, sign):
+    if not source.user:
+        return
+    spend, items, food_quantities = _order_facts(source.food_items, source.quantity, source.food_price)
+
+    with transaction.atomic():
+        daily, _created = User_daily_spend.objects.select_for_update().get_or_create(
+            user=source.user, day=_order_day(source.order_time)
+        )
+        daily.orders = max(int(daily.orders or 0) + sign, 0)
+        daily.spend = round(max(float(daily.spend or 0.0) + sign * spend, 0.0), 4)
+        daily.items = max(int(daily.items or 0) + sign * items, 0)
+        daily.food_quantities = _add_foods(dict(daily.food_quantities or {}), food_quantities, sign)
+        daily.food_orders = _add_foods(dict(daily.food_orders or {}), dict.fromkeys(food_quantities, 1), sign)
+        if daily.orders:
+            daily.save(update_fields=["orders", "spend", "items", "food_quantities", "food_orders", "updated_at"])
+        else:
+            daily.delete()
+
+        total, _created = User_spend_total.objects.select_for_update().get_or_create(user=source.user)
+        total.orders = max(int(total.orders or 0) + sign, 0)
+        total.spend = round(max(float(total.spend or 0.0) + sign * spend, 0.0), 4)
+        if sign > 0:
+            if source.order_time and (not total.last_order_at or source.order_time > total.last_order_at):
+                total.last_order_at = source.order_time
+        elif not total.last_order_at or not source.order_time or source.order_time >= total.last_order_at:
+            total.last_order_at = _latest_order_time(source.user)
+        total.save(update_fields=["orders", "spend", "last_order_at", "updated_at"])
+
+
+def _pending_order_exists(order_id):
+    return bool(order_id) and is_valid_uuid(order_id) and Order.objects.filter(pk=order_id).exists()
+
+
+def record_user_order(order):
+    _apply(order, 1)
+
+
+def record_user_history(history):
+    """Count a history row unless it is the completion of a pending order already counted."""
+    if _pending_order_exists(history.order_id):
+        return
+    _apply(history, 1)
+
+
+def forget_user_order(instance):
+    """Take a deleted order back out of the rollups, unless the same order lives on in the other table."""
+    if isinstance(instance, Order):
+        if Order_history.objects.filter(order_id=str(instance.uid)).exists():
+            return
+    elif _pending_order_exists(instance.order_id):
+        return
+    _apply(instance, -1)
+
+
+def _fold_user(rows):
+    """Rollup rows for one user's ``(order_id, order_time, food_items, quantity, food_price)`` rows."""
+    # A completed order can briefly exist in both tables; keep the latest copy, as the dashboard did.
+    latest = {}
+    for row in rows:
+        existing = latest.get(row[0])
+        if existing is None or (row[1] and (not existing[1] or row[1] > existing[1])):
+            latest[row[0]] = row
+
+    days = defaultdict(lambda: {"orders": 0, "spend": 0.0, "items": 0, "foods": {}, "food_orders": {}})
+    total = {"orders": 0, "spend": 0.0, "last_order_at": None}
+    for _order_id, order_time, food_items, quantity, food_price in latest.values():
+        spend, items, food_quantities = _order_facts(food_items, quantity, food_price)
+        day = days[_order_day(order_time)]
+        day["orders"] += 1
+        day["spend"] += spend
+        day["items"] += items
+        _add_foods(day["foods"], food_quantities, 1)
+        _add_foods(day["food_orders"], dict.fromkeys(food_quantities, 1), 1)
+        total["orders"] += 1
+        total["spend"] += spend
+        if order_time and (not total["last_order_at"] or order_time > total["last_order_at"]):
+            total["last_order_at"] = order_time
+    return days, total
+
+
+def rebuild_user_spend(user=None):
+    """Recompute both rollup tables from ``Order`` and ``Order_history``; optionally for one user.
+
+    Users are processed in batches so memory stays bounded by the batch, not the table.
+    """
+    if user:
+        usernames = [user]
+    else:
+        usernames = sorted(
+            set(Order.objects.values_list("user", flat=True).distinct())
+            | set(Order_history.objects.values_list("user", flat=True).distinct())
+        )
+
+    with transaction.atomic():
+        if user:
+            User_daily_spend.objects.filter(user=user).delete()
+            User_spend_total.objects.filter(user=user).delete()
+        else:
+            User_daily_spend.objects.all().delete()
+            User_spend_total.objects.all().delete()
+
+        written = 0
+        for offset in range(0, len(usernames), REBUILD_USER_BATCH):
+            batch = [name for name in usernames[offset : offset + REBUILD_USER_BATCH] if name]
+            rows_by_user = defaultdict(list)
+            for username, uid, order_time, food_items, quantity, food_price in Order.objects.filter(
+                user__in=batch
+            ).values_list("user", "uid", "order_time", "food_items", "quantity", "food_price"):
+                rows_by_user[username].append((str(uid), order_time, food_items, quantity, food_price))
+            for username, uid, order_id, order_time, food_items, quantity, food_price in Order_history.objects.filter(
+                user__in=batch
+            ).values_list("user", "uid", "order_id", "order_time", "food_items", "quantity", "food_price"):
+                rows_by_user[username].append((str(order_id or uid), order_time, food_items, quantity, food_price))
+
+            daily_rows = []
+            total_rows = []
+            for username, rows in rows_by_user.items():
+                days, total = _fold_user(rows)
+                daily_rows.extend(
+                    User_daily_spend(
+                        user=username,
+                        day=day,
+                        orders=values["orders"],
+                        spend=round(values["spend"], 4),
+                        items=values["items"],
+                        food_quantities=values["foods"],
+                        food_orders=values["food_orders"],
+                    )
+                    for day, values in days.items()
+                )
+                total_rows.append(
+                    User_spend_total(
+                        user=username,
+                        orders=total["orders"],
+                        spend=round(total["spend"], 4),
+                        last_order_at=total["last_order_at"],
+                    )
+                )
+            User_daily_spend.objects.bulk_create(daily_rows, batch_size=1000)
+            User_spend_total.objects.bulk_create(total_rows, batch_size=1000)
+            written += len(daily_rows)
+    return written
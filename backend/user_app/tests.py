@@ -1,3 +1,761 @@
-from django.test import TestCase
+import asyncio
+import importlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from asgiref.sync import sync_to_async
+from rest_framework.test import APIClient
+
+from admin_app.models import Pending_transaction, User_feedback
+from core.events import get_broker
+from core.testing import QueryPlanAssertions
+from core.tokens import tokens_for_user
+from user_app.models import (
+    Campaign,
+    Campaign_history,
+    Chef,
+    Chef_daily_sales,
+    Food,
+    Order,
+    Order_history,
+    Order_line,
+    User_daily_spend,
+    User_spend_total,
+)
+from user_app.services.food_items import parse_food_ids, parse_food_items
+from user_app.services.order_events import CAMPAIGN_STOCK_CHANNEL
+from user_app.services.order_placement import place_order
+
+
+class ChefOrderQueueTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="Chef_Amy", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="Chef_Amy")
+
+        self.rice = Food.objects.create(food_name="Rice", chef="Chef_Amy", food_price=5.0)
+        self.tea = Food.objects.create(food_name="Tea", chef="Chef_Amy", food_price=2.0)
+        self.other = Food.objects.create(food_name="Burger", chef="someone_else", food_price=9.0)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def test_order_create_writes_lines(self):
+        order = Order.objects.create(
+            user="buyer",
+            quantity=2,
+            food_items={str(self.rice.uid): 2, str(self.other.uid): 2},
+            food_price=28.0,
+        )
+
+        lines = {str(line.food_id): line for line in order.lines.all()}
+        self.assertEqual(set(lines), {str(self.rice.uid), str(self.other.uid)})
+        self.assertEqual(lines[str(self.rice.uid)].chef, "chef_amy")
+        self.assertEqual(lines[str(self.rice.uid)].quantity, 2)
+        self.assertAlmostEqual(lines[str(self.rice.uid)].unit_price, 5.0)
+
+    def test_pending_queue_only_returns_chef_orders(self):
+        mine = Order.objects.create(user="buyer", quantity=2, food_items={str(self.rice.uid): 1, str(self.tea.uid): 1})
+        Order.objects.create(user="buyer", quantity=1, food_items={str(self.other.uid): 1})
+
+        response = self.client.get("/campaign_orders/pending/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["uid"] for row in response.data["orders"]], [str(mine.uid)])
+        self.assertEqual(
+            response.data["orders"][0]["matched_food_item_ids"],
+            [str(self.rice.uid), str(self.tea.uid)],
+        )
+
+    def test_complete_moves_lines_to_history(self):
+        order = Order.objects.create(user="buyer", quantity=1, food_items={str(self.rice.uid): 1})
+
+        response = self.client.patch(f"/campaign_orders/pending/{order.uid}/", {"action": "complete"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        history = Order_history.objects.get(order_id=str(order.uid))
+        self.assertEqual(Order_line.objects.filter(order_history=history).count(), 1)
+        history_response = self.client.get("/campaign_orders/history/")
+        self.assertEqual(history_response.data["summary"]["total_orders"], 1)
+
+    def test_backfill_builds_lines_for_legacy_rows(self):
+        order = Order.objects.create(user="buyer", quantity=4, food_items={str(self.tea.uid): 4})
+        Order_line.objects.all().delete()
+
+        call_command("backfill_order_lines", stdout=StringIO())
+
+        line = Order_line.objects.get(order=order)
+        self.assertEqual(line.quantity, 4)
+        self.assertEqual(line.chef, "chef_amy")
+
+
+async def _next_sse_event(stream):
+    while True:
+        chunk = await asyncio.wait_for(anext(stream), timeout=2)
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        if chunk.startswith("event: "):
+            event, data = chunk.strip().split("\n", 1)
+            return event[len("event: "):], json.loads(data[len("data: "):])
+
+
+class ChefOrderStreamTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="Chef_Sia", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        self.rice = Food.objects.create(food_name="Rice", chef="Chef_Sia", food_price=5.0)
+        self.other = Food.objects.create(food_name="Burger", chef="someone_else", food_price=9.0)
+        self.token = str(tokens_for_user(self.chef_user).access_token)
+
+    def _place(self, food):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Order.objects.create(user="buyer", quantity=1, food_items={str(food.uid): 1}, food_price=5.0)
+
+    def _complete(self, order):
+        with self.captureOnCommitCallbacks(execute=True):
+            client = APIClient()
+            client.force_authenticate(self.chef_user)
+            client.patch(f"/campaign_orders/pending/{order.uid}/", {"action": "complete"}, format="json")
+
+    async def test_stream_pushes_own_orders_as_they_change(self):
+        response = await self.async_client.get(f"/campaign_orders/stream/?token={self.token}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        try:
+            self.assertEqual(await _next_sse_event(stream), ("ready", {"chef": "Chef_Sia"}))
+
+            await sync_to_async(self._place)(self.other)
+            order = await sync_to_async(self._place)(self.rice)
+            event, data = await _next_sse_event(stream)
+            self.assertEqual(event, "order.placed")
+            self.assertEqual(data["order_id"], str(order.uid))
+            self.assertEqual(data["matched_food_item_ids"], [str(self.rice.uid)])
+
+            await sync_to_async(self._complete)(order)
+            event, data = await _next_sse_event(stream)
+            self.assertEqual((event, data["order_id"]), ("order.completed", str(order.uid)))
+        finally:
+            await stream.aclose()
+
+    async def test_stream_requires_a_valid_token(self):
+        response = await self.async_client.get("/campaign_orders/stream/?token=nope")
+
+        self.assertEqual(response.status_code, 401)
+
+
+class ChefKeyTests(TestCase):
+    def test_chef_key_follows_username_on_save(self):
+        food = Food.objects.create(food_name="Soup", chef=" Chef_Bo ", food_price=3.0)
+        self.assertEqual(food.chef_key, "chef_bo")
+
+        food.chef = "Chef_Dee"
+        food.save(update_fields=["chef"])
+        food.refresh_from_db()
+        self.assertEqual(food.chef_key, "chef_dee")
+
+        chef = Chef.objects.create(chef_username="Chef_Dee")
+        self.assertEqual(chef.chef_key, "chef_dee")
+
+    def test_chef_scoped_lookup_uses_chef_key_index(self):
+        plan = Food.objects.filter(chef_key="chef_dee").explain()
+        self.assertIn("INDEX", plan.upper())
+
+
+class FoodItemsCodecTests(SimpleTestCase):
+    def test_parses_every_stored_shape(self):
+        self.assertEqual(parse_food_items({"a": 2, "b": "3"}), {"a": 2, "b": 3})
+        self.assertEqual(parse_food_items('{"a": 2}'), {"a": 2})
+        self.assertEqual(parse_food_items('["a", "b"]', total_quantity=3), {"a": 2, "b": 1})
+        self.assertEqual(parse_food_items(" a, b ,,a", total_quantity=4), {"a": 3, "b": 1})
+        self.assertEqual(parse_food_items("a,b,c", total_quantity=1), {"a": 1, "b": 1, "c": 1})
+        self.assertEqual(parse_food_items(None), {})
+        self.assertEqual(parse_food_ids("a,b"), ["a", "b"])
+
+    def test_memoized_result_is_not_shared(self):
+        parsed = parse_food_items("a,b")
+        parsed["a"] = 99
+        self.assertEqual(parse_food_items("a,b"), {"a": 1, "b": 1})
+
+
+class LegacyFoodItemsMigrationTests(SimpleTestCase):
+    def setUp(self):
+        self.migration = importlib.import_module("user_app.migrations.0010_order_food_items_json")
+
+    def test_multi_food_legacy_row_keeps_order_quantity(self):
+        for raw in ("a,b,c", '["a", "b", "c"]'):
+            food_quantities = self.migration._to_food_quantities(raw, 3)
+            self.assertEqual(food_quantities, {"a": 1, "b": 1, "c": 1})
+            self.assertEqual(sum(food_quantities.values()), 3)
+
+        self.assertEqual(self.migration._to_food_quantities("a,b", 5), {"a": 3, "b": 2})
+        self.assertEqual(self.migration._to_food_quantities('{"a": 2, "b": 1}', 3), {"a": 2, "b": 1})
+
+    def test_matches_runtime_codec(self):
+        for raw, quantity in (("a,b,c", 7), ("a, b ,,a", 4), ("a", 0)):
+            self.assertEqual(
+                self.migration._to_food_quantities(raw, quantity),
+                parse_food_items(raw, total_quantity=quantity),
+            )
+
+
+class CampaignSerializationQueryTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="chef_bo", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_bo")
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def _create_campaigns(self, count, foods_per_campaign=4):
+        for idx in range(count):
+            foods = [
+                Food.objects.create(food_name=f"Food {idx}-{item}", chef="chef_bo", food_price=3.0)
+                for item in range(foods_per_campaign)
+            ]
+            Campaign.objects.create(
+                chef="chef_bo",
+                title=f"Campaign {idx}",
+                food_items={str(food.uid): 5 for food in foods},
+                start_time=timezone.now() - timedelta(hours=1),
+                quantity_available=5 * foods_per_campaign,
+            )
+
+    def _count_queries(self, path):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+    def test_campaign_endpoints_use_constant_queries(self):
+        for path in ("/available/", "/campaign/current/", "/campaign/history/", "/"):
+            with self.subTest(path=path):
+                Campaign.objects.all().delete()
+                self._create_campaigns(1)
+                baseline, _response = self._count_queries(path)
+
+                self._create_campaigns(6)
+                queries, _response = self._count_queries(path)
+                self.assertEqual(queries, baseline)
+
+    def test_available_returns_food_details(self):
+        self._create_campaigns(2, foods_per_campaign=3)
+
+        _queries, response = self._count_queries("/available/")
+
+        self.assertEqual(len(response.data["campaigns"]), 2)
+        for campaign in response.data["campaigns"]:
+            self.assertEqual(len(campaign["food_items"]), 3)
+            self.assertTrue(all(item["campaign_quantity"] == 5 for item in campaign["food_items"]))
+
+
+class ChefDailySalesTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="chef_cy", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_cy")
+        self.noodles = Food.objects.create(food_name="Noodles", chef="chef_cy", food_price=6.0)
+        self.juice = Food.objects.create(food_name="Juice", chef="chef_cy", food_price=2.0)
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def _rollup_snapshot(self):
+        return list(
+            Chef_daily_sales.objects.order_by("chef", "day").values_list(
+                "chef", "day", "orders", "revenue", "items", "food_quantities"
+            )
+        )
+
+    def test_rollup_is_maintained_on_create_and_complete(self):
+        order = Order.objects.create(user="buyer", quantity=4, food_items={str(self.noodles.uid): 2, str(self.juice.uid): 2}, food_price=16.0)
+        Order.objects.create(user="buyer", quantity=1, food_items={str(self.noodles.uid): 1}, food_price=6.0)
+
+        rollup = Chef_daily_sales.objects.get(chef="chef_cy", day=timezone.localdate())
+        self.assertEqual(rollup.orders, 2)
+        self.assertAlmostEqual(rollup.revenue, 22.0)
+        self.assertEqual(rollup.items, 5)
+        self.assertEqual(rollup.food_quantities, {str(self.noodles.uid): 3, str(self.juice.uid): 2})
+
+        self.client.patch(f"/campaign_orders/pending/{order.uid}/", {"action": "complete"}, format="json")
+        incremental = self._rollup_snapshot()
+        self.assertEqual(incremental[0][2], 2)
+
+        call_command("rebuild_chef_daily_sales", stdout=StringIO())
+        self.assertEqual(self._rollup_snapshot(), incremental)
+
+    def test_dashboard_reads_rollup(self):
+        Order.objects.create(user="buyer", quantity=3, food_items={str(self.juice.uid): 3}, food_price=6.0)
+
+        response = self.client.get("/chef_dashboard/", {"range": "7d"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["summary"]["orders_in_range"], 1)
+        self.assertEqual(response.data["summary"]["revenue_in_range"], 6.0)
+        self.assertEqual(response.data["trends"]["revenue_per_day"][-1], 6.0)
+        self.assertEqual(response.data["top_performers"]["foods"][0]["food_id"], str(self.juice.uid))
+        self.assertEqual(response.data["top_performers"]["foods"][0]["quantity_sold"], 3)
+        self.assertEqual(sum(response.data["yearly_revenue"]["revenue_per_month"]), 6.0)
+
+
+class ChefSalesSourceParityTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="chef_dee", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_dee")
+        Chef.objects.create(chef_username="chef_eve")
+        self.curry = Food.objects.create(food_name="Curry", chef="chef_dee", food_price=7.0)
+        self.naan = Food.objects.create(food_name="Naan", chef="chef_dee", food_price=1.5)
+        self.lassi = Food.objects.create(food_name="Lassi", chef="chef_dee", food_price=3.0)
+        self.cake = Food.objects.create(food_name="Cake", chef="chef_eve", food_price=4.0)
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def _seed_days(self):
+        now = timezone.now()
+        for offset in range(0, 20, 3):
+            with mock.patch("django.utils.timezone.now", return_value=now - timedelta(days=offset)):
+                Order.objects.create(
+                    user="buyer",
+                    quantity=offset + 3,
+                    food_items={str(self.curry.uid): offset + 1, str(self.naan.uid): 2},
+                    food_price=(offset + 1) * 7.0 + 2.0,
+                )
+                # Mixed-chef order billed below catalogue price: lines are scaled to the charge.
+                mixed = Order.objects.create(
+                    user="buyer",
+                    quantity=2,
+                    food_items={str(self.lassi.uid): 1, str(self.cake.uid): 1},
+                    food_price=5.0,
+                )
+                if offset % 2:
+                    self.client.patch(f"/campaign_orders/pending/{mixed.uid}/", {"action": "complete"}, format="json")
+
+    def _dashboard(self, source):
+        with self.settings(CHEF_SALES_SOURCE=source):
+            response = self.client.get("/chef_dashboard/", {"range": "30d"})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_line_aggregation_matches_rollup(self):
+        self._seed_days()
+
+        rollup = self._dashboard("rollup")
+        with CaptureQueriesContext(connection) as ctx:
+            lines = self._dashboard("lines")
+
+        self.assertEqual(sum(1 for orders in rollup["trends"]["orders_per_day"] if orders), 7)
+        self.assertEqual(lines["summary"], rollup["summary"])
+        self.assertEqual(lines["trends"], rollup["trends"])
+        self.assertEqual(lines["yearly_revenue"], rollup["yearly_revenue"])
+        self.assertEqual(lines["top_performers"]["foods"], rollup["top_performers"]["foods"])
+        self.assertFalse(any("chef_daily_sales" in query["sql"] for query in ctx.captured_queries))
+
+class UserSpendRollupTests(TestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user(username="buyer_fay", password="pass12345")
+        self.chef_user = User.objects.create_user(username="chef_gil", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_gil")
+        self.soup = Food.objects.create(food_name="Soup", chef="chef_gil", food_price=4.0)
+        self.bread = Food.objects.create(food_name="Bread", chef="chef_gil", food_price=1.0)
+        self.client = APIClient()
+
+    def _order(self, days_ago=0, **items):
+        with mock.patch("django.utils.timezone.now", return_value=timezone.now() - timedelta(days=days_ago)):
+            food_items = {str(getattr(self, name).uid): quantity for name, quantity in items.items()}
+            return Order.objects.create(
+                user="buyer_fay",
+                quantity=sum(items.values()),
+                food_items=food_items,
+                food_price=4.0 * items.get("soup", 0) + 1.0 * items.get("bread", 0),
+            )
+
+    def _snapshot(self):
+        return (
+            list(
+                User_daily_spend.objects.order_by("user", "day").values_list(
+                    "user", "day", "orders", "spend", "items", "food_quantities", "food_orders"
+                )
+            ),
+            list(User_spend_total.objects.order_by("user").values_list("user", "orders", "spend", "last_order_at")),
+        )
+
+    def test_rollups_follow_place_complete_and_delete(self):
+        kept = self._order(days_ago=3, soup=2, bread=1)
+        completed = self._order(soup=1)
+        cancelled = self._order(bread=2)
+
+        self.client.force_authenticate(self.chef_user)
+        self.client.patch(f"/campaign_orders/pending/{completed.uid}/", {"action": "complete"}, format="json")
+        cancelled.delete()
+
+        total = User_spend_total.objects.get(user="buyer_fay")
+        self.assertEqual((total.orders, total.spend), (2, 13.0))
+        self.assertEqual(total.last_order_at, Order_history.objects.get().order_time)
+        today = User_daily_spend.objects.get(user="buyer_fay", day=timezone.localdate())
+        self.assertEqual((today.orders, today.spend, today.items), (1, 4.0, 1))
+        self.assertEqual(today.food_orders, {str(self.soup.uid): 1})
+
+        incremental = self._snapshot()
+        call_command("rebuild_user_spend", stdout=StringIO())
+        self.assertEqual(self._snapshot(), incremental)
+        self.assertTrue(Order.objects.filter(pk=kept.pk).exists())
+
+    def test_dashboard_cost_does_not_grow_with_history(self):
+        self.client.force_authenticate(self.buyer)
+
+        def dashboard_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get("/user_dashboard/", {"range": "7d"})
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries), response.data
+
+        self._order(days_ago=1, soup=1)
+        few_queries, _data = dashboard_queries()
+        for days_ago in range(2, 40):
+            self._order(days_ago=days_ago, soup=1, bread=1)
+        many_queries, data = dashboard_queries()
+
+        self.assertEqual(many_queries, few_queries)
+        self.assertEqual(data["summary"]["lifetime_orders"], 39)
+        self.assertEqual(data["summary"]["lifetime_spend"], 4.0 + 38 * 5.0)
+        self.assertEqual(data["summary"]["orders_in_range"], 6)
+        self.assertEqual(len(data["recent_orders"]), 8)
+        self.assertEqual(data["top_foods"][0]["name"], "Soup")
+        self.assertEqual(data["top_foods"][0]["times_ordered"], 6)
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user(username="buyer", password="pass12345")
+        self.soup = Food.objects.create(food_name="Soup", chef="chef_fay", food_price=4.0)
+        moment = timezone.now()
+        self.orders = []
+        for idx in range(5):
+            order = Order.objects.create(user="buyer", quantity=1, food_items={str(self.soup.uid): 1}, food_price=4.0)
+            # Two rows share a timestamp so the uid tie-breaker is exercised.
+            Order.objects.filter(pk=order.pk).update(order_time=moment - timedelta(minutes=min(idx, 3)))
+            self.orders.append(order)
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+
+    def test_cursor_walks_every_order_once(self):
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get("/orders/", params)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["orders"]), 2)
+            self.assertEqual(response.data["summary"]["total_orders"], 5)
+            self.assertEqual(response.data["summary"]["total_amount"], 20.0)
+            seen.extend(row["uid"] for row in response.data["orders"])
+            cursor = response.data["pagination"]["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(sorted(seen), sorted(str(order.uid) for order in self.orders))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_legacy_rows_without_quantity_count_each_food(self):
+        tea = Food.objects.create(food_name="Tea", chef="chef_fay", food_price=1.0)
+        legacy = Order.objects.create(
+            user="buyer", quantity=1, food_items={str(self.soup.uid): 1, str(tea.uid): 1}, food_price=5.0
+        )
+        Order.objects.filter(pk=legacy.pk).update(quantity=0)
+
+        response = self.client.get("/orders/", {"limit": 2})
+
+        # Five single-item orders plus one per food of the legacy row.
+        self.assertEqual(response.data["summary"]["total_items"], 7)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/orders/", {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CampaignHistoryTests(TestCase):
+    def setUp(self):
+        chef_user = User.objects.create_user(username="chef_gus", password="pass12345")
+        chef_user.profile.role = "chef"
+        chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_gus")
+        start = timezone.now() - timedelta(days=2)
+
+        self.mirrored = Campaign.objects.create(
+            chef="chef_gus", title="Mirrored", status="completed", start_time=start, total_orders=4
+        )
+        Campaign_history.objects.create(
+            uid=self.mirrored.uid, chef="chef_gus", title="Mirrored", status="completed", start_time=start, total_orders=4
+        )
+        self.legacy = Campaign_history.objects.create(
+            chef="chef_gus", title="Legacy", status="cancelled", start_time=start - timedelta(hours=1), total_orders=1
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(chef_user)
+
+    def test_campaign_in_both_tables_is_listed_and_counted_once(self):
+        response = self.client.get("/campaign/history/", {"range": "30d"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["id"], row["source"]) for row in response.data["campaigns"]],
+            [(str(self.mirrored.uid), "campaign"), (str(self.legacy.uid), "campaign_history")],
+        )
+        self.assertEqual(
+            response.data["summary"],
+            {"total_campaigns": 2, "completed_campaigns": 1, "cancelled_campaigns": 1, "total_orders": 5},
+        )
+
+
+class OrderPlacementTests(TestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user(username="buyer_di", password="pass12345")
+        self.pie = Food.objects.create(food_name="Pie", chef="chef_di", food_price=4.5)
+        self.campaign = Campaign.objects.create(
+            chef="chef_di",
+            title="Pie Day",
+            food_items={str(self.pie.uid): 3},
+            start_time=timezone.now() - timedelta(hours=1),
+            quantity_available=3,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+
+    def _place(self, quantity):
+        return self.client.post(
+            "/orders/",
+            {
+                "campaign_id": str(self.campaign.uid),
+                "food_items": [{"food_id": str(self.pie.uid), "quantity": quantity}],
+                "user_address": "Block 4",
+            },
+            format="json",
+        )
+
+    def test_place_order_decrements_stock(self):
+        response = self._place(2)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["order"]["food_price"], 9.0)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.food_items, {str(self.pie.uid): 1})
+        self.assertEqual(self.campaign.quantity_available, 1)
+        self.assertEqual(self.campaign.total_orders, 1)
+        self.assertEqual(Order.objects.get().food_items, {str(self.pie.uid): 2})
+        self.buyer.profile.refresh_from_db()
+        self.assertEqual(self.buyer.profile.total_orders, 1)
+
+    def test_rejects_order_beyond_stock(self):
+        response = self._place(4)
+
+        self.assertEqual(response.status_code, 409)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.quantity_available, 3)
+        self.assertEqual(self.campaign.total_orders, 0)
+        self.assertFalse(Order.objects.exists())
+
+
+class CampaignStockStreamTests(TestCase):
+    def setUp(self):
+        # Token revocations are cached by user id, which the test database hands out again.
+        cache.clear()
+        self.buyer = User.objects.create_user(username="buyer_lu", password="pass12345")
+        self.pie = Food.objects.create(food_name="Pie", chef="chef_lu", food_price=4.5)
+        self.tart = Food.objects.create(food_name="Tart", chef="chef_lu", food_price=3.0)
+        self.campaign = Campaign.objects.create(
+            chef="chef_lu",
+            title="Bake Sale",
+            food_items={str(self.pie.uid): 3, str(self.tart.uid): 5},
+            start_time=timezone.now() - timedelta(hours=1),
+            quantity_available=8,
+        )
+        self.token = str(tokens_for_user(self.buyer).access_token)
+
+    def _buy_pie(self):
+        client = APIClient()
+        client.force_authenticate(self.buyer)
+        with self.captureOnCommitCallbacks(execute=True):
+            return client.post(
+                "/orders/",
+                {"campaign_id": str(self.campaign.uid), "food_items": [{"food_id": str(self.pie.uid), "quantity": 2}]},
+                format="json",
+            )
+
+    async def test_order_publishes_only_the_changed_food(self):
+        response = await self.async_client.get(
+            "/available/stream/", headers={"authorization": f"Bearer {self.token}"}
+        )
+        stream = aiter(response.streaming_content)
+        try:
+            self.assertEqual((await _next_sse_event(stream))[0], "ready")
+
+            placed = await sync_to_async(self._buy_pie)()
+            self.assertEqual(placed.status_code, 201)
+
+            self.assertEqual(
+                await _next_sse_event(stream),
+                (
+                    "stock",
+                    {
+                        "campaign_id": str(self.campaign.uid),
+                        "quantity_available": 6,
+                        "foods": {str(self.pie.uid): 1},
+                    },
+                ),
+            )
+        finally:
+            await stream.aclose()
+
+
+class CampaignStatusEventTests(TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="chef_mo", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        self.chef = Chef.objects.create(chef_username="chef_mo")
+        self.stew = Food.objects.create(food_name="Stew", chef="chef_mo", food_price=6.0)
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def _capture_events(self, method, path, data):
+        with mock.patch.object(get_broker(), "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = getattr(self.client, method)(path, data, format="json")
+        return response, [call.args for call in publish.call_args_list]
+
+    def test_ending_a_campaign_publishes_its_status(self):
+        campaign = Campaign.objects.create(
+            chef="chef_mo", title="Stew Day", food_items={str(self.stew.uid): 4}, quantity_available=4
+        )
+
+        response, events = self._capture_events("patch", f"/campaign/current/{campaign.uid}/", {"action": "end"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(events), 1)
+        channel, message = events[0]
+        self.assertEqual(channel, CAMPAIGN_STOCK_CHANNEL)
+        self.assertEqual(message["event"], "campaign")
+        self.assertEqual(message["data"]["status"], "completed")
+        campaign.refresh_from_db()
+        self.assertEqual(campaign.status, "completed")
+
+    def test_creating_a_campaign_publishes_once_after_the_chef_update(self):
+        response, events = self._capture_events(
+            "post",
+            "/campaign/create/",
+            {"title": "Stew Night", "food_items": [{"food_id": str(self.stew.uid), "quantity": 5}]},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(events), 1)
+        channel, message = events[0]
+        self.assertEqual(channel, CAMPAIGN_STOCK_CHANNEL)
+        self.assertEqual(message["data"]["campaign_id"], response.data["campaign"]["id"])
+        self.chef.refresh_from_db()
+        self.assertEqual(self.chef.total_campaigns, 1)
+
+
+class OrderPlacementConcurrencyTests(TransactionTestCase):
+    buyers = 200
+    stock = 40
+
+    def test_flash_sale_burst_does_not_oversell(self):
+        User.objects.bulk_create([User(username=f"flash_{idx}") for idx in range(self.buyers)])
+        food = Food.objects.create(food_name="Limited Cake", chef="chef_flash", food_price=5.0)
+        campaign = Campaign.objects.create(
+            chef="chef_flash",
+            title="Flash Sale",
+            food_items={str(food.uid): self.stock},
+            start_time=timezone.now() - timedelta(minutes=5),
+            quantity_available=self.stock,
+        )
+
+        def buy(username):
+            try:
+                user = User.objects.get(username=username)
+                _order, _campaign, error = place_order(
+                    user=user,
+                    campaign_id=str(campaign.uid),
+                    requested_items={str(food.uid): 1},
+                )
+                return error["status"] if error else 201
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(buy, [f"flash_{idx}" for idx in range(self.buyers)]))
+
+        campaign.refresh_from_db()
+        self.assertEqual(results.count(201), self.stock)
+        self.assertEqual(results.count(409), self.buyers - self.stock)
+        self.assertEqual(campaign.quantity_available, 0)
+        self.assertEqual(campaign.food_items, {str(food.uid): 0})
+        self.assertEqual(campaign.total_orders, self.stock)
+        self.assertEqual(Order.objects.count(), self.stock)
+
+
+class QueryPlanTests(QueryPlanAssertions, TestCase):
+    def setUp(self):
+        self.chef_user = User.objects.create_user(username="chef_pia", password="pass12345")
+        self.chef_user.profile.role = "chef"
+        self.chef_user.profile.save(update_fields=["role"])
+        Chef.objects.create(chef_username="chef_pia")
+        pie = Food.objects.create(food_name="Pie", chef="chef_pia", food_price=3.0)
+        Campaign.objects.create(
+            chef="chef_pia",
+            title="Pies",
+            food_items={str(pie.uid): 3},
+            quantity_available=3,
+            start_time=timezone.now() - timedelta(hours=1),
+        )
+        Order.objects.create(user="chef_pia", quantity=1, food_items={str(pie.uid): 1}, food_price=3.0)
+        Pending_transaction.objects.create(chef="chef_pia", type="subscription", status="pending")
+        User_feedback.objects.create(user="chef_pia", category="support", subject="Late", message="Where is it?")
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.chef_user)
+
+    def _capture(self, url, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return ctx.captured_queries
+
+    def test_available_uses_running_window_index(self):
+        self.assertQueriesUseIndex(self._capture("/available/"), Campaign, "campaign_running_window_idx")
+
+    def test_chef_dashboard_campaigns_use_chef_start_index(self):
+        queries = self._capture("/chef_dashboard/", {"range": "7d"})
+
+        self.assertQueriesUseIndex(queries, Campaign, "campaign_chef_start_idx")
+
+    def test_user_dashboard_uses_user_time_index(self):
+        self.assertQueriesUseIndex(self._capture("/user_dashboard/"), Order, "order_user_time_idx")
+
+    def test_subscription_pending_uses_chef_type_index(self):
+        queries = self._capture("/subscription/pending/")
+
+        self.assertQueriesUseIndex(queries, Pending_transaction, "pending_tx_chef_type_idx")
+
+    def test_support_list_uses_user_category_index(self):
+        self.assertQueriesUseIndex(self._capture("/support/"), User_feedback, "feedback_user_category_idx")
@@ -7,6 +7,7 @@ from user_app.views import *
 
 urlpatterns = [
 	path('available/', available.as_view()),
+	path('available/stream/', AvailableStream.as_view()),
 	path('chef_dashboard/', chef_dashboard.as_view()),
 	path('campaign/current/', CampaignCurrent.as_view()),
 	path('campaign/current/<str:campaign_id>/', CampaignCurrentAction.as_view()),
@@ -17,6 +18,7 @@ urlpatterns = [
 	path('food_inventory/item/<str:food_id>/', FoodInventoryItem.as_view()),
 	path('campaign/<str:campaign_id>/', CampaignDetails.as_view()),
 	path('campaign_orders/pending/', CampaignOrdersPending.as_view()),
+	path('campaign_orders/stream/', CampaignOrdersStream.as_view()),
 	path('campaign_orders/pending/<str:order_id>/', CampaignOrdersPendingAction.as_view()),
 	path('campaign_orders/history/', CampaignOrdersHistory.as_view()),
 	path('orders/', UserOrders.as_view()),
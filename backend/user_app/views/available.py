@@ -3,16 +3,22 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from django.db.models import Q
+from django.http import JsonResponse
 from django.utils import timezone
-from admin_app.serializers import FoodSerializer
-from admin_app.models import Profile
-from user_app.models import Campaign, Food
+from django.views import View
+from core.authentication import TokenRoleAuthentication, request_role, user_role
+from core.events import authenticate_stream, get_broker, sse_response
+from user_app.models import Campaign
+from user_app.services.campaign_serialization import serialize_public_campaigns
+from user_app.services.order_events import CAMPAIGN_STOCK_CHANNEL
 
 
 
 # Create your views here.
 
 class available(APIView):
+    # Read-only: the role claim in the access token is enough to authorize.
+    authentication_classes = [TokenRoleAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -20,11 +26,10 @@ class available(APIView):
         if not user.is_authenticated:
             return Response({'message': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
 
-        profile = Profile.objects.filter(user=user).first()
-        if not profile:
+        role = request_role(request)
+        if not role:
             return Response({'message': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        role = profile.role
         if role not in ['user', 'chef', 'admin']:
             return Response({
                 'message': 'You are not authorized to access this page'
@@ -35,31 +40,31 @@ class available(APIView):
             Q(status='running') & Q(start_time__lte=now) & (Q(end_time__isnull=True) | Q(end_time__gte=now))
         ).order_by('-start_time')
 
-        campaigns_data = []
-        for campaign in available_campaigns:
-            food_map = campaign.food_items or {}
-            food_items_list = []
-            for fid, quantity in food_map.items():
-                food = Food.objects.filter(pk=fid).first()
-                if not food:
-                    continue
-                food_data = FoodSerializer(food).data
-                food_data['campaign_quantity'] = quantity
-                food_items_list.append(food_data)
-
-            campaigns_data.append({
-                'id': str(campaign.uid),
-                'title': campaign.title,
-                'description': campaign.campaign_description,
-                'chef': campaign.chef,
-                'start_time': campaign.start_time,
-                'end_time': campaign.end_time,
-                'delivery_time': campaign.delivery_time,
-                'quantity_available': campaign.quantity_available,
-                'food_items': food_items_list,
-            })
+        campaigns_data = serialize_public_campaigns(available_campaigns, include_stock=True)
 
         return Response({
             'campaigns': campaigns_data,
             'status': status.HTTP_200_OK,
         })
+
+
+class AvailableStream(View):
+    """Server-sent stock deltas for running campaigns.
+
+    ``stock`` events carry ``{campaign_id, quantity_available, foods: {food_id: remaining}}``
+    for just the foods an order took; ``campaign`` events flag a campaign opening or
+    closing. Clients load ``available/`` once and refetch it on ``ready`` or ``resync``.
+    """
+
+    async def get(self, request):
+        user = await authenticate_stream(request)
+        if user is None:
+            return JsonResponse({'message': 'Authentication required'}, status=401)
+
+        role = user_role(user)
+        if not role:
+            return JsonResponse({'message': 'Profile not found'}, status=404)
+        if role not in ['user', 'chef', 'admin']:
+            return JsonResponse({'message': 'You are not authorized to access this page'}, status=403)
+
+        return sse_response(get_broker().subscribe(CAMPAIGN_STOCK_CHANNEL))
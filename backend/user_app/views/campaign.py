@@ -1,15 +1,21 @@
 from datetime import datetime, timedelta
 
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile
-from admin_app.serializers import CampaignSerializer, FoodSerializer
+from admin_app.serializers import FoodSerializer
+from core.authentication import request_profile
+from core.date_ranges import in_date_range
+from core.pagination import KeysetPaginationMixin
 from user_app.models import Campaign, Campaign_history, Chef, Food
+from user_app.services.campaign_serialization import serialize_campaigns_with_foods
+from user_app.services.order_events import publish_campaign_status
+from user_app.services.order_lines import normalize_chef
 
 
 RANGE_LABELS = {
@@ -87,7 +93,7 @@ def _resolve_range(range_key=None, start_date_raw=None, end_date_raw=None):
 
 
 def _require_profile(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -109,7 +115,7 @@ def _resolve_chef_username(request, profile):
     if requested_chef:
         return requested_chef
 
-    own = Chef.objects.filter(chef_username__iexact=request.user.username).first()
+    own = Chef.objects.filter(chef_key=normalize_chef(request.user.username)).first()
     if own:
         return own.chef_username
 
@@ -120,34 +126,8 @@ def _resolve_chef_username(request, profile):
     return ""
 
 
-def _campaign_food_details(campaign):
-    food_items = []
-    food_quantities = campaign.food_items or {}
-    for food_id, quantity in food_quantities.items():
-        food = Food.objects.filter(pk=food_id).first()
-        if not food:
-            food_items.append(
-                {
-                    "uid": str(food_id),
-                    "food_name": "Unknown Food",
-                    "food_price": 0,
-                    "campaign_quantity": int(quantity or 0),
-                }
-            )
-            continue
-
-        data = FoodSerializer(food).data
-        data["campaign_quantity"] = int(quantity or 0)
-        food_items.append(data)
-
-    return food_items
-
-
 def _serialize_campaign_with_foods(campaign):
-    campaign_data = CampaignSerializer(campaign).data
-    campaign_data["food_items"] = _campaign_food_details(campaign)
-    campaign_data["id"] = str(campaign.uid)
-    return campaign_data
+    return serialize_campaigns_with_foods([campaign])[0]
 
 
 class CampaignDetails(APIView):
@@ -192,13 +172,13 @@ class CampaignCurrent(APIView):
 
         now = timezone.now()
         current_qs = (
-            Campaign.objects.filter(chef__iexact=chef_username)
+            Campaign.objects.filter(chef_key=normalize_chef(chef_username))
             .filter(Q(end_time__isnull=True) | Q(end_time__gte=now))
             .exclude(status__in=["completed", "cancelled", "expired", "ended"])
             .order_by("-start_time")
         )
 
-        campaigns = [_serialize_campaign_with_foods(campaign) for campaign in current_qs]
+        campaigns = serialize_campaigns_with_foods(current_qs)
 
         today = timezone.localdate()
         summary = {
@@ -270,7 +250,10 @@ class CampaignCurrentAction(APIView):
             if campaign.end_time and campaign.end_time < now:
                 campaign.end_time = None
 
-        campaign.save(update_fields=["status", "end_time", "updated_at"])
+        with transaction.atomic():
+            campaign.save(update_fields=["status", "end_time"])
+            # Queued for on_commit, so buyers only hear about a status change that was stored.
+            publish_campaign_status(campaign)
 
         return Response(
             {
@@ -300,7 +283,7 @@ class CampaignCreate(APIView):
                 }
             )
 
-        foods = Food.objects.filter(chef__iexact=chef_username).order_by("food_name")
+        foods = Food.objects.filter(chef_key=normalize_chef(chef_username)).order_by("food_name")
         foods_data = FoodSerializer(foods, many=True).data
 
         return Response(
@@ -347,7 +330,7 @@ class CampaignCreate(APIView):
 
         allowed_foods = {
             str(food.uid): food
-            for food in Food.objects.filter(chef__iexact=chef_username)
+            for food in Food.objects.filter(chef_key=normalize_chef(chef_username))
         }
         if not allowed_foods:
             return Response(
@@ -387,24 +370,27 @@ class CampaignCreate(APIView):
         status_value = str(request.data.get("status", "running")).strip().lower() or "running"
         food_status = str(request.data.get("food_status", "cooking")).strip().lower() or "cooking"
 
-        campaign = Campaign.objects.create(
-            chef=chef_username,
-            status=status_value,
-            food_status=food_status,
-            title=title,
-            campaign_description=description,
-            food_items=food_quantity_map,
-            start_time=start_time,
-            end_time=end_time,
-            delivery_time=delivery_time,
-            quantity_available=quantity_available,
-            total_orders=0,
-        )
+        with transaction.atomic():
+            campaign = Campaign.objects.create(
+                chef=chef_username,
+                status=status_value,
+                food_status=food_status,
+                title=title,
+                campaign_description=description,
+                food_items=food_quantity_map,
+                start_time=start_time,
+                end_time=end_time,
+                delivery_time=delivery_time,
+                quantity_available=quantity_available,
+                total_orders=0,
+            )
 
-        chef_obj = Chef.objects.filter(chef_username__iexact=chef_username).first()
-        if chef_obj:
-            chef_obj.total_campaigns = int(chef_obj.total_campaigns or 0) + 1
-            chef_obj.save(update_fields=["total_campaigns", "updated_at"])
+            chef_obj = Chef.objects.filter(chef_key=normalize_chef(chef_username)).first()
+            if chef_obj:
+                chef_obj.total_campaigns = int(chef_obj.total_campaigns or 0) + 1
+                chef_obj.save(update_fields=["total_campaigns"])
+
+            publish_campaign_status(campaign)
 
         return Response(
             {
@@ -416,8 +402,9 @@ class CampaignCreate(APIView):
         )
 
 
-class CampaignHistory(APIView):
+class CampaignHistory(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_field = "start_time"
 
     def get(self, request):
         profile, profile_error = _require_profile(request)
@@ -458,38 +445,58 @@ class CampaignHistory(APIView):
         now = timezone.now()
 
         current_history_qs = (
-            Campaign.objects.filter(chef__iexact=chef_username)
+            Campaign.objects.filter(chef_key=normalize_chef(chef_username))
             .filter(
                 Q(status__in=["completed", "cancelled", "expired", "ended"])
                 | Q(end_time__lt=now)
             )
-            .filter(start_time__date__gte=start_date, start_time__date__lte=end_date)
+            .filter(in_date_range("start_time", start_date, end_date))
             .order_by("-start_time")
         )
 
-        legacy_history_qs = Campaign_history.objects.filter(
-            chef__iexact=chef_username,
-            start_time__date__gte=start_date,
-            start_time__date__lte=end_date,
-        ).order_by("-start_time")
+        # Campaigns mirrored into Campaign_history are listed once, from the live table.
+        legacy_history_qs = (
+            Campaign_history.objects.filter(
+                in_date_range("start_time", start_date, end_date),
+                chef_key=normalize_chef(chef_username),
+            )
+            .exclude(uid__in=current_history_qs.order_by().values("uid"))
+            .order_by("-start_time")
+        )
 
-        campaigns = []
-        seen_ids = set()
+        page_size = self.get_page_size(request)
+        current_page_qs, error = self.apply_cursor(request, current_history_qs)
+        if error:
+            return error
+        legacy_page_qs, error = self.apply_cursor(request, legacy_history_qs)
+        if error:
+            return error
+
+        # Both tables share the (start_time, uid) ordering, so one cursor continues the merged stream.
+        merged = sorted(
+            list(current_page_qs[: page_size + 1]) + list(legacy_page_qs[: page_size + 1]),
+            key=self.keyset_sort_key,
+            reverse=True,
+        )
+        page_rows, pagination = self.build_page(merged, page_size)
 
-        for campaign in current_history_qs:
-            serialized = _serialize_campaign_with_foods(campaign)
-            serialized["source"] = "campaign"
-            campaigns.append(serialized)
-            seen_ids.add(str(campaign.uid))
+        serialized_current = {
+            item["id"]: item
+            for item in serialize_campaigns_with_foods(row for row in page_rows if isinstance(row, Campaign))
+        }
 
-        for campaign in legacy_history_qs:
-            legacy_id = str(campaign.uid)
-            if legacy_id in seen_ids:
+        campaigns = []
+        for campaign in page_rows:
+            campaign_id = str(campaign.uid)
+            if isinstance(campaign, Campaign):
+                serialized = serialized_current[campaign_id]
+                serialized["source"] = "campaign"
+                campaigns.append(serialized)
                 continue
             campaigns.append(
                 {
-                    "id": legacy_id,
-                    "uid": legacy_id,
+                    "id": campaign_id,
+                    "uid": campaign_id,
                     "chef": campaign.chef,
                     "title": campaign.title,
                     "campaign_description": campaign.campaign_description,
@@ -504,19 +511,21 @@ class CampaignHistory(APIView):
                 }
             )
 
-        epoch_floor = timezone.make_aware(datetime(1970, 1, 1), timezone.get_current_timezone())
-        campaigns = sorted(
-            campaigns,
-            key=lambda item: _safe_datetime_parse(item.get("start_time")) or epoch_floor,
-            reverse=True,
-        )
-
         summary = {
-            "total_campaigns": len(campaigns),
-            "completed_campaigns": sum(1 for c in campaigns if str(c.get("status", "")).lower() in ["completed", "ended", "expired"]),
-            "cancelled_campaigns": sum(1 for c in campaigns if str(c.get("status", "")).lower() == "cancelled"),
-            "total_orders": int(sum(int(c.get("total_orders") or 0) for c in campaigns)),
+            "total_campaigns": 0,
+            "completed_campaigns": 0,
+            "cancelled_campaigns": 0,
+            "total_orders": 0,
         }
+        for queryset in (current_history_qs, legacy_history_qs):
+            totals = queryset.order_by().aggregate(
+                total_campaigns=Count("pk"),
+                completed_campaigns=Count("pk", filter=Q(status__in=["completed", "ended", "expired"])),
+                cancelled_campaigns=Count("pk", filter=Q(status="cancelled")),
+                total_orders=Sum("total_orders"),
+            )
+            for key in summary:
+                summary[key] += int(totals[key] or 0)
 
         return Response(
             {
@@ -529,6 +538,7 @@ class CampaignHistory(APIView):
                 },
                 "summary": summary,
                 "campaigns": campaigns,
+                "pagination": pagination,
                 "status": status.HTTP_200_OK,
             }
         )
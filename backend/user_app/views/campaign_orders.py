@@ -1,21 +1,28 @@
-import json
-
+from django.db.models import Prefetch
+from django.http import JsonResponse
 from django.utils import timezone
+from django.views import View
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile
 from admin_app.serializers import FoodSerializer, OrderSerializer, Order_historySerializer
-from user_app.models import Chef, Food, Order, Order_history
+from user_app.models import Chef, Food, Order, Order_history, Order_line
+from core.authentication import request_profile, user_role
+from core.events import authenticate_stream, get_broker, sse_response
+from core.pagination import KeysetPaginationMixin
+from user_app.services.food_items import parse_food_ids
+from user_app.services.order_events import chef_orders_channel
+from user_app.services.order_lines import normalize_chef
+from user_app.services.order_summary import summarize_orders
 
 
 ALLOWED_ROLES = {"chef", "admin"}
 
 
 def _require_profile(request):
-	profile = Profile.objects.filter(user=request.user).first()
+	profile = request_profile(request)
 	if not profile:
 		return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -40,7 +47,7 @@ def _resolve_chef_username(request, profile):
 	if requested_chef:
 		return requested_chef
 
-	own_chef = Chef.objects.filter(chef_username__iexact=request.user.username).first()
+	own_chef = Chef.objects.filter(chef_key=normalize_chef(request.user.username)).first()
 	if own_chef:
 		return own_chef.chef_username
 
@@ -48,27 +55,6 @@ def _resolve_chef_username(request, profile):
 	return first_chef.chef_username if first_chef else ""
 
 
-def _parse_food_ids(food_items_raw):
-	if not food_items_raw:
-		return []
-
-	raw = str(food_items_raw).strip()
-	if not raw:
-		return []
-
-	if raw.startswith("[") or raw.startswith("{"):
-		try:
-			parsed = json.loads(raw)
-			if isinstance(parsed, list):
-				return [str(item).strip() for item in parsed if str(item).strip()]
-			if isinstance(parsed, dict):
-				return [str(item).strip() for item in parsed.keys() if str(item).strip()]
-		except Exception:
-			pass
-
-	return [item.strip() for item in raw.split(",") if item.strip()]
-
-
 def _to_float(value):
 	try:
 		return float(value or 0.0)
@@ -84,7 +70,7 @@ def _to_int(value):
 
 
 def _build_food_maps(chef_username):
-	foods = Food.objects.filter(chef__iexact=chef_username).order_by("food_name")
+	foods = Food.objects.filter(chef_key=normalize_chef(chef_username)).order_by("food_name")
 	food_map = {
 		str(food.uid): food
 		for food in foods
@@ -98,7 +84,7 @@ def _build_food_maps(chef_username):
 
 def _serialize_order_with_matches(order, serialized_food_map, matched_food_ids):
 	order_data = OrderSerializer(order).data
-	order_data["food_item_ids"] = _parse_food_ids(order.food_items)
+	order_data["food_item_ids"] = parse_food_ids(order.food_items)
 	order_data["matched_food_item_ids"] = matched_food_ids
 	order_data["matched_food_items_details"] = [
 		serialized_food_map[food_id] for food_id in matched_food_ids if food_id in serialized_food_map
@@ -108,7 +94,7 @@ def _serialize_order_with_matches(order, serialized_food_map, matched_food_ids):
 
 def _serialize_history_with_matches(order, serialized_food_map, matched_food_ids):
 	order_data = Order_historySerializer(order).data
-	order_data["food_item_ids"] = _parse_food_ids(order.food_items)
+	order_data["food_item_ids"] = parse_food_ids(order.food_items)
 	order_data["matched_food_item_ids"] = matched_food_ids
 	order_data["matched_food_items_details"] = [
 		serialized_food_map[food_id] for food_id in matched_food_ids if food_id in serialized_food_map
@@ -116,11 +102,23 @@ def _serialize_history_with_matches(order, serialized_food_map, matched_food_ids
 	return order_data
 
 
+def _chef_orders(queryset, chef_username):
+	chef_key = normalize_chef(chef_username)
+	return (
+		queryset.filter(lines__chef=chef_key)
+		.distinct()
+		.prefetch_related(
+			Prefetch("lines", queryset=Order_line.objects.filter(chef=chef_key), to_attr="chef_lines")
+		)
+	)
+
+
 def _filter_orders_for_chef(queryset, chef_food_ids):
 	rows = []
 	for order in queryset:
-		order_food_ids = _parse_food_ids(order.food_items)
-		matched = [food_id for food_id in order_food_ids if food_id in chef_food_ids]
+		line_food_ids = {str(line.food_id) for line in order.chef_lines if line.food_id}
+		order_food_ids = parse_food_ids(order.food_items)
+		matched = [food_id for food_id in order_food_ids if food_id in line_food_ids and food_id in chef_food_ids]
 		if matched:
 			rows.append((order, matched))
 	return rows
@@ -165,7 +163,10 @@ class CampaignOrdersPending(APIView):
 				}
 			)
 
-		order_rows = _filter_orders_for_chef(Order.objects.all().order_by("-order_time"), chef_food_ids)
+		order_rows = _filter_orders_for_chef(
+			_chef_orders(Order.objects.order_by("-order_time"), chef_username),
+			chef_food_ids,
+		)
 
 		orders_data = []
 		total_amount = 0.0
@@ -190,6 +191,32 @@ class CampaignOrdersPending(APIView):
 		)
 
 
+class CampaignOrdersStream(View):
+	"""Server-sent events for the chef's pending queue: ``order.placed`` and ``order.completed``.
+
+	Clients load ``campaign_orders/pending/`` once, then apply events; a ``ready`` or
+	``resync`` event means the snapshot should be fetched again. Served by the ASGI app.
+	"""
+
+	async def get(self, request):
+		user = await authenticate_stream(request)
+		if user is None:
+			return JsonResponse({"message": "Authentication credentials were not provided."}, status=401)
+
+		role = user_role(user)
+		if not role:
+			return JsonResponse({"message": "Profile not found"}, status=404)
+		if role not in ALLOWED_ROLES:
+			return JsonResponse({"message": "You are not authorized to access this page"}, status=403)
+
+		chef_username = user.username if role == "chef" else str(request.GET.get("chef") or "").strip()
+		if not chef_username:
+			return JsonResponse({"message": "Chef profile not found"}, status=404)
+
+		subscription = get_broker().subscribe(chef_orders_channel(chef_username))
+		return sse_response(subscription, ready={"chef": chef_username})
+
+
 class CampaignOrdersPendingAction(APIView):
 	permission_classes = [IsAuthenticated]
 
@@ -206,11 +233,7 @@ class CampaignOrdersPendingAction(APIView):
 		if not order:
 			return Response({"message": "Pending order not found."}, status=status.HTTP_404_NOT_FOUND)
 
-		food_map, _serialized_food_map = _build_food_maps(chef_username)
-		chef_food_ids = set(food_map.keys())
-		order_food_ids = _parse_food_ids(order.food_items)
-		matched_food_ids = [food_id for food_id in order_food_ids if food_id in chef_food_ids]
-		if not matched_food_ids:
+		if not order.lines.filter(chef=normalize_chef(chef_username)).exists():
 			return Response(
 				{"message": "You are not authorized to update this order."},
 				status=status.HTTP_403_FORBIDDEN,
@@ -234,7 +257,7 @@ class CampaignOrdersPendingAction(APIView):
 			Order_history.objects.filter(pk=history.pk).update(order_time=order.order_time)
 			history.order_time = order.order_time
 
-		chef_obj = Chef.objects.filter(chef_username__iexact=chef_username).first()
+		chef_obj = Chef.objects.filter(chef_key=normalize_chef(chef_username)).first()
 		if chef_obj:
 			chef_obj.total_orders_received = _to_int(chef_obj.total_orders_received) + max(_to_int(order.quantity), 1)
 			chef_obj.save(update_fields=["total_orders_received"])
@@ -251,7 +274,7 @@ class CampaignOrdersPendingAction(APIView):
 		)
 
 
-class CampaignOrdersHistory(APIView):
+class CampaignOrdersHistory(KeysetPaginationMixin, APIView):
 	permission_classes = [IsAuthenticated]
 
 	def get(self, request):
@@ -290,26 +313,27 @@ class CampaignOrdersHistory(APIView):
 				}
 			)
 
-		history_rows = _filter_orders_for_chef(Order_history.objects.all().order_by("-order_time"), chef_food_ids)
-
-		orders_data = []
-		total_amount = 0.0
-		total_items = 0
-		for order, matched_food_ids in history_rows:
-			orders_data.append(_serialize_history_with_matches(order, serialized_food_map, matched_food_ids))
-			total_amount += _to_float(order.food_price)
-			quantity = _to_int(order.quantity)
-			total_items += quantity if quantity > 0 else max(len(matched_food_ids), 1)
+		history_page, pagination, error = self.paginate_keyset(
+			request,
+			_chef_orders(Order_history.objects.all(), chef_username),
+		)
+		if error:
+			return error
+
+		orders_data = [
+			_serialize_history_with_matches(order, serialized_food_map, matched_food_ids)
+			for order, matched_food_ids in _filter_orders_for_chef(history_page, chef_food_ids)
+		]
+		chef_history = Order_history.objects.filter(
+			pk__in=Order_line.objects.filter(chef=normalize_chef(chef_username)).values("order_history")
+		)
 
 		return Response(
 			{
 				"chef": chef_username,
 				"order_history": orders_data,
-				"summary": {
-					"total_orders": len(orders_data),
-					"total_amount": round(total_amount, 2),
-					"total_items": int(total_items),
-				},
+				"summary": summarize_orders(chef_history),
+				"pagination": pagination,
 				"status": status.HTTP_200_OK,
 			}
 		)
@@ -1,5 +1,4 @@
-from datetime import date, datetime, timedelta
-import json
+from datetime import datetime, timedelta
 
 from django.db.models import Q
 from django.db.models import Count
@@ -10,8 +9,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile
-from user_app.models import Campaign, Chef, Food, Order
+from core.authentication import request_profile
+from core.date_ranges import in_date_range
+from user_app.models import Campaign, Chef, Food
+from user_app.services.chef_sales import chef_revenue_by_month, chef_sales_in_range
+from user_app.services.order_lines import normalize_chef
 
 
 RANGE_LABELS = {
@@ -71,27 +73,6 @@ def _resolve_range(range_key=None, start_date_raw=None, end_date_raw=None):
     )
 
 
-def _parse_food_ids(food_items_raw):
-    if not food_items_raw:
-        return []
-
-    raw = str(food_items_raw).strip()
-    if not raw:
-        return []
-
-    if raw.startswith("[") or raw.startswith("{"):
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, list):
-                return [str(item).strip() for item in parsed if str(item).strip()]
-            if isinstance(parsed, dict):
-                return [str(item).strip() for item in parsed.keys() if str(item).strip()]
-        except Exception:
-            pass
-
-    return [item.strip() for item in raw.split(",") if item.strip()]
-
-
 def _empty_dashboard_payload(range_info, role, warning_message=None):
     start_date = range_info["start_date"]
     end_date = range_info["end_date"]
@@ -162,7 +143,7 @@ class chef_dashboard(APIView):
 
     def get(self, request):
         user = request.user
-        profile = Profile.objects.filter(user=user).first()
+        profile = request_profile(request)
         if not profile:
             return Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -185,9 +166,7 @@ class chef_dashboard(APIView):
         def find_chef(username):
             if not username:
                 return None
-            return Chef.objects.filter(chef_username=username).first() or Chef.objects.filter(
-                chef_username__iexact=username
-            ).first()
+            return Chef.objects.filter(chef_key=normalize_chef(username)).first()
 
         chef = None
         fallback_used = False
@@ -234,13 +213,12 @@ class chef_dashboard(APIView):
 
         now = timezone.now()
         campaigns_in_range_qs = Campaign.objects.filter(
-            chef__iexact=chef_username,
-            start_time__date__gte=start_date,
-            start_time__date__lte=end_date,
+            in_date_range("start_time", start_date, end_date),
+            chef_key=normalize_chef(chef_username),
         )
         campaigns_in_range = campaigns_in_range_qs.count()
         active_campaigns = Campaign.objects.filter(
-            chef__iexact=chef_username,
+            chef_key=normalize_chef(chef_username),
             status="running",
             start_time__lte=now,
         ).filter(Q(end_time__isnull=True) | Q(end_time__gte=now))
@@ -255,47 +233,26 @@ class chef_dashboard(APIView):
         campaigns_by_day = {row["day"]: row["total"] for row in campaigns_daily_qs if row["day"]}
         campaigns_per_day = [int(campaigns_by_day.get(day, 0)) for day in date_axis]
 
-        chef_foods_qs = Food.objects.filter(chef__iexact=chef_username)
+        chef_foods_qs = Food.objects.filter(chef_key=normalize_chef(chef_username))
         chef_food_ids = {str(food.uid) for food in chef_foods_qs}
         chef_food_names = {str(food.uid): food.food_name for food in chef_foods_qs}
 
+        chef_key = normalize_chef(chef_username)
+        sales_by_day, sold_quantities = chef_sales_in_range(chef_key, start_date, end_date)
+
         orders_in_range = 0
         revenue_in_range = 0.0
         revenue_by_day = {day: 0.0 for day in date_axis}
         orders_by_day = {day: 0 for day in date_axis}
         food_quantity_map = {str(food_id): 0 for food_id in chef_food_ids}
+        food_quantity_map.update(sold_quantities)
 
-        orders_rows = Order.objects.filter(
-            order_time__date__gte=start_date,
-            order_time__date__lte=end_date,
-        ).values("order_time", "food_items", "food_price", "quantity")
-
-        for row in orders_rows:
-            all_food_ids = _parse_food_ids(row.get("food_items"))
-            if not all_food_ids:
-                continue
-
-            matched_food_ids = [food_id for food_id in all_food_ids if food_id in chef_food_ids]
-            if not matched_food_ids:
-                continue
-
-            orders_in_range += 1
-            total_items_in_order = max(len(all_food_ids), 1)
-            matched_items = len(matched_food_ids)
-            ratio = matched_items / total_items_in_order
-            proportional_revenue = self._to_float(row.get("food_price")) * ratio
-            revenue_in_range += proportional_revenue
-
-            day = row["order_time"].date() if row.get("order_time") else None
-            if day and day in revenue_by_day:
-                revenue_by_day[day] += proportional_revenue
-                orders_by_day[day] += 1
-
-            quantity = int(row.get("quantity") or 0)
-            quantity = quantity if quantity > 0 else matched_items
-            distributed_quantity = max(1, int(round(quantity / max(matched_items, 1))))
-            for food_id in matched_food_ids:
-                food_quantity_map[food_id] = food_quantity_map.get(food_id, 0) + distributed_quantity
+        for day, sales in sales_by_day.items():
+            orders_in_range += sales["orders"]
+            revenue_in_range += sales["revenue"]
+            if day in revenue_by_day:
+                revenue_by_day[day] += sales["revenue"]
+                orders_by_day[day] += sales["orders"]
 
         revenue_in_range = round(revenue_in_range, 2)
         avg_order_value = round(revenue_in_range / orders_in_range, 2) if orders_in_range else 0.0
@@ -323,27 +280,7 @@ class chef_dashboard(APIView):
         ]
 
         year = end_date.year
-        year_start = date(year, 1, 1)
-        year_end = date(year, 12, 31)
-        monthly_revenue_map = {month: 0.0 for month in range(1, 13)}
-
-        yearly_orders = Order.objects.filter(
-            order_time__date__gte=year_start,
-            order_time__date__lte=year_end,
-        ).values("order_time", "food_items", "food_price")
-
-        for row in yearly_orders:
-            all_food_ids = _parse_food_ids(row.get("food_items"))
-            if not all_food_ids:
-                continue
-            matched = [food_id for food_id in all_food_ids if food_id in chef_food_ids]
-            if not matched:
-                continue
-            ratio = len(matched) / max(len(all_food_ids), 1)
-            revenue_piece = self._to_float(row.get("food_price")) * ratio
-            order_time = row.get("order_time")
-            if order_time:
-                monthly_revenue_map[order_time.month] += revenue_piece
+        monthly_revenue_map = chef_revenue_by_month(chef_key, year)
 
         monthly_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         monthly_revenue = [round(monthly_revenue_map[idx], 2) for idx in range(1, 13)]
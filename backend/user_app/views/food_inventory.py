@@ -7,9 +7,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile
+from core.authentication import request_profile
 from admin_app.serializers import FoodSerializer
 from user_app.models import Chef, Food
+from user_app.services.order_lines import normalize_chef
 
 
 SORT_MAP = {
@@ -23,7 +24,7 @@ SORT_MAP = {
 
 
 def _require_profile(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -45,7 +46,7 @@ def _resolve_chef_username(request, profile):
     if requested_chef:
         return requested_chef
 
-    own_chef = Chef.objects.filter(chef_username__iexact=request.user.username).first()
+    own_chef = Chef.objects.filter(chef_key=normalize_chef(request.user.username)).first()
     if own_chef:
         return own_chef.chef_username
 
@@ -127,7 +128,7 @@ class FoodInventoryListed(APIView):
         sort_key = str(request.query_params.get("sort", "newest")).strip().lower() or "newest"
         order_by = SORT_MAP.get(sort_key, "-uid")
 
-        foods_qs = Food.objects.filter(chef__iexact=chef_username)
+        foods_qs = Food.objects.filter(chef_key=normalize_chef(chef_username))
         if search:
             foods_qs = foods_qs.filter(
                 Q(food_name__icontains=search) | Q(food_description__icontains=search)
@@ -207,7 +208,7 @@ class FoodInventoryItem(APIView):
 
         # Chef can only manage their own foods.
         if profile.role == "chef":
-            queryset = queryset.filter(chef__iexact=request.user.username)
+            queryset = queryset.filter(chef_key=normalize_chef(request.user.username))
 
         return queryset.first()
 
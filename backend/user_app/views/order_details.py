@@ -4,6 +4,7 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from user_app.models import Order, Food
 from admin_app.serializers import OrderSerializer, FoodSerializer
+from user_app.services.food_items import is_valid_uuid, parse_food_ids
 
 class OrderDetails(APIView):
 	permission_classes = [IsAuthenticated]
@@ -16,17 +17,12 @@ class OrderDetails(APIView):
 
 		order_data = OrderSerializer(order).data
 
-		# Parse food_items (assuming comma-separated food IDs)
-		food_items = []
-		if order.food_items:
-			food_ids = [fid.strip() for fid in order.food_items.split(',') if fid.strip()]
-			for fid in food_ids:
-				try:
-					food = Food.objects.get(pk=fid)
-					food_data = FoodSerializer(food).data
-					food_items.append(food_data)
-				except Food.DoesNotExist:
-					continue
+		food_ids = [fid for fid in parse_food_ids(order.food_items) if is_valid_uuid(fid)]
+		food_map = {
+			str(food.uid): FoodSerializer(food).data
+			for food in Food.objects.filter(uid__in=food_ids)
+		} if food_ids else {}
+		food_items = [food_map[fid] for fid in food_ids if fid in food_map]
 
 		order_data['food_items_details'] = food_items
 
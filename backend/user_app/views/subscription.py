@@ -4,16 +4,18 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Pending_transaction, Profile, Subscription_option, Transaction_history
+from admin_app.models import Pending_transaction, Subscription_option, Transaction_history
+from core.authentication import request_profile
 from admin_app.serializers import SubscriptionOptionSerializer
 from user_app.models import Chef
+from user_app.services.order_lines import normalize_chef
 
 
 ALLOWED_ROLES = {"chef", "admin"}
 
 
 def _require_profile(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -38,7 +40,7 @@ def _resolve_chef_username(request, profile):
     if requested_chef:
         return requested_chef
 
-    own_chef = Chef.objects.filter(chef_username__iexact=request.user.username).first()
+    own_chef = Chef.objects.filter(chef_key=normalize_chef(request.user.username)).first()
     if own_chef:
         return own_chef.chef_username
 
@@ -81,18 +83,18 @@ class SubscriptionStatus(APIView):
             return profile_error
 
         chef_username = _resolve_chef_username(request, profile)
-        chef = Chef.objects.filter(chef_username__iexact=chef_username).first()
+        chef = Chef.objects.filter(chef_key=normalize_chef(chef_username)).first()
         if not chef:
             return Response({"message": "Chef profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
         pending_qs = Pending_transaction.objects.filter(
-            chef__iexact=chef_username,
-            type__iexact="subscription",
+            chef_key=normalize_chef(chef_username),
+            type="subscription",
         ).order_by("-transaction_time")
 
         history_qs = Transaction_history.objects.filter(
-            chef__iexact=chef_username,
-            type__iexact="subscription",
+            chef_key=normalize_chef(chef_username),
+            type="subscription",
         ).order_by("-transaction_time")
 
         approved_statuses = {"approved", "completed", "active"}
@@ -150,8 +152,8 @@ class SubscriptionPending(APIView):
 
         chef_username = _resolve_chef_username(request, profile)
         pending_qs = Pending_transaction.objects.filter(
-            chef__iexact=chef_username,
-            type__iexact="subscription",
+            chef_key=normalize_chef(chef_username),
+            type="subscription",
         ).order_by("-transaction_time")
 
         items = [_serialize_subscription_tx(item) for item in pending_qs]
@@ -180,13 +182,13 @@ class SubscriptionHistory(APIView):
 
         chef_username = _resolve_chef_username(request, profile)
         history_qs = Transaction_history.objects.filter(
-            chef__iexact=chef_username,
-            type__iexact="subscription",
+            chef_key=normalize_chef(chef_username),
+            type="subscription",
         ).order_by("-transaction_time")
 
         status_filter = str(request.query_params.get("status", "")).strip().lower()
         if status_filter:
-            history_qs = history_qs.filter(status__iexact=status_filter)
+            history_qs = history_qs.filter(status=status_filter)
 
         search = str(request.query_params.get("search", "")).strip()
         if search:
@@ -212,7 +214,7 @@ class SubscriptionHistory(APIView):
                 "summary": {
                     "total": len(items),
                     "approved": history_qs.filter(status__in=approved_statuses).count(),
-                    "rejected": history_qs.filter(status__iexact="rejected").count(),
+                    "rejected": history_qs.filter(status="rejected").count(),
                     "total_spent": total_spent,
                 },
                 "items": items,
@@ -230,7 +232,7 @@ class SubscriptionRequest(APIView):
             return profile_error
 
         chef_username = _resolve_chef_username(request, profile)
-        chef = Chef.objects.filter(chef_username__iexact=chef_username).first()
+        chef = Chef.objects.filter(chef_key=normalize_chef(chef_username)).first()
         if not chef:
             return Response({"message": "Chef profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -248,8 +250,8 @@ class SubscriptionRequest(APIView):
             return Response({"message": "Subscription option not found."}, status=status.HTTP_404_NOT_FOUND)
 
         existing_pending = Pending_transaction.objects.filter(
-            chef__iexact=chef_username,
-            type__iexact="subscription",
+            chef_key=normalize_chef(chef_username),
+            type="subscription",
             status__in=["pending", "active"],
         )
         if existing_pending.exists():
@@ -4,7 +4,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile, User_feedback
+from admin_app.models import User_feedback
+from core.authentication import request_profile
 from admin_app.serializers import User_feedbackSerializer
 
 
@@ -17,7 +18,7 @@ ALLOWED_PRIORITIES = {
 
 
 def _require_profile(request):
-    profile = Profile.objects.filter(user=request.user).first()
+    profile = request_profile(request)
     if not profile:
         return None, Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
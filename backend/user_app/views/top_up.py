@@ -5,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from user_app.models import Chef
 from admin_app.models import Pending_transaction
 from admin_app.serializers import Pending_transactionSerializer
+from user_app.services.order_lines import normalize_chef
 
 class TopUpHistory(APIView):
 	permission_classes = [IsAuthenticated]
@@ -12,10 +13,10 @@ class TopUpHistory(APIView):
 	def get(self, request):
 		user = request.user
 		try:
-			chef = Chef.objects.get(chef_username=user.username)
+			chef = Chef.objects.get(chef_key=normalize_chef(user.username))
 		except Chef.DoesNotExist:
 			return Response({'message': 'Chef profile not found'}, status=status.HTTP_404_NOT_FOUND)
-		transactions = Pending_transaction.objects.filter(chef=user.username)
+		transactions = Pending_transaction.objects.filter(chef_key=normalize_chef(user.username))
 		transactions_data = Pending_transactionSerializer(transactions, many=True).data
 		return Response({
 			'balance': chef.balance,
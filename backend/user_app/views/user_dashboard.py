@@ -1,14 +1,16 @@
-from datetime import datetime, timedelta
-import json
+from datetime import date, datetime, timedelta
 
+from django.db.models import Q, Sum
+from django.db.models.functions import ExtractMonth
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from admin_app.models import Profile
-from user_app.models import Food, Order, Order_history
+from core.authentication import request_profile
+from user_app.models import Food, Order, Order_history, User_daily_spend, User_spend_total
+from user_app.services.food_items import is_valid_uuid, parse_food_ids
 
 
 RANGE_LABELS = {
@@ -68,27 +70,6 @@ def _resolve_range(range_key=None, start_date_raw=None, end_date_raw=None):
     )
 
 
-def _parse_food_ids(food_items_raw):
-    if not food_items_raw:
-        return []
-
-    raw = str(food_items_raw).strip()
-    if not raw:
-        return []
-
-    if raw.startswith("[") or raw.startswith("{"):
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, list):
-                return [str(item).strip() for item in parsed if str(item).strip()]
-            if isinstance(parsed, dict):
-                return [str(item).strip() for item in parsed.keys() if str(item).strip()]
-        except Exception:
-            pass
-
-    return [item.strip() for item in raw.split(",") if item.strip()]
-
-
 def _to_float(value):
     return float(value or 0.0)
 
@@ -100,71 +81,40 @@ def _to_int(value):
         return 0
 
 
-def _normalize_rows(user):
-    normalized = []
+RECENT_ORDERS_LIMIT = 8
 
-    order_rows = Order.objects.filter(user=user.username).values(
-        "uid",
-        "order_time",
-        "food_items",
-        "food_price",
-        "quantity",
-    )
-    for row in order_rows:
-        order_id = str(row.get("uid") or "").strip()
-        if not order_id:
-            continue
-        normalized.append(
-            {
-                "order_id": order_id,
-                "order_time": row.get("order_time"),
-                "food_items": row.get("food_items"),
-                "food_price": _to_float(row.get("food_price")),
-                "quantity": _to_int(row.get("quantity")),
-            }
-        )
 
-    history_rows = Order_history.objects.filter(user=user.username).values(
-        "uid",
-        "order_id",
-        "order_time",
-        "food_items",
-        "food_price",
-        "quantity",
-    )
-    for row in history_rows:
-        order_id = str(row.get("order_id") or row.get("uid") or "").strip()
-        if not order_id:
-            continue
-        normalized.append(
-            {
-                "order_id": order_id,
-                "order_time": row.get("order_time"),
-                "food_items": row.get("food_items"),
-                "food_price": _to_float(row.get("food_price")),
-                "quantity": _to_int(row.get("quantity")),
-            }
-        )
+def _recent_orders(username, limit=RECENT_ORDERS_LIMIT):
+    """The user's latest ``limit`` orders across pending and completed rows.
 
-    # Deduplicate by order_id while preferring the latest timestamp when duplicated.
+    Each table answers with its own ``LIMIT`` read off the ``(user, -order_time)`` index, so
+    the cost does not grow with the user's order history. SQLite cannot slice the branches of
+    a compound ``UNION``, hence two queries merged here.
+    """
+    columns = ("order_time", "food_items", "food_price", "quantity")
+    rows = [
+        {"order_id": str(row["uid"]), **row}
+        for row in Order.objects.filter(user=username).order_by("-order_time").values("uid", *columns)[:limit]
+    ]
+    rows += [
+        {"order_id": str(row["order_id"] or row["uid"]), **row}
+        for row in Order_history.objects.filter(user=username)
+        .order_by("-order_time")
+        .values("uid", "order_id", *columns)[:limit]
+    ]
+
+    # A just-completed order can exist in both tables; keep the later copy.
     deduped = {}
-    for row in normalized:
-        order_id = row["order_id"]
-        existing = deduped.get(order_id)
-        if not existing:
-            deduped[order_id] = row
-            continue
-
-        existing_time = existing.get("order_time")
-        current_time = row.get("order_time")
-        if current_time and (not existing_time or current_time > existing_time):
-            deduped[order_id] = row
+    for row in rows:
+        existing = deduped.get(row["order_id"])
+        if not existing or (row["order_time"] and (not existing["order_time"] or row["order_time"] > existing["order_time"])):
+            deduped[row["order_id"]] = row
 
     return sorted(
         deduped.values(),
         key=lambda row: row.get("order_time") or timezone.now(),
         reverse=True,
-    )
+    )[:limit]
 
 
 class UserDashboard(APIView):
@@ -172,7 +122,7 @@ class UserDashboard(APIView):
 
     def get(self, request):
         user = request.user
-        profile = Profile.objects.filter(user=user).first()
+        profile = request_profile(request)
         if not profile:
             return Response({"message": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -195,32 +145,15 @@ class UserDashboard(APIView):
         date_axis = [start_date + timedelta(days=idx) for idx in range(range_info["day_span"])]
         date_labels = [day.isoformat() for day in date_axis]
 
-        all_rows = _normalize_rows(user)
-
-        rows_in_range = []
         today = timezone.localdate()
-        orders_today = 0
-        lifetime_spend = 0.0
-        all_food_ids = set()
-
-        for row in all_rows:
-            order_time = row.get("order_time")
-            if not order_time:
-                continue
-
-            order_day = order_time.date()
-            food_ids = _parse_food_ids(row.get("food_items"))
-            all_food_ids.update(food_ids)
-            lifetime_spend += _to_float(row.get("food_price"))
-
-            if order_day == today:
-                orders_today += 1
-
-            if start_date <= order_day <= end_date:
-                rows_in_range.append({**row, "food_ids": food_ids, "order_day": order_day})
-
-        food_name_map = {str(food.uid): food.food_name for food in Food.objects.filter(uid__in=list(all_food_ids))}
+        username = user.username
+        daily_rows = User_daily_spend.objects.filter(
+            Q(day__gte=start_date, day__lte=end_date) | Q(day=today),
+            user=username,
+        ).values("day", "orders", "spend", "items", "food_quantities", "food_orders")
 
+        orders_today = 0
+        orders_in_range = 0
         spend_in_range = 0.0
         items_in_range = 0
         orders_per_day_map = {day: 0 for day in date_axis}
@@ -229,27 +162,25 @@ class UserDashboard(APIView):
         food_quantity_map = {}
         food_order_count_map = {}
 
-        for row in rows_in_range:
-            order_day = row["order_day"]
-            amount = _to_float(row.get("food_price"))
-            food_ids = row.get("food_ids") or []
-            quantity = _to_int(row.get("quantity"))
-            if quantity <= 0:
-                quantity = max(len(food_ids), 1)
-
-            spend_in_range += amount
-            items_in_range += quantity
-            orders_per_day_map[order_day] = orders_per_day_map.get(order_day, 0) + 1
-            spend_per_day_map[order_day] = spend_per_day_map.get(order_day, 0.0) + amount
-            items_per_day_map[order_day] = items_per_day_map.get(order_day, 0) + quantity
-
-            unique_food_ids = list(dict.fromkeys(food_ids))
-            distributed_quantity = max(1, int(round(quantity / max(len(unique_food_ids), 1))))
-            for food_id in unique_food_ids:
-                food_quantity_map[food_id] = food_quantity_map.get(food_id, 0) + distributed_quantity
-                food_order_count_map[food_id] = food_order_count_map.get(food_id, 0) + 1
-
-        orders_in_range = len(rows_in_range)
+        for row in daily_rows:
+            order_day = row["day"]
+            if order_day == today:
+                orders_today += _to_int(row["orders"])
+            if not start_date <= order_day <= end_date:
+                continue
+
+            orders_in_range += _to_int(row["orders"])
+            spend_in_range += _to_float(row["spend"])
+            items_in_range += _to_int(row["items"])
+            orders_per_day_map[order_day] = orders_per_day_map.get(order_day, 0) + _to_int(row["orders"])
+            spend_per_day_map[order_day] = spend_per_day_map.get(order_day, 0.0) + _to_float(row["spend"])
+            items_per_day_map[order_day] = items_per_day_map.get(order_day, 0) + _to_int(row["items"])
+
+            for food_id, food_quantity in (row["food_quantities"] or {}).items():
+                food_quantity_map[food_id] = food_quantity_map.get(food_id, 0) + _to_int(food_quantity)
+            for food_id, times in (row["food_orders"] or {}).items():
+                food_order_count_map[food_id] = food_order_count_map.get(food_id, 0) + _to_int(times)
+
         spend_in_range = round(spend_in_range, 2)
         avg_order_value = round(spend_in_range / orders_in_range, 2) if orders_in_range else 0.0
         active_days = sum(1 for day in date_axis if orders_per_day_map.get(day, 0) > 0)
@@ -260,15 +191,32 @@ class UserDashboard(APIView):
 
         year = end_date.year
         monthly_spend_map = {month: 0.0 for month in range(1, 13)}
-        for row in all_rows:
-            order_time = row.get("order_time")
-            if not order_time or order_time.year != year:
-                continue
-            monthly_spend_map[order_time.month] += _to_float(row.get("food_price"))
+        yearly_rows = (
+            User_daily_spend.objects.filter(user=username, day__gte=date(year, 1, 1), day__lte=date(year, 12, 31))
+            .annotate(month=ExtractMonth("day"))
+            .values("month")
+            .annotate(total=Sum("spend"))
+            .order_by()
+        )
+        for row in yearly_rows:
+            if row["month"]:
+                monthly_spend_map[row["month"]] += _to_float(row["total"])
+
+        totals = User_spend_total.objects.filter(user=username).first()
+        recent_rows = _recent_orders(username)
 
         month_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         monthly_spend = [round(monthly_spend_map[idx], 2) for idx in range(1, 13)]
 
+        ranked_foods = sorted(food_quantity_map.items(), key=lambda item: item[1], reverse=True)[:6]
+        recent_food_ids = {food_id for row in recent_rows for food_id in parse_food_ids(row.get("food_items"))[:3]}
+        food_name_map = {
+            str(food.uid): food.food_name
+            for food in Food.objects.filter(
+                uid__in=[food_id for food_id in {*dict(ranked_foods), *recent_food_ids} if is_valid_uuid(food_id)]
+            )
+        }
+
         top_foods = [
             {
                 "food_id": food_id,
@@ -276,12 +224,12 @@ class UserDashboard(APIView):
                 "quantity_ordered": int(quantity),
                 "times_ordered": int(food_order_count_map.get(food_id, 0)),
             }
-            for food_id, quantity in sorted(food_quantity_map.items(), key=lambda item: item[1], reverse=True)[:6]
+            for food_id, quantity in ranked_foods
         ]
 
         recent_orders = []
-        for row in all_rows[:8]:
-            food_ids = _parse_food_ids(row.get("food_items"))
+        for row in recent_rows:
+            food_ids = parse_food_ids(row.get("food_items"))
             foods = [food_name_map.get(food_id, "Unknown Food") for food_id in food_ids[:3]]
             order_time = row.get("order_time")
             recent_orders.append(
@@ -295,7 +243,7 @@ class UserDashboard(APIView):
                 }
             )
 
-        last_order_at = all_rows[0].get("order_time") if all_rows else None
+        last_order_at = totals.last_order_at if totals else None
 
         return Response(
             {
@@ -319,8 +267,8 @@ class UserDashboard(APIView):
                     "avg_order_value": avg_order_value,
                     "items_in_range": int(items_in_range),
                     "active_days": int(active_days),
-                    "lifetime_orders": len(all_rows),
-                    "lifetime_spend": round(lifetime_spend, 2),
+                    "lifetime_orders": int(totals.orders) if totals else 0,
+                    "lifetime_spend": round(_to_float(totals.spend if totals else 0.0), 2),
                     "profile_total_orders": int(profile.total_orders or 0),
                     "last_order_at": last_order_at.isoformat() if last_order_at else None,
                 },
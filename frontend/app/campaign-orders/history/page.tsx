@@ -5,7 +5,7 @@ import { Calendar, History, Package, RefreshCcw, Search, Wallet } from "lucide-r
 
 import Header from "@/components/layout/header"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
-import { apiFetch } from "@/lib/auth"
+import { apiFetchAllPages, type KeysetPagination } from "@/lib/auth"
 
 type FoodDetail = {
   uid: string
@@ -16,7 +16,7 @@ type HistoryOrderRow = {
   uid: string
   order_id?: string | null
   user: string
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
@@ -33,6 +33,7 @@ type CampaignOrderHistoryResponse = {
   chef: string
   order_history: HistoryOrderRow[]
   summary?: OrdersSummary
+  pagination?: KeysetPagination | null
 }
 
 type HistoryRangeKey = "all" | "30d" | "90d" | "365d"
@@ -71,6 +72,7 @@ function resolveFoodNames(order: HistoryOrderRow) {
     return order.matched_food_items_details.map((item) => item.food_name).filter(Boolean)
   }
   if (!order.food_items) return []
+  if (typeof order.food_items === "object") return Object.keys(order.food_items)
   return String(order.food_items)
     .split(",")
     .map((item) => item.trim())
@@ -137,7 +139,7 @@ export default function CampaignOrderHistoryPage() {
     setLoading(true)
     setError(null)
     try {
-      const response = await apiFetch<CampaignOrderHistoryResponse>("/campaign_orders/history/")
+      const response = await apiFetchAllPages<CampaignOrderHistoryResponse>("/campaign_orders/history/", "order_history")
       const historyList = response.order_history ?? []
       const totalAmount = historyList.reduce((sum, order) => sum + (order.food_price || 0), 0)
       const totalItems = historyList.reduce((sum, order) => {
@@ -17,7 +17,7 @@ type CampaignOrderRow = {
   uid: string
   order_id?: string | null
   user: string
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
@@ -17,7 +17,7 @@ type PendingOrderRow = {
   user: string
   user_address?: string | null
   user_phone?: string | null
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
@@ -74,6 +74,7 @@ function resolveFoodNames(order: PendingOrderRow) {
     return order.matched_food_items_details.map((item) => item.food_name).filter(Boolean)
   }
   if (!order.food_items) return []
+  if (typeof order.food_items === "object") return Object.keys(order.food_items)
   return String(order.food_items)
     .split(",")
     .map((item) => item.trim())
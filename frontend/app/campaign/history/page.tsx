@@ -14,7 +14,7 @@ import {
 
 import Header from "@/components/layout/header"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
-import { apiFetch } from "@/lib/auth"
+import { apiFetchAllPages, type KeysetPagination } from "@/lib/auth"
 
 type RangeKey = "today" | "7d" | "30d" | "month" | "custom"
 
@@ -57,6 +57,7 @@ type CampaignHistoryResponse = {
   range: DashboardRange
   summary: HistorySummary
   campaigns: HistoryCampaign[]
+  pagination?: KeysetPagination | null
 }
 
 type RangeFilter = {
@@ -156,7 +157,7 @@ export default function CampaignHistoryPage() {
     setError(null)
     try {
       const params = buildRangeQuery(appliedFilter)
-      const response = await apiFetch<CampaignHistoryResponse>(`/campaign/history/?${params.toString()}`)
+      const response = await apiFetchAllPages<CampaignHistoryResponse>(`/campaign/history/?${params.toString()}`, "campaigns")
       setData(response)
       setLastUpdated(new Date())
     } catch (loadError) {
@@ -5,7 +5,7 @@ import { Calendar, History, Package, RefreshCcw, Search, Wallet } from "lucide-r
 
 import Header from "@/components/layout/header"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
-import { apiFetch } from "@/lib/auth"
+import { apiFetchAllPages, type KeysetPagination } from "@/lib/auth"
 
 type FoodDetail = {
   uid: string
@@ -15,7 +15,7 @@ type FoodDetail = {
 type HistoryOrderRow = {
   uid: string
   order_id?: string | null
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
@@ -31,6 +31,7 @@ type OrdersSummary = {
 type OrderHistoryResponse = {
   order_history: HistoryOrderRow[]
   summary?: OrdersSummary
+  pagination?: KeysetPagination | null
 }
 
 type HistoryRangeKey = "all" | "30d" | "90d" | "365d"
@@ -69,6 +70,7 @@ function resolveFoodNames(order: HistoryOrderRow) {
     return order.food_items_details.map((item) => item.food_name).filter(Boolean)
   }
   if (!order.food_items) return []
+  if (typeof order.food_items === "object") return Object.keys(order.food_items)
   return String(order.food_items)
     .split(",")
     .map((item) => item.trim())
@@ -134,7 +136,7 @@ export default function OrderHistoryPage() {
     setLoading(true)
     setError(null)
     try {
-      const response = await apiFetch<OrderHistoryResponse>("/your_orders/")
+      const response = await apiFetchAllPages<OrderHistoryResponse>("/your_orders/", "order_history")
       const historyList = response.order_history ?? []
       const totalAmount = historyList.reduce((sum, order) => sum + (order.food_price || 0), 0)
       const totalItems = historyList.reduce((sum, order) => {
@@ -16,7 +16,7 @@ type FoodDetail = {
 type OrderRow = {
   uid: string
   order_id?: string | null
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
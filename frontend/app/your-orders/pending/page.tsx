@@ -5,7 +5,7 @@ import { Clock3, Package, RefreshCcw, Search, ShoppingBag, Wallet } from "lucide
 
 import Header from "@/components/layout/header"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
-import { apiFetch } from "@/lib/auth"
+import { apiFetchAllPages, type KeysetPagination } from "@/lib/auth"
 
 type FoodDetail = {
   uid: string
@@ -15,7 +15,7 @@ type FoodDetail = {
 type OrderRow = {
   uid: string
   order_id?: string | null
-  food_items?: string | null
+  food_items?: Record<string, number> | string | null
   food_price: number
   quantity: number
   order_time: string | null
@@ -31,6 +31,7 @@ type OrdersSummary = {
 type PendingOrdersResponse = {
   orders: OrderRow[]
   summary?: OrdersSummary
+  pagination?: KeysetPagination | null
 }
 
 const numberFormatter = new Intl.NumberFormat("en-MY")
@@ -67,6 +68,7 @@ function resolveFoodNames(order: OrderRow) {
     return order.food_items_details.map((item) => item.food_name).filter(Boolean)
   }
   if (!order.food_items) return []
+  if (typeof order.food_items === "object") return Object.keys(order.food_items)
   return String(order.food_items)
     .split(",")
     .map((item) => item.trim())
@@ -118,7 +120,7 @@ export default function PendingOrdersPage() {
     setLoading(true)
     setError(null)
     try {
-      const response = await apiFetch<PendingOrdersResponse>("/orders/")
+      const response = await apiFetchAllPages<PendingOrdersResponse>("/orders/", "orders")
       const orderList = response.orders ?? []
       const totalAmount = orderList.reduce((sum, order) => sum + (order.food_price || 0), 0)
       const totalItems = orderList.reduce((sum, order) => {
@@ -18,6 +18,12 @@ export type AuthSession = {
   user: AuthUser
 }
 
+export type KeysetPagination = {
+  limit: number
+  has_more: boolean
+  next_cursor: string | null
+}
+
 type LoginResponse = {
   access: string
   refresh: string
@@ -360,3 +366,26 @@ export async function apiFetch<T>(endpoint: string, init?: RequestInit): Promise
 
   return (data ?? {}) as T
 }
+
+// Keyset-paged list endpoints return one page plus `pagination.next_cursor`. Follows the
+// cursor and concatenates `listKey` across pages; summaries come from the first page,
+// which the backend already computes over the whole filtered set.
+export async function apiFetchAllPages<T extends { pagination?: KeysetPagination | null }>(
+  endpoint: string,
+  listKey: keyof T,
+  pageSize = 200
+): Promise<T> {
+  const separator = endpoint.includes("?") ? "&" : "?"
+  const base = `${endpoint}${separator}limit=${pageSize}`
+  const first = await apiFetch<T>(base)
+  const rows = [...((first[listKey] as unknown[] | undefined) ?? [])]
+
+  let cursor = first.pagination?.next_cursor ?? null
+  while (cursor) {
+    const page = await apiFetch<T>(`${base}&cursor=${encodeURIComponent(cursor)}`)
+    rows.push(...((page[listKey] as unknown[] | undefined) ?? []))
+    cursor = page.pagination?.next_cursor ?? null
+  }
+
+  return { ...first, [listKey]: rows, pagination: { limit: pageSize, has_more: false, next_cursor: null } } as T
+}